@@ -6,12 +6,14 @@ from .instagram_api import InstagramAPI
 from .youtube_api import YouTubeAPI
 from .ai_analyzer import AIAnalyzer
 from .message_generator import MessageGenerator
+from .analysis_pool import AnalysisPool
 
 __all__ = [
     "InstagramAPI",
     "YouTubeAPI", 
     "AIAnalyzer",
-    "MessageGenerator"
+    "MessageGenerator",
+    "AnalysisPool"
 ]
 
 __version__ = "1.0.0"
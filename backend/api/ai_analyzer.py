@@ -10,12 +10,17 @@ from datetime import datetime
 import json
 import re
 
+# Bump when feature extraction changes so materialized features are recomputed
+FEATURE_VERSION = 1
+
 class AIAnalyzer:
     """AI-powered influencer and content analyzer"""
     
-    def __init__(self):
+    def __init__(self, inference=None):
         self.model_version = "ICY-AI-v2.1"
         self.confidence_threshold = 0.75
+        # Optional InferenceGateway for the model-backed steps; None keeps the rule-based ones
+        self.inference = inference
         
         # Brand alignment keywords by category
         self.brand_keywords = {
@@ -37,7 +42,8 @@ class AIAnalyzer:
     
     async def analyze_influencer(self, influencer_data: Dict, brand_data: Dict) -> Dict[str, Any]:
         """Comprehensive influencer analysis with AI scoring"""
-        await asyncio.sleep(1.0)  # Simulate AI processing time
+        if self.inference is None:
+            await asyncio.sleep(1.0)  # Simulate AI processing time
         
         # Calculate various scores
         match_score = await self._calculate_match_score(influencer_data, brand_data)
@@ -63,7 +69,128 @@ class AIAnalyzer:
         }
         
         return analysis
+
+    def analyze_influencer_sync(self, influencer_data: Dict, brand_data: Dict) -> Dict[str, Any]:
+        """Influencer analysis without simulated latency, for process-pool workers"""
+        return {
+            **influencer_data,
+            "match_score": self._match_score(influencer_data, brand_data),
+            "authenticity_score": self._authenticity_score(influencer_data),
+            "audience_alignment": self._audience_alignment(influencer_data, brand_data),
+            "content_quality_score": self._content_quality(influencer_data),
+            "engagement_quality_score": self._engagement_quality(influencer_data),
+            "ai_insights": self._ai_insights(influencer_data, brand_data),
+            "risk_assessment": self._risks(influencer_data),
+            "collaboration_potential": self._collaboration_potential(influencer_data, brand_data),
+            "estimated_cost": self._estimate_collaboration_cost(influencer_data),
+            "best_content_types": self._content_types(influencer_data, brand_data),
+            "analyzed_at": datetime.now().isoformat()
+        }
+
+    def extract_profile_features(self, influencer_data: Dict) -> Dict[str, Any]:
+        """Brand-independent engagement, authenticity and quality features from a profile"""
+        followers = influencer_data.get("followers", 0)
+        engagement = influencer_data.get("engagement_rate", 0)
+        bio = influencer_data.get("bio", "").lower()
+        return {
+            "engagement": {
+                "followers": followers,
+                "engagement_rate": engagement,
+                "avg_likes": influencer_data.get("avg_likes", 0),
+                "avg_comments": influencer_data.get("avg_comments", 0),
+                "avg_views": influencer_data.get("avg_views", 0),
+                "quality_score": self._engagement_quality(influencer_data)
+            },
+            "authenticity": {
+                "score": self._authenticity_score(influencer_data),
+                "positive_signals": sum(1 for signal in self.authenticity_signals["positive"] if signal in bio),
+                "negative_signals": sum(1 for signal in self.authenticity_signals["negative"] if signal in bio),
+                "verified": influencer_data.get("verified", False),
+                "suspicious_engagement": (followers > 100000 and engagement > 8.0)
+                                         or (followers > 500000 and engagement > 6.0)
+            },
+            "content_quality_score": self._content_quality(influencer_data),
+            "ai_insights": self._ai_insights(influencer_data, {}),
+            "risk_assessment": self._risks(influencer_data),
+            "estimated_cost": self._estimate_collaboration_cost(influencer_data)
+        }
+    
+    def extract_content_features(self, content: List[Dict]) -> Dict[str, Any]:
+        """Posting cadence and a keyword-category vector from recent posts or videos"""
+        timestamps = []
+        for item in content:
+            published = item.get("timestamp") or item.get("published_at") or item.get("posted_at")
+            if published:
+                timestamps.append(datetime.fromisoformat(published.replace("Z", "+00:00")).replace(tzinfo=None))
+        timestamps.sort(reverse=True)
+        
+        cadence = {"posts_sampled": len(timestamps), "posts_per_week": 0.0,
+                   "avg_gap_days": None, "days_since_last_post": None}
+        if timestamps:
+            cadence["days_since_last_post"] = round((datetime.now() - timestamps[0]).total_seconds() / 86400, 1)
+        if len(timestamps) > 1:
+            span_days = max((timestamps[0] - timestamps[-1]).total_seconds() / 86400, 1.0)
+            cadence["avg_gap_days"] = round(span_days / (len(timestamps) - 1), 2)
+            cadence["posts_per_week"] = round(7 * (len(timestamps) - 1) / span_days, 2)
+        
+        # Share of keyword hits per brand category across captions, titles and tags
+        text = " ".join(
+            " ".join([
+                str(item.get("caption") or item.get("content") or ""),
+                str(item.get("title") or ""),
+                str(item.get("description") or ""),
+                " ".join(item.get("hashtags") or item.get("tags") or [])
+            ])
+            for item in content
+        ).lower()
+        hits = {
+            category: sum(text.count(keyword) for keyword in keywords)
+            for category, keywords in self.brand_keywords.items()
+        }
+        total = sum(hits.values())
+        vector = {category: round(count / total, 4) for category, count in hits.items() if count} if total else {}
+        return {"cadence": cadence, "content_vector": vector}
     
+    def extract_audience_features(self, audience: Dict) -> Dict[str, Any]:
+        """Normalized age, gender and interest distributions from audience insights"""
+        demographics = audience.get("demographics", {})
+        
+        def normalized(distribution: Dict[str, float]) -> Dict[str, float]:
+            total = sum(distribution.values())
+            return {key: round(value / total, 4) for key, value in distribution.items()} if total else {}
+        
+        return {
+            "audience_vector": {
+                "age": normalized(demographics.get("age_groups", {})),
+                "gender": normalized(demographics.get("gender", {})),
+                "interests": normalized({
+                    interest["category"].lower(): interest["affinity"] for interest in audience.get("interests", [])
+                })
+            }
+        }
+    
+    def analyze_with_features(self, influencer_data: Dict, features: Dict, brand_data: Dict) -> Dict[str, Any]:
+        """Influencer analysis joining materialized features with brand-specific scoring"""
+        interests = (brand_data.get("target_interests") or brand_data.get("targetInterests") or "").lower()
+        content_vector = features.get("content_vector") or {}
+        return {
+            **influencer_data,
+            "match_score": self._match_score(influencer_data, brand_data),
+            "authenticity_score": features["authenticity"]["score"],
+            "audience_alignment": self._audience_alignment(influencer_data, brand_data),
+            "content_quality_score": features["content_quality_score"],
+            "engagement_quality_score": features["engagement"]["quality_score"],
+            "content_affinity": round(sum(
+                weight for category, weight in content_vector.items() if category in interests
+            ), 3),
+            "ai_insights": features["ai_insights"],
+            "risk_assessment": features["risk_assessment"],
+            "collaboration_potential": self._collaboration_potential(influencer_data, brand_data),
+            "estimated_cost": features["estimated_cost"],
+            "best_content_types": self._content_types(influencer_data, brand_data),
+            "analyzed_at": datetime.now().isoformat()
+        }
+
     async def get_detailed_analysis(self, influencer_id: str) -> Dict[str, Any]:
         """Get detailed AI analysis for specific influencer"""
         await asyncio.sleep(0.8)
@@ -118,7 +245,10 @@ class AIAnalyzer:
     async def _calculate_match_score(self, influencer_data: Dict, brand_data: Dict) -> int:
         """Calculate brand-influencer match score using AI"""
         await asyncio.sleep(0.2)
-        
+        return self._match_score(influencer_data, brand_data)
+    
+    def _match_score(self, influencer_data: Dict, brand_data: Dict) -> int:
+        """Rule-based match score shared by the async and process-pool paths"""
         score = 50  # Base score
         
         # Category alignment
@@ -156,7 +286,10 @@ class AIAnalyzer:
     async def _calculate_authenticity_score(self, influencer_data: Dict) -> int:
         """Calculate authenticity score based on various factors"""
         await asyncio.sleep(0.15)
-        
+        return self._authenticity_score(influencer_data)
+    
+    def _authenticity_score(self, influencer_data: Dict) -> int:
+        """Rule-based authenticity score"""
         score = 80  # Base authenticity score
         
         # Engagement rate authenticity check
@@ -189,7 +322,10 @@ class AIAnalyzer:
     async def _calculate_audience_alignment(self, influencer_data: Dict, brand_data: Dict) -> int:
         """Calculate how well influencer's audience matches brand's target"""
         await asyncio.sleep(0.1)
-        
+        return self._audience_alignment(influencer_data, brand_data)
+    
+    def _audience_alignment(self, influencer_data: Dict, brand_data: Dict) -> int:
+        """Rule-based audience alignment score"""
         base_score = random.randint(75, 95)
         
         # Platform preference alignment
@@ -204,7 +340,10 @@ class AIAnalyzer:
     async def _analyze_content_quality(self, influencer_data: Dict) -> int:
         """Analyze content quality using AI"""
         await asyncio.sleep(0.2)
-        
+        return self._content_quality(influencer_data)
+    
+    def _content_quality(self, influencer_data: Dict) -> int:
+        """Content quality score"""
         # Simulate content quality analysis
         quality_factors = [
             random.randint(70, 95),  # Visual quality
@@ -218,7 +357,10 @@ class AIAnalyzer:
     async def _analyze_engagement_quality(self, influencer_data: Dict) -> int:
         """Analyze engagement quality and authenticity"""
         await asyncio.sleep(0.15)
-        
+        return self._engagement_quality(influencer_data)
+    
+    def _engagement_quality(self, influencer_data: Dict) -> int:
+        """Engagement quality score"""
         engagement_rate = influencer_data.get("engagement_rate", 0)
         followers = influencer_data.get("followers", 0)
         
@@ -242,8 +384,52 @@ class AIAnalyzer:
     
     async def _generate_ai_insights(self, influencer_data: Dict, brand_data: Dict) -> List[str]:
         """Generate AI-powered insights about the influencer"""
-        await asyncio.sleep(0.3)
+        insights = self._ai_insights(influencer_data, brand_data)
+        if self.inference is None:
+            await asyncio.sleep(0.3)
+            return insights
         
+        return await self._model_insights(influencer_data, brand_data, insights)
+    
+    async def refine_insights(self, analysis: Dict, brand_data: Dict) -> Dict:
+        """Replace the rule-based insights of a finished analysis with model-generated ones
+        
+        Pool and feature-store analyses are computed synchronously, so they take the model
+        step here; without an inference gateway the analysis is returned unchanged.
+        """
+        if self.inference is not None:
+            analysis["ai_insights"] = await self._model_insights(analysis, brand_data, analysis["ai_insights"])
+        return analysis
+    
+    async def _model_insights(self, influencer_data: Dict, brand_data: Dict, insights: List[str]) -> List[str]:
+        completion = await self.inference.complete(
+            self._insights_prompt(influencer_data),
+            prefix=self._brand_prompt(brand_data),
+            max_tokens=96,
+            default="\n".join(insights)
+        )
+        return [line.strip() for line in completion.splitlines() if line.strip()][:3]
+    
+    def _brand_prompt(self, brand_data: Dict) -> str:
+        """Prompt prefix shared by every creator analyzed for one brand"""
+        return (
+            "You assess social media creators as collaboration partners for a brand.\n"
+            f"Product: {brand_data.get('product_name', '')}\n"
+            f"Description: {brand_data.get('product_description', '')}\n"
+            f"Target interests: {brand_data.get('target_interests', '')}\n"
+            f"Campaign goal: {brand_data.get('campaign_goal', '')}\n"
+        )
+    
+    def _insights_prompt(self, influencer_data: Dict) -> str:
+        return (
+            f"Creator: @{influencer_data.get('username', '')} on {influencer_data.get('platform', '')}, "
+            f"{influencer_data.get('followers', 0)} followers, {influencer_data.get('engagement_rate', 0)}% engagement, "
+            f"category {influencer_data.get('category', '')}.\n"
+            "List up to three one-line insights about this creator for the brand."
+        )
+    
+    def _ai_insights(self, influencer_data: Dict, brand_data: Dict) -> List[str]:
+        """Rule-based insights about the influencer"""
         insights = []
         
         # Engagement insights
@@ -279,7 +465,10 @@ class AIAnalyzer:
     async def _assess_risks(self, influencer_data: Dict) -> Dict[str, Any]:
         """Assess potential risks of collaboration"""
         await asyncio.sleep(0.2)
-        
+        return self._risks(influencer_data)
+    
+    def _risks(self, influencer_data: Dict) -> Dict[str, Any]:
+        """Rule-based collaboration risk assessment"""
         risk_level = random.choice(["Low", "Medium", "High"])
         risk_factors = []
         
@@ -308,8 +497,11 @@ class AIAnalyzer:
     async def _assess_collaboration_potential(self, influencer_data: Dict, brand_data: Dict) -> str:
         """Assess collaboration potential"""
         await asyncio.sleep(0.1)
-        
-        match_score = await self._calculate_match_score(influencer_data, brand_data)
+        return self._collaboration_potential(influencer_data, brand_data)
+    
+    def _collaboration_potential(self, influencer_data: Dict, brand_data: Dict) -> str:
+        """Collaboration potential from a fresh match score"""
+        match_score = self._match_score(influencer_data, brand_data)
         
         if match_score >= 90:
             return "Excellent - Highly recommended for collaboration"
@@ -352,7 +544,10 @@ class AIAnalyzer:
     async def _recommend_content_types(self, influencer_data: Dict, brand_data: Dict) -> List[str]:
         """Recommend best content types for collaboration"""
         await asyncio.sleep(0.1)
-        
+        return self._content_types(influencer_data, brand_data)
+    
+    def _content_types(self, influencer_data: Dict, brand_data: Dict) -> List[str]:
+        """Content type recommendations"""
         platform = influencer_data.get("platform", "")
         category = influencer_data.get("category", "").lower()
         
@@ -0,0 +1,126 @@
+"""
+Analysis Pool Module
+Runs CPU-bound influencer analysis in a warm process pool, off the asyncio event loop
+"""
+
+import asyncio
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from core.adaptive_limiter import AdaptiveLimiter
+from core.serialization import dumps, loads
+from .ai_analyzer import AIAnalyzer
+
+# Analyzer owned by each worker process, built once by the pool initializer
+_worker_analyzer: Optional[AIAnalyzer] = None
+
+
+def _init_worker():
+    """Preload keyword tables and models once per worker process"""
+    global _worker_analyzer
+    _worker_analyzer = AIAnalyzer()
+
+
+def _warmup() -> int:
+    """No-op task used to force worker start-up"""
+    return os.getpid()
+
+
+def _analyze_payload(payload: bytes) -> bytes:
+    """Analyze a serialized batch inside a worker process"""
+    batch = loads(payload)
+    brand_data = batch["brand_data"]
+    features = batch.get("features")
+    if features is not None:
+        results = [
+            _worker_analyzer.analyze_with_features(influencer, influencer_features, brand_data)
+            for influencer, influencer_features in zip(batch["items"], features)
+        ]
+    else:
+        results = [
+            _worker_analyzer.analyze_influencer_sync(influencer, brand_data)
+            for influencer in batch["items"]
+        ]
+    return dumps(results)
+
+
+class AnalysisPool:
+    """Warm process pool for batched influencer analysis"""
+
+    def __init__(self, max_workers: Optional[int] = None, batch_size: int = 16,
+                 concurrency: Optional[AdaptiveLimiter] = None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # Optional adaptive cap on batches queued to the workers
+        self.concurrency = concurrency
+
+        # Stats
+        self.batches = 0
+        self.items = 0
+        self.payload_bytes = 0
+        self.in_flight = 0
+        self.round_trip_seconds = 0.0
+
+    async def start(self):
+        """Spawn workers and run their initializer before the first real batch"""
+        if self._executor is not None:
+            return
+        self._executor = ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_worker)
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(
+            loop.run_in_executor(self._executor, _warmup) for _ in range(self.max_workers)
+        ))
+
+    def shutdown(self):
+        """Stop the worker processes"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def analyze_batch(self, influencers: List[Dict], brand_data: Dict,
+                            features: Optional[List[Dict]] = None) -> List[Dict[str, Any]]:
+        """Analyze a batch of influencers in a worker process, joining precomputed features if given"""
+        if self._executor is None:
+            await self.start()
+
+        batch = {"brand_data": brand_data, "items": influencers}
+        if features is not None:
+            batch["features"] = features
+        payload = dumps(batch)
+        loop = asyncio.get_running_loop()
+        if self.concurrency is not None:
+            await self.concurrency.acquire()
+        started = time.perf_counter()
+        failed = False
+        self.in_flight += 1
+        try:
+            result = await loop.run_in_executor(self._executor, _analyze_payload, payload)
+        except Exception:
+            failed = True
+            raise
+        finally:
+            self.in_flight -= 1
+            if self.concurrency is not None:
+                self.concurrency.release(time.perf_counter() - started, failed)
+
+        self.batches += 1
+        self.items += len(influencers)
+        self.payload_bytes += len(payload) + len(result)
+        self.round_trip_seconds += time.perf_counter() - started
+        return loads(result)
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool utilisation counters"""
+        return {
+            "workers": self.max_workers,
+            "started": self._executor is not None,
+            "batch_size": self.batch_size,
+            "batches": self.batches,
+            "items": self.items,
+            "in_flight_batches": self.in_flight,
+            "payload_bytes": self.payload_bytes,
+            "avg_batch_ms": round(self.round_trip_seconds * 1000 / self.batches, 2) if self.batches else 0.0
+        }
@@ -0,0 +1,195 @@
+"""
+Inference Gateway Module
+Micro-batches concurrent model prompts into single model calls and caches encoded prompt prefixes
+"""
+
+import asyncio
+from collections import OrderedDict
+from hashlib import blake2b
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from core.batch_loader import BatchLoader
+
+_FILLER_WORDS = (
+    "creator", "audience", "content", "brand", "collaboration", "engagement", "authentic",
+    "community", "campaign", "story", "style", "reach", "partnership", "video", "post", "value"
+)
+
+
+def count_tokens(text: str) -> int:
+    """Rough token count (about four characters per token)"""
+    return max(1, len(text) // 4) if text else 0
+
+
+class LocalStandInModel:
+    """Offline stand-in for an LLM served on CPU, with a batch-aware latency model
+
+    A call costs a fixed overhead, a prefill pass over every uncached prompt token in the
+    batch, and one decode step per generated token of the longest completion; a decode
+    step gets slightly slower as the batch grows. At most `parallelism` calls run at once,
+    as on a single CPU host; further calls queue. The completion is the request's default
+    text when one is given (so rule-based outputs stay meaningful offline), otherwise
+    filler text seeded by the prompt.
+    """
+
+    def __init__(self, call_overhead: float = 0.03, prefill_per_token: float = 0.0004,
+                 decode_step: float = 0.02, decode_step_per_item: float = 0.001, parallelism: int = 2):
+        self.parallelism = parallelism
+        self._slots = asyncio.Semaphore(parallelism)
+        self.call_overhead = call_overhead
+        self.prefill_per_token = prefill_per_token
+        self.decode_step = decode_step
+        self.decode_step_per_item = decode_step_per_item
+        self.calls = 0
+        self.prefix_encodes = 0
+        self.prompts = 0
+        self.prefill_tokens = 0
+        self.generated_tokens = 0
+        self.busy_seconds = 0.0
+
+    async def encode_prefix(self, prefix: str) -> Dict[str, Any]:
+        """Run the prefill pass for a shared prefix; the handle stands in for its KV cache"""
+        tokens = count_tokens(prefix)
+        seconds = self.call_overhead + tokens * self.prefill_per_token
+        self.prefix_encodes += 1
+        self.prefill_tokens += tokens
+        await self._run(seconds)
+        return {"tokens": tokens, "digest": blake2b(prefix.encode(), digest_size=8).hexdigest()}
+
+    async def generate(self, requests: List[Tuple[Dict[str, Any], str, int, Optional[str]]]) -> List[str]:
+        """Complete a batch of (prefix handle, prompt, max_tokens, default) in one call"""
+        completions = []
+        prefill = 0
+        for handle, prompt, max_tokens, default in requests:
+            prefill += count_tokens(prompt)
+            completions.append(default if default is not None else self._filler(handle, prompt, max_tokens))
+        steps = max(min(count_tokens(text), max_tokens) for text in completions)
+        seconds = (self.call_overhead + prefill * self.prefill_per_token
+                   + steps * (self.decode_step + self.decode_step_per_item * len(requests)))
+        self.calls += 1
+        self.prompts += len(requests)
+        self.prefill_tokens += prefill
+        self.generated_tokens += sum(count_tokens(text) for text in completions)
+        await self._run(seconds)
+        return completions
+
+    async def _run(self, seconds: float):
+        async with self._slots:
+            self.busy_seconds += seconds
+            await asyncio.sleep(seconds)
+
+    def _filler(self, handle: Dict[str, Any], prompt: str, max_tokens: int) -> str:
+        seed = blake2b((handle["digest"] + prompt).encode(), digest_size=32).digest()
+        words = [_FILLER_WORDS[byte % len(_FILLER_WORDS)] for byte in seed]
+        return " ".join((words * (max_tokens // len(words) + 1))[:max(1, max_tokens // 2)]).capitalize() + "."
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "model": "local-standin",
+            "parallelism": self.parallelism,
+            "calls": self.calls,
+            "prefix_encodes": self.prefix_encodes,
+            "prompts": self.prompts,
+            "prefill_tokens": self.prefill_tokens,
+            "generated_tokens": self.generated_tokens,
+            "busy_seconds": round(self.busy_seconds, 2)
+        }
+
+
+class InferenceGateway:
+    """Single entry point to the model for the analyzer and the message generator
+
+    Concurrent complete() calls are collected for up to max_wait seconds (or until
+    max_batch_size prompts are queued) and sent as one model call; identical prompts in a
+    window share a completion. Prompts carry a shared prefix (the brand context), which is
+    encoded once and kept in an LRU cache of prefix_cache_size entries so only the
+    per-creator part of each prompt is prefilled.
+    """
+
+    def __init__(self, model, max_batch_size: int = 16, max_wait: float = 0.01, prefix_cache_size: int = 256):
+        self.model = model
+        self.prefix_cache_size = prefix_cache_size
+        self._prefixes: "OrderedDict[str, Any]" = OrderedDict()
+        self._loader = BatchLoader(self._run_batch, max_batch_size=max_batch_size, batch_window=max_wait)
+        self.prefix_hits = 0
+        self.prefix_misses = 0
+        self.prefix_tokens_saved = 0
+        self.fallbacks = 0
+        # Prefixes being encoded, so concurrent batches with the same new prefix encode it once
+        self._encoding: Dict[str, asyncio.Future] = {}
+
+    async def complete(self, prompt: str, prefix: str = "", max_tokens: int = 64,
+                       default: Optional[str] = None) -> str:
+        """Completion for prefix + prompt
+
+        default is returned in place of an error when the model call fails, and is the
+        completion the local stand-in model gives back.
+        """
+        try:
+            return await self._loader.load((prefix, prompt, max_tokens, default))
+        except Exception:
+            if default is None:
+                raise
+            self.fallbacks += 1
+            return default
+
+    async def _run_batch(self, keys: List[Hashable]) -> Dict[Hashable, str]:
+        handles = await self._prefix_handles({prefix for prefix, _, _, _ in keys})
+        completions = await self.model.generate([
+            (handles[prefix], prompt, max_tokens, default) for prefix, prompt, max_tokens, default in keys
+        ])
+        return dict(zip(keys, completions))
+
+    async def _prefix_handles(self, prefixes) -> Dict[str, Any]:
+        """Encoded prefixes from the LRU cache, encoding the missing ones concurrently"""
+        handles = {}
+        missing = {}
+        for prefix in prefixes:
+            handle = self._prefixes.get(prefix)
+            if handle is not None:
+                self._prefixes.move_to_end(prefix)
+                self.prefix_hits += 1
+                self.prefix_tokens_saved += handle["tokens"]
+                handles[prefix] = handle
+                continue
+            self.prefix_misses += 1
+            if prefix not in self._encoding:
+                self._encoding[prefix] = asyncio.ensure_future(self._encode(prefix))
+            missing[prefix] = self._encoding[prefix]
+        for prefix, handle in zip(missing, await asyncio.gather(*map(asyncio.shield, missing.values()))):
+            handles[prefix] = handle
+        return handles
+
+    async def _encode(self, prefix: str) -> Any:
+        try:
+            handle = await self.model.encode_prefix(prefix)
+            self._remember(prefix, handle)
+            return handle
+        finally:
+            del self._encoding[prefix]
+
+    def _remember(self, prefix: str, handle: Any):
+        if self.prefix_cache_size <= 0:
+            return
+        self._prefixes[prefix] = handle
+        self._prefixes.move_to_end(prefix)
+        while len(self._prefixes) > self.prefix_cache_size:
+            self._prefixes.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        """Batching and prefix-cache effectiveness, plus the model's own counters"""
+        lookups = self.prefix_hits + self.prefix_misses
+        return {
+            "max_batch_size": self._loader.max_batch_size,
+            "max_wait_ms": round(self._loader.batch_window * 1000, 1),
+            "batching": self._loader.stats(),
+            "prefix_cache": {
+                "entries": len(self._prefixes),
+                "hits": self.prefix_hits,
+                "misses": self.prefix_misses,
+                "hit_rate": round(self.prefix_hits / lookups, 3) if lookups else 0.0,
+                "prefill_tokens_saved": self.prefix_tokens_saved
+            },
+            "fallbacks": self.fallbacks,
+            "model": self.model.stats()
+        }
@@ -1,6 +1,7 @@
 """
 Instagram API Integration Module
-Simulates Instagram Graph API and Instagram Basic Display API calls
+Simulates Instagram Graph API and Instagram Basic Display API calls, or calls a
+Graph API compatible server over HTTP when given a transport
 """
 
 import asyncio
@@ -9,13 +10,49 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 import json
 
-class InstagramAPI:
+from core.adaptive_limiter import AdaptiveLimiter
+from core.cache import TieredCache
+from core.http_transport import HTTPTransport
+from core.rate_limiter import RateLimiter
+from core.resilience import Resilience
+from .platform_client import PlatformClient, platform_call
+
+class InstagramAPI(PlatformClient):
     """Simulated Instagram API client"""
     
-    def __init__(self):
+    platform = "instagram"
+    
+    # Response cache lifetimes (seconds) per endpoint
+    cache_ttls = {
+        "get_user_profile": 3600,
+        "get_user_media": 900,
+        "get_recent_posts": 900,
+        "get_audience_insights": 6 * 3600,
+        "analyze_hashtag_performance": 3600
+    }
+    # Profiles and audience data change slowly, so a day-old copy beats waiting on the API
+    cache_stale_ttls = {
+        "get_user_profile": 24 * 3600,
+        "get_user_media": 6 * 3600,
+        "get_recent_posts": 6 * 3600,
+        "get_audience_insights": 48 * 3600
+    }
+    
+    def __init__(self, rate_limiter: Optional[RateLimiter] = None,
+                 transport: Optional[HTTPTransport] = None, base_url: Optional[str] = None,
+                 resilience: Optional[Resilience] = None, concurrency: Optional[AdaptiveLimiter] = None,
+                 cache: Optional[TieredCache] = None):
         self.api_version = "v18.0"
-        self.base_url = "https://graph.instagram.com"
+        self.base_url = base_url or "https://graph.instagram.com"
         self.access_token = "simulated_instagram_token"
+        super().__init__(
+            credential=self.access_token, rate_limiter=rate_limiter, transport=transport, resilience=resilience,
+            concurrency=concurrency, cache=cache
+        )
+        
+        # Per-id lookups are coalesced into multi-id requests
+        self.profile_loader = self._loader("get_user_profile", self.get_user_profiles)
+        self.audience_loader = self._loader("get_audience_insights", self.get_audience_insights_batch)
         
         # Mock Instagram influencer database
         self.mock_influencers = [
@@ -110,134 +147,140 @@ class InstagramAPI:
     
     async def discover_influencers(self, brand_data: Dict, max_results: int = 25) -> List[Dict]:
         """Discover Instagram influencers based on brand criteria"""
+        return await self.discover_influencers_page(brand_data, 0, max_results)
+    
+    @platform_call()
+    async def discover_influencers_page(self, brand_data: Dict, offset: int = 0, limit: int = 25) -> List[Dict]:
+        """Discover one page of Instagram influencers based on brand criteria"""
+        if self.live:
+            page = await self._get(f"/{self.api_version}/discovery", {
+                "q": brand_data.get("target_interests") or brand_data.get("targetInterests"),
+                "offset": offset,
+                "limit": limit
+            })
+            return [self._format_influencer_data(influencer) for influencer in page["data"]]
+        
         await asyncio.sleep(1.5)  # Simulate API delay
         
         # Filter and generate influencers based on brand data
         discovered = []
-        
-        # Use existing mock data
-        for influencer in self.mock_influencers:
+        for index in range(offset, offset + limit):
+            if index < len(self.mock_influencers):
+                # Use existing mock data first
+                influencer = self.mock_influencers[index]
+            else:
+                # Generate additional random influencers
+                influencer = self._generate_mock_influencer(index - len(self.mock_influencers) + 100)
             discovered.append(self._format_influencer_data(influencer))
         
-        # Generate additional random influencers
-        additional_count = max_results - len(discovered)
-        for i in range(additional_count):
-            mock_influencer = self._generate_mock_influencer(i + 100)
-            discovered.append(self._format_influencer_data(mock_influencer))
-        
-        return discovered[:max_results]
+        return discovered
     
+    @platform_call()
     async def get_user_profile(self, username: str) -> Dict[str, Any]:
         """Get Instagram user profile information"""
+        if self.live:
+            return await self._get(f"/{self.api_version}/{username}")
+        
         await asyncio.sleep(0.5)
         
         # Find in mock data or generate
         for influencer in self.mock_influencers:
-            if influencer["username"] == username:
+            if username in (influencer["username"], influencer["id"]):
                 return influencer
         
         # Generate mock profile if not found
         return self._generate_mock_influencer(random.randint(1000, 9999))
     
+    @platform_call()
     async def get_user_media(self, user_id: str, limit: int = 12) -> List[Dict]:
         """Get recent media posts from user"""
-        await asyncio.sleep(0.8)
+        if self.live:
+            page = await self._get(f"/{self.api_version}/{user_id}/media", {"limit": limit})
+            return page["data"]
         
-        media_posts = []
-        for i in range(limit):
-            post = {
-                "id": f"media_{user_id}_{i}",
-                "media_type": random.choice(["IMAGE", "VIDEO", "CAROUSEL_ALBUM"]),
-                "media_url": f"https://example.com/media/{user_id}_{i}.jpg",
-                "caption": self._generate_mock_caption(),
-                "like_count": random.randint(500, 10000),
-                "comments_count": random.randint(20, 500),
-                "timestamp": (datetime.now() - timedelta(days=i)).isoformat(),
-                "hashtags": self._generate_hashtags()
-            }
-            media_posts.append(post)
+        await asyncio.sleep(0.8)
         
-        return media_posts
+        return self._generate_mock_media(user_id, limit)
     
+    @platform_call()
     async def get_recent_posts(self, influencer_id: str, limit: int = 10) -> List[Dict]:
         """Get recent posts with engagement data"""
-        await asyncio.sleep(0.6)
+        if self.live:
+            page = await self._get(f"/{self.api_version}/{influencer_id}/posts", {"limit": limit})
+            return page["data"]
         
-        posts = []
-        for i in range(limit):
-            post = {
-                "id": f"post_{influencer_id}_{i}",
-                "type": "instagram_post",
-                "content": self._generate_mock_caption(),
-                "engagement": {
-                    "likes": random.randint(1000, 15000),
-                    "comments": random.randint(50, 800),
-                    "shares": random.randint(10, 200),
-                    "saves": random.randint(100, 2000)
-                },
-                "posted_at": (datetime.now() - timedelta(days=i)).isoformat(),
-                "hashtags": self._generate_hashtags(),
-                "mentions": random.randint(0, 5)
-            }
-            posts.append(post)
+        await asyncio.sleep(0.6)
         
-        return posts
+        return self._generate_mock_posts(influencer_id, limit)
     
+    @platform_call()
     async def get_audience_insights(self, user_id: str) -> Dict[str, Any]:
         """Get audience demographics and insights"""
+        if self.live:
+            page = await self._get(f"/{self.api_version}/{user_id}/insights")
+            return page["data"]
+        
         await asyncio.sleep(1.2)
         
+        return self._generate_mock_audience_insights()
+    
+    @platform_call()
+    async def get_user_profiles(self, usernames: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get many user profiles in one request (Graph API ?ids= lookup, up to 50)"""
+        if self.live:
+            return await self._get(f"/{self.api_version}/", {"ids": ",".join(usernames)})
+        
+        await asyncio.sleep(0.5)
+        
+        known = {}
+        for influencer in self.mock_influencers:
+            known[influencer["username"]] = influencer
+            known[influencer["id"]] = influencer
+        
         return {
-            "demographics": {
-                "age_groups": {
-                    "13-17": random.randint(5, 15),
-                    "18-24": random.randint(20, 35),
-                    "25-34": random.randint(25, 45),
-                    "35-44": random.randint(15, 25),
-                    "45-54": random.randint(5, 15),
-                    "55+": random.randint(2, 8)
-                },
-                "gender": {
-                    "female": random.randint(45, 85),
-                    "male": random.randint(15, 55),
-                    "other": random.randint(1, 5)
-                },
-                "top_locations": [
-                    {"city": "Los Angeles", "percentage": random.randint(8, 15)},
-                    {"city": "New York", "percentage": random.randint(6, 12)},
-                    {"city": "Chicago", "percentage": random.randint(4, 8)},
-                    {"city": "Miami", "percentage": random.randint(3, 7)},
-                    {"city": "San Francisco", "percentage": random.randint(3, 6)}
-                ]
-            },
-            "interests": [
-                {"category": "Fashion", "affinity": random.randint(60, 95)},
-                {"category": "Beauty", "affinity": random.randint(40, 80)},
-                {"category": "Lifestyle", "affinity": random.randint(50, 85)},
-                {"category": "Travel", "affinity": random.randint(30, 70)},
-                {"category": "Food", "affinity": random.randint(25, 65)}
-            ],
-            "engagement_patterns": {
-                "best_posting_times": ["9:00 AM", "1:00 PM", "7:00 PM"],
-                "peak_days": ["Tuesday", "Wednesday", "Sunday"],
-                "avg_session_duration": f"{random.randint(2, 8)} minutes"
-            }
+            username: known.get(username) or self._generate_mock_influencer(random.randint(1000, 9999))
+            for username in usernames
         }
     
+    @platform_call()
+    async def get_audience_insights_batch(self, user_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get audience insights for many users in one request"""
+        if self.live:
+            return await self._get(f"/{self.api_version}/insights", {"ids": ",".join(user_ids)})
+        
+        await asyncio.sleep(1.2)
+        
+        return {user_id: self._generate_mock_audience_insights() for user_id in user_ids}
+    
+    @platform_call()
     async def analyze_hashtag_performance(self, hashtags: List[str]) -> Dict[str, Any]:
         """Analyze hashtag performance and reach"""
-        await asyncio.sleep(0.4)
+        if self.live:
+            return await self._get(f"/{self.api_version}/hashtags", {"names": ",".join(hashtags)})
         
-        hashtag_data = {}
-        for hashtag in hashtags:
-            hashtag_data[hashtag] = {
-                "post_count": random.randint(10000, 1000000),
-                "avg_engagement": round(random.uniform(2.0, 8.0), 2),
-                "difficulty": random.choice(["Low", "Medium", "High"]),
-                "trend": random.choice(["Rising", "Stable", "Declining"])
-            }
+        await asyncio.sleep(0.4)
         
-        return hashtag_data
+        return self._generate_mock_hashtag_stats(hashtags)
+    
+    def enrichment_plan(self, influencer: Dict, content_limit: int) -> Dict[str, tuple]:
+        """Profile and audience lookups go through batch loaders and resolve as multi-id calls"""
+        return {
+            "profile": (self.profile_loader.load, influencer["username"]),
+            "content": (self.get_user_media, influencer["id"], content_limit),
+            "audience": (self.audience_loader.load, influencer["id"])
+        }
+    
+    def detail_plan(self, influencer_id: str, content_limit: int) -> Dict[str, tuple]:
+        """Audience insights are the account analytics the Graph API exposes, so there is no separate part"""
+        return {
+            "profile": (self.profile_loader.load, influencer_id),
+            "content": (self.get_recent_posts, influencer_id, content_limit),
+            "audience": (self.audience_loader.load, influencer_id)
+        }
+    
+    def _auth_params(self) -> Dict[str, str]:
+        """Graph API requests carry the access token as a query parameter"""
+        return {"access_token": self.access_token}
     
     def _format_influencer_data(self, influencer: Dict) -> Dict:
         """Format influencer data for API response"""
@@ -297,6 +340,98 @@ class InstagramAPI:
             ]
         }
     
+    def _generate_mock_audience_insights(self) -> Dict[str, Any]:
+        """Generate mock audience insights"""
+        return {
+            "demographics": {
+                "age_groups": {
+                    "13-17": random.randint(5, 15),
+                    "18-24": random.randint(20, 35),
+                    "25-34": random.randint(25, 45),
+                    "35-44": random.randint(15, 25),
+                    "45-54": random.randint(5, 15),
+                    "55+": random.randint(2, 8)
+                },
+                "gender": {
+                    "female": random.randint(45, 85),
+                    "male": random.randint(15, 55),
+                    "other": random.randint(1, 5)
+                },
+                "top_locations": [
+                    {"city": "Los Angeles", "percentage": random.randint(8, 15)},
+                    {"city": "New York", "percentage": random.randint(6, 12)},
+                    {"city": "Chicago", "percentage": random.randint(4, 8)},
+                    {"city": "Miami", "percentage": random.randint(3, 7)},
+                    {"city": "San Francisco", "percentage": random.randint(3, 6)}
+                ]
+            },
+            "interests": [
+                {"category": "Fashion", "affinity": random.randint(60, 95)},
+                {"category": "Beauty", "affinity": random.randint(40, 80)},
+                {"category": "Lifestyle", "affinity": random.randint(50, 85)},
+                {"category": "Travel", "affinity": random.randint(30, 70)},
+                {"category": "Food", "affinity": random.randint(25, 65)}
+            ],
+            "engagement_patterns": {
+                "best_posting_times": ["9:00 AM", "1:00 PM", "7:00 PM"],
+                "peak_days": ["Tuesday", "Wednesday", "Sunday"],
+                "avg_session_duration": f"{random.randint(2, 8)} minutes"
+            }
+        }
+    
+    def _generate_mock_media(self, user_id: str, limit: int) -> List[Dict]:
+        """Generate mock media posts"""
+        media_posts = []
+        for i in range(limit):
+            post = {
+                "id": f"media_{user_id}_{i}",
+                "media_type": random.choice(["IMAGE", "VIDEO", "CAROUSEL_ALBUM"]),
+                "media_url": f"https://example.com/media/{user_id}_{i}.jpg",
+                "caption": self._generate_mock_caption(),
+                "like_count": random.randint(500, 10000),
+                "comments_count": random.randint(20, 500),
+                "timestamp": (datetime.now() - timedelta(days=i)).isoformat(),
+                "hashtags": self._generate_hashtags()
+            }
+            media_posts.append(post)
+        
+        return media_posts
+    
+    def _generate_mock_posts(self, influencer_id: str, limit: int) -> List[Dict]:
+        """Generate mock posts with engagement data"""
+        posts = []
+        for i in range(limit):
+            post = {
+                "id": f"post_{influencer_id}_{i}",
+                "type": "instagram_post",
+                "content": self._generate_mock_caption(),
+                "engagement": {
+                    "likes": random.randint(1000, 15000),
+                    "comments": random.randint(50, 800),
+                    "shares": random.randint(10, 200),
+                    "saves": random.randint(100, 2000)
+                },
+                "posted_at": (datetime.now() - timedelta(days=i)).isoformat(),
+                "hashtags": self._generate_hashtags(),
+                "mentions": random.randint(0, 5)
+            }
+            posts.append(post)
+        
+        return posts
+    
+    def _generate_mock_hashtag_stats(self, hashtags: List[str]) -> Dict[str, Any]:
+        """Generate mock hashtag performance"""
+        hashtag_data = {}
+        for hashtag in hashtags:
+            hashtag_data[hashtag] = {
+                "post_count": random.randint(10000, 1000000),
+                "avg_engagement": round(random.uniform(2.0, 8.0), 2),
+                "difficulty": random.choice(["Low", "Medium", "High"]),
+                "trend": random.choice(["Rising", "Stable", "Declining"])
+            }
+        
+        return hashtag_data
+    
     def _generate_mock_caption(self) -> str:
         """Generate a mock Instagram caption"""
         captions = [
@@ -5,15 +5,103 @@ Generates personalized outreach messages for influencer collaborations
 
 import asyncio
 import random
-from typing import Dict, List, Any, Optional
+import time
+from typing import AsyncIterator, Dict, List, Any, Optional
 from datetime import datetime
 import re
 
+from core.resilience import LatencyTracker
+from .message_templates import TemplateEngine, TemplateError
+
+# Subject lines per brand tone; {name} and {product_name} are filled at render time
+SUBJECT_TEMPLATES = {
+    "professional": [
+        "Collaboration Opportunity - {product_name} x {name}",
+        "Partnership Proposal for {name}",
+        "Brand Collaboration Inquiry - {product_name}"
+    ],
+    "friendly": [
+        "Hey {name}! Collaboration opportunity 🌟",
+        "Would love to work with you, {name}! ✨",
+        "Exciting partnership idea for you, {name}!"
+    ],
+    "luxury": [
+        "Exclusive Partnership Opportunity - {product_name}",
+        "Premium Collaboration Proposal for {name}",
+        "Luxury Brand Partnership - {product_name}"
+    ],
+    "playful": [
+        "Let's create something amazing together, {name}! 🎉",
+        "Epic collab opportunity for you! 🚀",
+        "Ready to make some magic, {name}? ✨"
+    ]
+}
+
+VALUE_PROPOSITIONS = {
+    "awareness": "This collaboration would help introduce our brand to your amazing community while providing your followers with products they'll genuinely love.",
+    "sales": "We're looking for authentic partnerships that drive real value for both your audience and our brand.",
+    "ugc": "We'd love to work with you to create authentic content that showcases our products in your unique style.",
+    "engagement": "This partnership would create engaging content that resonates with your audience while highlighting our brand values."
+}
+
+CALLS_TO_ACTION = {
+    "professional": "Would you be available for a brief call this week to discuss the details?",
+    "friendly": "Would you be up for a quick chat about this? I'd love to hear your thoughts!",
+    "luxury": "I would be delighted to arrange a call to discuss this exclusive opportunity.",
+    "playful": "Want to hop on a call and brainstorm some amazing content ideas together?"
+}
+
+# Simulated influencer contexts for personalization
+MOCK_CONTEXTS = {
+    "instagram_001": {
+        "name": "Sarah Chen",
+        "username": "sarahstyle",
+        "platform": "instagram",
+        "category": "fashion",
+        "recent_post": "Just dropped my sustainable fashion haul! 🌱✨",
+        "follower_count": 125000,
+        "engagement_rate": 4.2,
+        "content_themes": ["sustainable fashion", "styling tips", "eco-friendly finds"]
+    },
+    "youtube_001": {
+        "name": "Alex Rodriguez",
+        "username": "alexfitness",
+        "platform": "youtube",
+        "category": "fitness",
+        "recent_post": "New workout routine that changed my life! Full body transformation",
+        "follower_count": 89000,
+        "engagement_rate": 6.8,
+        "content_themes": ["workout routines", "fitness transformation", "health tips"]
+    },
+    "instagram_002": {
+        "name": "Emma Thompson",
+        "username": "emmaeats",
+        "platform": "instagram",
+        "category": "food",
+        "recent_post": "Homemade pasta night! 🍝 This creamy mushroom linguine is pure comfort food",
+        "follower_count": 67000,
+        "engagement_rate": 5.1,
+        "content_themes": ["home cooking", "easy recipes", "comfort food"]
+    }
+}
+
+# Sections of the message body in order; empty sections are dropped
+MESSAGE_SECTIONS = (
+    "greeting", "opening", "compliment", "personal_reference", "brand_introduction",
+    "proposal", "value_proposition", "call_to_action", "closing"
+)
+SIGNATURE = ("Best regards,", "The ICY Team")
+
+# Simulated model decode time per streamed section
+PART_DECODE_SECONDS = 0.1
+
 class MessageGenerator:
     """AI-powered personalized message generator"""
     
-    def __init__(self):
+    def __init__(self, inference=None):
         self.model_version = "ICY-MessageAI-v1.5"
+        # Optional InferenceGateway for the model-backed sections; None keeps the rule-based ones
+        self.inference = inference
         
         # Message templates by brand tone
         self.templates = {
@@ -135,82 +223,196 @@ class MessageGenerator:
             "lifestyle": ["lifestyle content", "daily inspiration", "life tips", "authentic sharing"],
             "travel": ["travel adventures", "destination guides", "travel photography", "wanderlust content"]
         }
+        
+        # Templates are compiled once into per-tone render plans; custom templates register at runtime
+        self.engine = TemplateEngine()
+        self._plans = {tone: self.engine.compile_variants(sections) for tone, sections in self.templates.items()}
+        self._subjects = {tone: tuple(map(self.engine.compile, subjects)) for tone, subjects in SUBJECT_TEMPLATES.items()}
+        
+        # Time until the caller sees any text: whole messages vs. the first streamed section
+        self.message_latency = LatencyTracker()
+        self.first_part_latency = LatencyTracker()
+        self.stream_latency = LatencyTracker()
+        self.streams_completed = 0
+        self.streams_abandoned = 0
     
-    async def generate_personalized_message(self, influencer_id: str, brand_data: Dict, message_type: str = "collaboration") -> Dict[str, Any]:
-        """Generate a personalized outreach message"""
-        await asyncio.sleep(0.8)  # Simulate AI processing
+    async def generate_personalized_message(self, influencer_id: str, brand_data: Dict, message_type: str = "collaboration",
+                                            brand_context: Optional[Dict[str, Any]] = None,
+                                            template_id: Optional[str] = None) -> Dict[str, Any]:
+        """Generate a personalized outreach message, optionally laid out by a registered template"""
+        self._require_template(template_id)
+        started = time.perf_counter()
+        if brand_context is None:
+            brand_context = await self.prepare_brand_context(brand_data)
+        
+        if self.inference is None:
+            await asyncio.sleep(0.8)  # Simulate AI processing
         
         # Get influencer data (simulated)
         influencer_data = await self._get_influencer_context(influencer_id)
         
-        # Determine brand tone
-        brand_tone = brand_data.get("brandTone", "friendly")
-        if brand_tone not in self.templates:
-            brand_tone = "friendly"
-        
-        # Generate message components
-        message_parts = await self._generate_message_parts(
-            influencer_data, brand_data, brand_tone, message_type
+        # Message body and subject line only depend on the influencer and brand context
+        message_parts, subject = await asyncio.gather(
+            self._generate_message_parts(influencer_data, brand_context, message_type),
+            self._generate_subject_line(influencer_data, brand_context, message_type)
         )
         
         # Assemble final message
-        full_message = self._assemble_message(message_parts)
-        
-        # Generate subject line
-        subject = await self._generate_subject_line(influencer_data, brand_data, message_type)
+        if template_id is None:
+            full_message = self._assemble_message(message_parts)
+        else:
+            subject, full_message = self.engine.render(
+                template_id, self._template_values(influencer_data, brand_context, message_parts, subject)
+            )
         
         # Calculate personalization score
         personalization_score = self._calculate_personalization_score(message_parts, influencer_data)
+        self.message_latency.record(time.perf_counter() - started)
         
         return {
             "message": full_message,
             "subject": subject,
             "personalization_score": personalization_score,
             "message_type": message_type,
-            "brand_tone": brand_tone,
+            "brand_tone": brand_context["brand_tone"],
             "generated_at": datetime.now().isoformat(),
-            "influencer_id": influencer_id
+            "influencer_id": influencer_id,
+            "template_id": template_id
         }
     
-    async def _get_influencer_context(self, influencer_id: str) -> Dict[str, Any]:
-        """Get influencer context for personalization"""
-        await asyncio.sleep(0.2)
+    async def stream_personalized_message(self, influencer_id: str, brand_data: Dict,
+                                          message_type: str = "collaboration") -> AsyncIterator[Dict[str, Any]]:
+        """Generate a message section by section
+        
+        Yields a "part" event per non-empty section in message order as soon as it is
+        produced, then a "summary" event with the subject, personalization score and
+        assembled message.
+        """
+        started = time.perf_counter()
+        brand_context, influencer_data = await asyncio.gather(
+            self.prepare_brand_context(brand_data), self._get_influencer_context(influencer_id)
+        )
         
-        # Simulate fetching influencer data
-        mock_data = {
-            "instagram_001": {
-                "name": "Sarah Chen",
-                "username": "sarahstyle",
-                "platform": "instagram",
-                "category": "fashion",
-                "recent_post": "Just dropped my sustainable fashion haul! 🌱✨",
-                "follower_count": 125000,
-                "engagement_rate": 4.2,
-                "content_themes": ["sustainable fashion", "styling tips", "eco-friendly finds"]
-            },
-            "youtube_001": {
-                "name": "Alex Rodriguez",
-                "username": "alexfitness",
-                "platform": "youtube",
-                "category": "fitness",
-                "recent_post": "New workout routine that changed my life! Full body transformation",
-                "follower_count": 89000,
-                "engagement_rate": 6.8,
-                "content_themes": ["workout routines", "fitness transformation", "health tips"]
-            },
-            "instagram_002": {
-                "name": "Emma Thompson",
-                "username": "emmaeats",
-                "platform": "instagram",
-                "category": "food",
-                "recent_post": "Homemade pasta night! 🍝 This creamy mushroom linguine is pure comfort food",
-                "follower_count": 67000,
-                "engagement_rate": 5.1,
-                "content_themes": ["home cooking", "easy recipes", "comfort food"]
+        # Content-dependent sections and the subject generate while earlier sections stream
+        pending = {
+            "personal_reference": asyncio.ensure_future(self._generate_personal_reference(influencer_data, brand_context)),
+            "value_proposition": asyncio.ensure_future(self._generate_value_proposition(brand_context, influencer_data)),
+            "subject": asyncio.ensure_future(self._generate_subject_line(influencer_data, brand_context, message_type))
+        }
+        parts = self._render_parts(influencer_data, brand_context, "", "")
+        first_part = True
+        completed = False
+        try:
+            for section in MESSAGE_SECTIONS:
+                await asyncio.sleep(PART_DECODE_SECONDS)
+                if section in pending:
+                    parts[section] = await pending[section]
+                if not parts[section]:
+                    continue
+                if first_part:
+                    self.first_part_latency.record(time.perf_counter() - started)
+                    first_part = False
+                yield {"event": "part", "section": section, "text": parts[section]}
+            
+            summary = {
+                "event": "summary",
+                "subject": await pending["subject"],
+                "message": self._assemble_message(parts),
+                "personalization_score": self._calculate_personalization_score(parts, influencer_data),
+                "message_type": message_type,
+                "brand_tone": brand_context["brand_tone"],
+                "generated_at": datetime.now().isoformat(),
+                "influencer_id": influencer_id
             }
+            completed = True
+            self.streams_completed += 1
+            self.stream_latency.record(time.perf_counter() - started)
+            yield summary
+        finally:
+            if not completed:
+                # The client went away mid-stream
+                self.streams_abandoned += 1
+                for task in pending.values():
+                    task.cancel()
+    
+    async def generate_batch(self, influencer_ids: List[str], brand_data: Dict, message_type: str = "collaboration",
+                             concurrency: int = 50, template_id: Optional[str] = None) -> AsyncIterator[Dict[str, Any]]:
+        """Generate messages for many influencers, yielding each as soon as it is ready
+        
+        Brand-dependent parts are generated once for the whole batch; results carry the
+        index of their influencer id and arrive in completion order.
+        """
+        self._require_template(template_id)
+        brand_context = await self.prepare_brand_context(brand_data)
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def generate(index: int, influencer_id: str) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    message = await self.generate_personalized_message(
+                        influencer_id, brand_data, message_type, brand_context, template_id
+                    )
+                except Exception as e:
+                    return {"index": index, "influencer_id": influencer_id, "status": "error", "error": str(e)}
+            return {"index": index, "status": "ok", **message}
+        
+        tasks = [asyncio.ensure_future(generate(index, influencer_id)) for index, influencer_id in enumerate(influencer_ids)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Time to first visible text (ms) for whole and streamed messages, and stream totals"""
+        def quantiles(latency: LatencyTracker) -> Dict[str, Optional[float]]:
+            return {
+                f"p{int(q * 100)}_ms": None if latency.percentile(q) is None else round(latency.percentile(q) * 1000, 1)
+                for q in (0.5, 0.95)
+            }
+        
+        return {
+            "message_latency": quantiles(self.message_latency),
+            "stream_time_to_first_part": quantiles(self.first_part_latency),
+            "stream_latency": quantiles(self.stream_latency),
+            "streams_completed": self.streams_completed,
+            "streams_abandoned": self.streams_abandoned
         }
+    
+    async def prepare_brand_context(self, brand_data: Dict) -> Dict[str, Any]:
+        """Brand fields (camelCase or snake_case) and the message parts that depend only on the brand"""
+        def field(snake: str, camel: str, default: str) -> str:
+            return brand_data.get(snake) or brand_data.get(camel) or default
         
-        return mock_data.get(influencer_id, {
+        brand_tone = field("brand_tone", "brandTone", "friendly")
+        if brand_tone not in self.templates:
+            brand_tone = "friendly"
+        context = {
+            "product_name": field("product_name", "productName", ""),
+            "product_description": field("product_description", "productDescription", ""),
+            "campaign_goal": field("campaign_goal", "campaignGoal", "awareness"),
+            "brand_tone": brand_tone
+        }
+        # Shared by every model prompt for this brand, so the inference gateway encodes it once
+        context["prompt_prefix"] = (
+            "You write influencer outreach messages for a brand.\n"
+            f"Product: {context['product_name']}\n"
+            f"Description: {context['product_description']}\n"
+            f"Campaign goal: {context['campaign_goal']}\n"
+            f"Tone: {brand_tone}\n"
+        )
+        context["brand_introduction"], context["call_to_action"] = await asyncio.gather(
+            self._generate_brand_introduction(context, brand_tone),
+            self._generate_call_to_action(brand_tone)
+        )
+        return context
+    
+    async def _get_influencer_context(self, influencer_id: str) -> Dict[str, Any]:
+        """Get influencer context for personalization"""
+        await asyncio.sleep(0.2)
+        
+        return MOCK_CONTEXTS.get(influencer_id) or {
             "name": "Creator",
             "username": "creator",
             "platform": "instagram",
@@ -219,38 +421,58 @@ class MessageGenerator:
             "follower_count": random.randint(10000, 200000),
             "engagement_rate": round(random.uniform(3.0, 7.0), 1),
             "content_themes": ["lifestyle", "daily inspiration", "authentic content"]
-        })
+        }
     
-    async def _generate_message_parts(self, influencer_data: Dict, brand_data: Dict, brand_tone: str, message_type: str) -> Dict[str, str]:
+    async def _generate_message_parts(self, influencer_data: Dict, brand_context: Dict, message_type: str) -> Dict[str, str]:
         """Generate individual message components"""
         await asyncio.sleep(0.3)
         
-        template = self.templates[brand_tone]
-        name = influencer_data.get("name", "there")
+        personal_reference, value_proposition = await asyncio.gather(
+            self._generate_personal_reference(influencer_data, brand_context),
+            self._generate_value_proposition(brand_context, influencer_data)
+        )
+        return self._render_parts(influencer_data, brand_context, personal_reference, value_proposition)
+    
+    def _render_parts(self, influencer_data: Dict, brand_context: Dict, personal_reference: str,
+                      value_proposition: str) -> Dict[str, str]:
+        """Pick a variant per section of the tone's render plan and fill its slots"""
+        plan = self._plans[brand_context["brand_tone"]]
         category = influencer_data.get("category", "lifestyle")
-        
-        # Get content focus for personalization
-        content_focus = random.choice(self.content_references.get(category, ["content"]))
-        
-        # Generate each part
-        parts = {
-            "greeting": random.choice(template["greeting"]).format(name=name),
-            "opening": random.choice(template["opening"]),
-            "compliment": random.choice(template["compliment"]).format(content_focus=content_focus),
-            "personal_reference": await self._generate_personal_reference(influencer_data),
-            "brand_introduction": await self._generate_brand_introduction(brand_data, brand_tone),
-            "proposal": random.choice(template["proposal"]),
-            "value_proposition": await self._generate_value_proposition(brand_data, influencer_data),
-            "call_to_action": await self._generate_call_to_action(brand_tone),
-            "closing": random.choice(template["closing"])
+        values = {
+            "name": influencer_data.get("name", "there"),
+            # Get content focus for personalization
+            "content_focus": random.choice(self.content_references.get(category, ["content"]))
+        }
+        return {
+            "greeting": random.choice(plan["greeting"]).render(values),
+            "opening": random.choice(plan["opening"]).render(values),
+            "compliment": random.choice(plan["compliment"]).render(values),
+            "personal_reference": personal_reference,
+            "brand_introduction": brand_context["brand_introduction"],
+            "proposal": random.choice(plan["proposal"]).render(values),
+            "value_proposition": value_proposition,
+            "call_to_action": brand_context["call_to_action"],
+            "closing": random.choice(plan["closing"]).render(values)
         }
-        
-        return parts
     
-    async def _generate_personal_reference(self, influencer_data: Dict) -> str:
+    async def _generate_personal_reference(self, influencer_data: Dict, brand_context: Dict) -> str:
         """Generate a personal reference to recent content"""
-        await asyncio.sleep(0.1)
-        
+        reference = self._personal_reference(influencer_data)
+        if self.inference is None or not reference:
+            await asyncio.sleep(0.1)
+            return reference
+        
+        return await self.inference.complete(
+            f"Creator: {influencer_data.get('name', '')} ({influencer_data.get('platform', '')}, "
+            f"{influencer_data.get('category', '')}).\nRecent post: {influencer_data.get('recent_post', '')}\n"
+            "Write one warm sentence referencing this post.",
+            prefix=brand_context["prompt_prefix"],
+            max_tokens=48,
+            default=reference
+        )
+    
+    def _personal_reference(self, influencer_data: Dict) -> str:
+        """Rule-based reference to the creator's recent content"""
         recent_post = influencer_data.get("recent_post", "")
         platform = influencer_data.get("platform", "instagram")
         
@@ -269,12 +491,12 @@ class MessageGenerator:
         else:
             return "I saw your recent post and it perfectly captures what we love about your content!"
     
-    async def _generate_brand_introduction(self, brand_data: Dict, brand_tone: str) -> str:
+    async def _generate_brand_introduction(self, brand_context: Dict, brand_tone: str) -> str:
         """Generate brand introduction"""
         await asyncio.sleep(0.1)
         
-        product_name = brand_data.get("productName", "our brand")
-        product_description = brand_data.get("productDescription", "")
+        product_name = brand_context["product_name"] or "our brand"
+        product_description = brand_context["product_description"]
         
         if brand_tone == "professional":
             return f"I'm reaching out from {product_name}. {product_description[:100]}..."
@@ -285,21 +507,28 @@ class MessageGenerator:
         else:  # playful
             return f"I'm with the awesome team at {product_name}! We're doing some cool stuff with {product_description[:70]}..."
     
-    async def _generate_value_proposition(self, brand_data: Dict, influencer_data: Dict) -> str:
+    async def _generate_value_proposition(self, brand_context: Dict, influencer_data: Dict) -> str:
         """Generate value proposition for the collaboration"""
-        await asyncio.sleep(0.1)
-        
-        campaign_goal = brand_data.get("campaignGoal", "awareness")
+        proposition = self._value_proposition(brand_context, influencer_data)
+        if self.inference is None:
+            await asyncio.sleep(0.1)
+            return proposition
+        
+        return await self.inference.complete(
+            f"Creator: {influencer_data.get('name', '')}, {influencer_data.get('follower_count', 0)} followers, "
+            f"{influencer_data.get('engagement_rate', 0)}% engagement.\n"
+            "Write two sentences on what this collaboration offers the creator.",
+            prefix=brand_context["prompt_prefix"],
+            max_tokens=64,
+            default=proposition
+        )
+    
+    def _value_proposition(self, brand_context: Dict, influencer_data: Dict) -> str:
+        """Rule-based value proposition for the campaign goal and creator reach"""
+        campaign_goal = brand_context["campaign_goal"]
         follower_count = influencer_data.get("follower_count", 0)
         
-        value_props = {
-            "awareness": "This collaboration would help introduce our brand to your amazing community while providing your followers with products they'll genuinely love.",
-            "sales": "We're looking for authentic partnerships that drive real value for both your audience and our brand.",
-            "ugc": "We'd love to work with you to create authentic content that showcases our products in your unique style.",
-            "engagement": "This partnership would create engaging content that resonates with your audience while highlighting our brand values."
-        }
-        
-        base_prop = value_props.get(campaign_goal, value_props["awareness"])
+        base_prop = VALUE_PROPOSITIONS.get(campaign_goal, VALUE_PROPOSITIONS["awareness"])
         
         # Add follower-specific benefits
         if follower_count > 100000:
@@ -313,75 +542,45 @@ class MessageGenerator:
         """Generate appropriate call to action"""
         await asyncio.sleep(0.05)
         
-        ctas = {
-            "professional": "Would you be available for a brief call this week to discuss the details?",
-            "friendly": "Would you be up for a quick chat about this? I'd love to hear your thoughts!",
-            "luxury": "I would be delighted to arrange a call to discuss this exclusive opportunity.",
-            "playful": "Want to hop on a call and brainstorm some amazing content ideas together?"
-        }
-        
-        return ctas.get(brand_tone, ctas["friendly"])
+        return CALLS_TO_ACTION.get(brand_tone, CALLS_TO_ACTION["friendly"])
     
-    async def _generate_subject_line(self, influencer_data: Dict, brand_data: Dict, message_type: str) -> str:
+    async def _generate_subject_line(self, influencer_data: Dict, brand_context: Dict, message_type: str) -> str:
         """Generate compelling subject line"""
         await asyncio.sleep(0.1)
         
-        name = influencer_data.get("name", "Creator")
-        product_name = brand_data.get("productName", "Brand")
-        brand_tone = brand_data.get("brandTone", "friendly")
-        
-        subject_templates = {
-            "professional": [
-                f"Collaboration Opportunity - {product_name} x {name}",
-                f"Partnership Proposal for {name}",
-                f"Brand Collaboration Inquiry - {product_name}"
-            ],
-            "friendly": [
-                f"Hey {name}! Collaboration opportunity 🌟",
-                f"Would love to work with you, {name}! ✨",
-                f"Exciting partnership idea for you, {name}!"
-            ],
-            "luxury": [
-                f"Exclusive Partnership Opportunity - {product_name}",
-                f"Premium Collaboration Proposal for {name}",
-                f"Luxury Brand Partnership - {product_name}"
-            ],
-            "playful": [
-                f"Let's create something amazing together, {name}! 🎉",
-                f"Epic collab opportunity for you! 🚀",
-                f"Ready to make some magic, {name}? ✨"
-            ]
+        return self._render_subject(influencer_data, brand_context)
+    
+    def _render_subject(self, influencer_data: Dict, brand_context: Dict) -> str:
+        subjects = self._subjects.get(brand_context["brand_tone"], self._subjects["friendly"])
+        return random.choice(subjects).render({
+            "name": influencer_data.get("name", "Creator"),
+            "product_name": brand_context["product_name"] or "Brand"
+        })
+    
+    def _require_template(self, template_id: Optional[str]):
+        if template_id is not None and self.engine.get(template_id) is None:
+            raise TemplateError(f"Unknown message template: {template_id}")
+    
+    def _template_values(self, influencer_data: Dict, brand_context: Dict, parts: Dict[str, str],
+                         subject: str) -> Dict[str, Any]:
+        """Slot values available to custom templates: generated parts plus influencer and brand fields"""
+        return {
+            **parts,
+            "subject": subject,
+            "name": influencer_data.get("name", "there"),
+            "username": influencer_data.get("username", ""),
+            "platform": influencer_data.get("platform", ""),
+            "category": influencer_data.get("category", ""),
+            "recent_post": influencer_data.get("recent_post", ""),
+            "product_name": brand_context["product_name"],
+            "product_description": brand_context["product_description"],
+            "campaign_goal": brand_context["campaign_goal"],
+            "signature": "\n".join(SIGNATURE)
         }
-        
-        templates = subject_templates.get(brand_tone, subject_templates["friendly"])
-        return random.choice(templates)
     
     def _assemble_message(self, parts: Dict[str, str]) -> str:
         """Assemble the final message from parts"""
-        message_parts = [
-            parts["greeting"],
-            "",  # Empty line
-            parts["opening"],
-            "",
-            parts["compliment"],
-            parts["personal_reference"],
-            "",
-            parts["brand_introduction"],
-            "",
-            parts["proposal"],
-            parts["value_proposition"],
-            "",
-            parts["call_to_action"],
-            "",
-            parts["closing"],
-            "",
-            "Best regards,",
-            "The ICY Team"
-        ]
-        
-        # Remove empty parts and join
-        filtered_parts = [part for part in message_parts if part is not None and part != ""]
-        return "\n".join(filtered_parts)
+        return "\n".join([parts[section] for section in MESSAGE_SECTIONS if parts[section]] + list(SIGNATURE))
     
     def _calculate_personalization_score(self, parts: Dict[str, str], influencer_data: Dict) -> float:
         """Calculate how personalized the message is"""
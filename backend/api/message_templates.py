@@ -0,0 +1,105 @@
+"""
+Message Template Engine
+Outreach templates compiled once into render plans of static text and slot indexes
+"""
+
+from string import Formatter
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+
+class TemplateError(ValueError):
+    """Raised for a template that cannot be compiled or is not registered"""
+
+
+class CompiledTemplate:
+    """A {slot}-style template parsed into pre-split static text and slot indexes
+
+    Rendering is one C-level %-format pass over the static text, with slot values
+    looked up by index; slots missing from the values render as an empty string.
+    """
+
+    __slots__ = ("source", "slots", "slot_indexes", "static", "_format")
+
+    def __init__(self, source: str):
+        self.source = source
+        static: List[str] = []
+        slots: List[str] = []
+        slot_indexes: List[int] = []
+        try:
+            parsed = list(Formatter().parse(source))
+        except ValueError as e:
+            raise TemplateError(f"Invalid template {source!r}: {e}")
+        text = ""
+        for literal, field, spec, conversion in parsed:
+            text += literal
+            if field is None:
+                continue
+            if not field.isidentifier() or spec or conversion:
+                raise TemplateError(f"Unsupported slot {{{field}}} in {source!r}; use plain {{name}} slots")
+            if field not in slots:
+                slots.append(field)
+            slot_indexes.append(slots.index(field))
+            static.append(text)
+            text = ""
+        static.append(text)
+        # Static text surrounds the slots: len(static) == len(slot_indexes) + 1
+        self.static = tuple(static)
+        self.slots = tuple(slots)
+        self.slot_indexes = tuple(slot_indexes)
+        self._format = "%s".join(part.replace("%", "%%") for part in static)
+
+    def render(self, values: Mapping[str, Any]) -> str:
+        if not self.slots:
+            return self._format % ()
+        looked_up = [values.get(slot, "") for slot in self.slots]
+        return self._format % tuple(looked_up[index] for index in self.slot_indexes)
+
+
+class TemplateEngine:
+    """Compiles templates once (by source text) and holds custom templates registered at runtime"""
+
+    def __init__(self):
+        self._compiled: Dict[str, CompiledTemplate] = {}
+        self._custom: Dict[str, Dict[str, Any]] = {}
+
+    def compile(self, source: str) -> CompiledTemplate:
+        compiled = self._compiled.get(source)
+        if compiled is None:
+            compiled = self._compiled[source] = CompiledTemplate(source)
+        return compiled
+
+    def compile_variants(self, sources: Mapping[str, List[str]]) -> Dict[str, Tuple[CompiledTemplate, ...]]:
+        """Render plan for one tone: section -> compiled variants"""
+        return {section: tuple(self.compile(source) for source in variants) for section, variants in sources.items()}
+
+    def register(self, template: Any) -> Dict[str, Any]:
+        """Compile and store a MessageTemplate (or an equivalent dict), replacing one with the same id"""
+        record = template.model_dump() if hasattr(template, "model_dump") else dict(template)
+        compiled = {
+            **record,
+            "subject": self.compile(record["subject_line"]),
+            "body": self.compile(record["message_body"])
+        }
+        compiled["slots"] = sorted(set(compiled["subject"].slots) | set(compiled["body"].slots))
+        self._custom[record["id"]] = compiled
+        return compiled
+
+    def unregister(self, template_id: str) -> bool:
+        return self._custom.pop(template_id, None) is not None
+
+    def get(self, template_id: str) -> Optional[Dict[str, Any]]:
+        return self._custom.get(template_id)
+
+    def render(self, template_id: str, values: Mapping[str, Any]) -> Tuple[str, str]:
+        """(subject, body) of a registered template"""
+        template = self._custom.get(template_id)
+        if template is None:
+            raise TemplateError(f"Unknown message template: {template_id}")
+        return template["subject"].render(values), template["body"].render(values)
+
+    def templates(self) -> List[Dict[str, Any]]:
+        """Registered templates without their compiled forms"""
+        return [
+            {key: value for key, value in template.items() if key not in ("subject", "body")}
+            for template in self._custom.values()
+        ]
@@ -0,0 +1,69 @@
+"""
+Outreach Provider Module
+Delivery channels for outreach messages (simulated), sending in batches with idempotency keys
+"""
+
+import asyncio
+import random
+import uuid
+from typing import Any, Dict, List
+
+# Channel used to reach creators on each platform
+PROVIDER_FOR_PLATFORM = {
+    "instagram": "instagram_dm",
+    "youtube": "email"
+}
+
+
+class SimulatedOutreachProvider:
+    """Stand-in for an email / direct-message API with a batch send endpoint
+
+    send_batch() takes up to max_batch_size messages per call. Each message carries an
+    idempotency key; a key that was already delivered returns its original delivery
+    instead of sending again, as real providers do for retried requests.
+    """
+
+    def __init__(self, name: str, max_batch_size: int = 50, latency: float = 1.0,
+                 per_message_latency: float = 0.005, failure_rate: float = 0.25,
+                 permanent_failure_rate: float = 0.01):
+        self.name = name
+        self.max_batch_size = max_batch_size
+        self.latency = latency
+        self.per_message_latency = per_message_latency
+        self.failure_rate = failure_rate
+        self.permanent_failure_rate = permanent_failure_rate
+        self._delivered: Dict[str, str] = {}
+        self.calls = 0
+        self.sent = 0
+        self.duplicates_suppressed = 0
+
+    async def send_batch(self, messages: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Per idempotency key: {"status": "sent", "provider_message_id"} or {"status": "error", "retryable", "error"}"""
+        self.calls += 1
+        await asyncio.sleep(self.latency + self.per_message_latency * len(messages))
+
+        results = {}
+        for message in messages:
+            key = message["idempotency_key"]
+            if key in self._delivered:
+                self.duplicates_suppressed += 1
+                results[key] = {"status": "sent", "provider_message_id": self._delivered[key]}
+                continue
+            roll = random.random()
+            if roll < self.permanent_failure_rate:
+                results[key] = {"status": "error", "retryable": False, "error": "Recipient address rejected"}
+            elif roll < self.permanent_failure_rate + self.failure_rate:
+                results[key] = {"status": "error", "retryable": True, "error": "Influencer inbox full or unavailable"}
+            else:
+                provider_message_id = self._delivered[key] = f"{self.name}_{uuid.uuid4().hex[:16]}"
+                self.sent += 1
+                results[key] = {"status": "sent", "provider_message_id": provider_message_id}
+        return results
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_batch_size": self.max_batch_size,
+            "calls": self.calls,
+            "sent": self.sent,
+            "duplicates_suppressed": self.duplicates_suppressed
+        }
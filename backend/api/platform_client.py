@@ -0,0 +1,293 @@
+"""
+Platform Client Base Module
+Shared call path for social platform clients (rate limiting, call policies and HTTP access)
+"""
+
+import asyncio
+import functools
+import hashlib
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+import httpx
+
+from core.adaptive_limiter import AdaptiveLimiter
+from core.batch_loader import BatchLoader
+from core.cache import TieredCache
+from core.http_transport import HTTPTransport
+from core.rate_limiter import RateLimiter
+from core.resilience import Resilience
+from core.serialization import dumps
+
+
+class PlatformAPIError(Exception):
+    """Base error raised by platform client calls"""
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class CircuitOpenError(PlatformAPIError):
+    """Raised without calling upstream while an endpoint's circuit breaker is open"""
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message, status_code=503)
+        self.retry_after = retry_after
+
+
+def platform_call(endpoint: Optional[str] = None):
+    """Route a client method through PlatformClient._call under an endpoint name"""
+    def decorator(fn: Callable):
+        name = endpoint or fn.__name__
+
+        @functools.wraps(fn)
+        async def wrapper(self, *args, **kwargs):
+            return await self._call(name, fn, args, kwargs)
+
+        wrapper.endpoint = name
+        return wrapper
+    return decorator
+
+
+class PlatformClient:
+    """Base class for platform API clients"""
+
+    platform = "generic"
+    base_url = ""
+    # Seconds a response stays cached, per endpoint; endpoints not listed are never cached
+    cache_ttls: Dict[str, float] = {}
+    # Seconds past its TTL a cached response may still be served while it is refreshed
+    cache_stale_ttls: Dict[str, float] = {}
+
+    def __init__(self, credential: str, rate_limiter: Optional[RateLimiter] = None,
+                 transport: Optional[HTTPTransport] = None, resilience: Optional[Resilience] = None,
+                 concurrency: Optional[AdaptiveLimiter] = None, cache: Optional[TieredCache] = None):
+        self.credential = credential
+        self.rate_limiter = rate_limiter or RateLimiter()
+        # Hedging and circuit breaking per endpoint
+        self.resilience = resilience or Resilience()
+        # Optional adaptive cap on in-flight upstream calls
+        self.concurrency = concurrency
+        # Optional shared response cache
+        self.cache = cache
+        # Without a transport the client serves simulated data
+        self.transport = transport
+        self.loaders: Dict[str, BatchLoader] = {}
+
+    @property
+    def live(self) -> bool:
+        """Whether calls go over HTTP instead of returning simulated data"""
+        return self.transport is not None
+
+    def _auth_params(self) -> Dict[str, str]:
+        """Query parameters that authenticate a request"""
+        return {}
+
+    async def _get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """GET a path (or absolute URL) through the shared transport and decode the JSON body"""
+        url = path if path.startswith("http") else f"{self.base_url}{path}"
+        query = {**self._auth_params(), **{k: v for k, v in (params or {}).items() if v is not None}}
+        try:
+            response = await self.transport.request("GET", url, params=query)
+        except httpx.HTTPError as e:
+            raise PlatformAPIError(f"{self.platform} request to {path} failed: {e!r}") from e
+        if response.status_code >= 400:
+            raise PlatformAPIError(
+                f"{self.platform} API returned {response.status_code} for {path}",
+                status_code=response.status_code
+            )
+        return response.json()
+
+    def _loader(self, name: str, batch_fn: Callable, max_batch_size: int = 50) -> BatchLoader:
+        """Register a batch loader that coalesces per-id lookups into batch_fn calls
+
+        Per-id results share cache entries with the single-id endpoint of the same name.
+        """
+        loader = BatchLoader(batch_fn, max_batch_size=max_batch_size)
+        if self.cache is not None and name in self.cache_ttls:
+            loader.cache = self.cache
+            loader.cache_ttl = self.cache_ttls[name]
+            loader.cache_key = lambda key: self._cache_key(name, (key,), {})
+            loader.cache_stale_ttl = self.cache_stale_ttls.get(name, 0.0)
+        self.loaders[name] = loader
+        return loader
+
+    async def refresh_loader_keys(self, name: str, keys: List[Hashable], refresh_ahead: float = 0.2) -> int:
+        """Re-fetch cached loader entries that are stale or within refresh_ahead of their TTL
+
+        Due keys are fetched with the loader's batch call, so refreshing many creators costs
+        a handful of upstream requests. Returns the number of entries refreshed.
+        """
+        loader = self.loaders.get(name)
+        if loader is None or loader.cache is None:
+            return 0
+        margin = loader.cache_ttl * refresh_ahead
+        due = [key for key in keys if await loader.cache.fresh_for(loader.cache_key(key)) < margin]
+        refreshed = 0
+        for start in range(0, len(due), loader.max_batch_size):
+            chunk = due[start:start + loader.max_batch_size]
+            results = await loader.batch_fn(chunk)
+            for key in chunk:
+                if key in results:
+                    await loader.cache.put(loader.cache_key(key), results[key],
+                                           loader.cache_ttl, loader.cache_stale_ttl)
+                    refreshed += 1
+        return refreshed
+
+    def enrichment_plan(self, influencer: Dict, content_limit: int) -> Dict[str, tuple]:
+        """Calls that fetch a creator's profile, recent content and audience: name -> (fn, *args)"""
+        return {}
+
+    def detail_plan(self, influencer_id: str, content_limit: int) -> Dict[str, tuple]:
+        """Calls behind a creator detail view (profile, content, audience, analytics): name -> (fn, *args)"""
+        return {}
+
+    async def enrich(self, influencer: Dict, content_limit: int, include_content: bool = True) -> Dict[str, Any]:
+        """Fetch enrichment data for a creator; a failed part is None rather than an error"""
+        plan = self.enrichment_plan(influencer, content_limit)
+        if not include_content:
+            plan.pop("content", None)
+        results = await asyncio.gather(
+            *(call(*args) for call, *args in plan.values()), return_exceptions=True
+        )
+        enrichment = {"profile": None, "content": None, "audience": None}
+        for name, result in zip(plan, results):
+            enrichment[name] = None if isinstance(result, Exception) else result
+        return enrichment
+
+    def format_profile(self, profile: Dict) -> Dict:
+        """Normalize a platform profile into the influencer record used across the app"""
+        return self._format_influencer_data(profile)
+
+    def _format_influencer_data(self, influencer: Dict) -> Dict:
+        return influencer
+
+    def loader_stats(self) -> Dict[str, Any]:
+        """Coalescing stats for each registered loader"""
+        return {name: loader.stats() for name, loader in self.loaders.items()}
+
+    def budget_mode(self) -> str:
+        """normal, conserve or exhausted; platforms with call budgets override this"""
+        return "normal"
+
+    def _should_hedge(self, endpoint: str) -> bool:
+        """Whether duplicate calls to an endpoint are acceptable; costly endpoints override this"""
+        return True
+
+    def _on_call(self, endpoint: str):
+        """Hook run once the breaker admits a call; raise PlatformAPIError to refuse it"""
+
+    def _on_hedge(self, endpoint: str):
+        """Hook run before a hedge is sent; raise PlatformAPIError to skip the hedge"""
+
+    def _is_upstream_failure(self, error: BaseException) -> bool:
+        """Errors that indicate a degraded upstream and count towards opening the circuit"""
+        if isinstance(error, asyncio.TimeoutError):
+            return True
+        if isinstance(error, PlatformAPIError):
+            return error.status_code is None or error.status_code >= 500 or error.status_code == 429
+        return False
+
+    def _cache_key(self, endpoint: str, args: tuple, kwargs: Dict[str, Any]) -> str:
+        """Cache key for a call: platform, endpoint and a digest of its arguments"""
+        digest = hashlib.blake2b(dumps([args, kwargs], sort_keys=True), digest_size=12).hexdigest()
+        return f"{self.platform}:{endpoint}:{digest}"
+
+    async def _call(self, endpoint: str, fn: Callable, args: tuple, kwargs: Dict[str, Any]) -> Any:
+        """Serve cacheable endpoints from the cache, invoking upstream only on a miss"""
+        ttl = self.cache_ttls.get(endpoint)
+        if self.cache is None or ttl is None:
+            return await self._invoke(endpoint, fn, args, kwargs)
+        return await self.cache.get_or_load(
+            self._cache_key(endpoint, args, kwargs), ttl, lambda: self._invoke(endpoint, fn, args, kwargs),
+            stale_ttl=self.cache_stale_ttls.get(endpoint, 0.0)
+        )
+
+    async def _invoke(self, endpoint: str, fn: Callable, args: tuple, kwargs: Dict[str, Any]) -> Any:
+        """Apply call policies around a single upstream call"""
+        breaker = self.resilience.breaker(endpoint)
+        if not breaker.allow():
+            raise CircuitOpenError(
+                f"{self.platform} {endpoint} is failing; circuit open", retry_after=breaker.retry_after()
+            )
+        try:
+            self._on_call(endpoint)
+        except PlatformAPIError:
+            # The call never went upstream, so a half-open probe slot is handed back
+            breaker.record_cancelled()
+            raise
+
+        counters = self.resilience.counters(endpoint)
+        counters["calls"] += 1
+        try:
+            result = await self._hedged_call(endpoint, fn, args, kwargs)
+        except asyncio.CancelledError:
+            breaker.record_cancelled()
+            raise
+        except Exception as e:
+            if self._is_upstream_failure(e):
+                counters["failures"] += 1
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+            raise
+        breaker.record_success()
+        return result
+
+    async def _attempt(self, endpoint: str, fn: Callable, args: tuple, kwargs: Dict[str, Any],
+                       acquire: bool = True) -> Any:
+        """One upstream attempt, timed once it holds a rate-limit token and an in-flight slot"""
+        if acquire:
+            await self.rate_limiter.acquire(self.platform, self.credential)
+        if self.concurrency is not None:
+            await self.concurrency.acquire()
+        started = time.monotonic()
+        failed = False
+        try:
+            result = await fn(self, *args, **kwargs)
+        except Exception as e:
+            failed = self._is_upstream_failure(e)
+            raise
+        finally:
+            elapsed = time.monotonic() - started
+            if self.concurrency is not None:
+                self.concurrency.release(elapsed, failed)
+        self.resilience.latency(endpoint).record(elapsed)
+        return result
+
+    async def _hedged_call(self, endpoint: str, fn: Callable, args: tuple, kwargs: Dict[str, Any]) -> Any:
+        """Run the call, sending one duplicate if it outlives the endpoint's hedge delay"""
+        await self.rate_limiter.acquire(self.platform, self.credential)
+        delay = self.resilience.hedge_delay(endpoint) if self._should_hedge(endpoint) else None
+        if delay is None:
+            return await self._attempt(endpoint, fn, args, kwargs, acquire=False)
+
+        primary = asyncio.ensure_future(self._attempt(endpoint, fn, args, kwargs, acquire=False))
+        hedge = None
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if done:
+                return primary.result()
+            try:
+                self._on_hedge(endpoint)
+            except PlatformAPIError:
+                return await primary
+
+            counters = self.resilience.counters(endpoint)
+            counters["hedges_issued"] += 1
+            hedge = asyncio.ensure_future(self._attempt(endpoint, fn, args, kwargs))
+            pending = {primary, hedge}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            counters["hedges_won"] += 1
+                        return task.result()
+            # Both attempts failed; surface the primary's error
+            return primary.result()
+        finally:
+            for task in (primary, hedge):
+                if task is not None and not task.done():
+                    task.cancel()
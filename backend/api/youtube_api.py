@@ -1,21 +1,84 @@
 """
 YouTube API Integration Module
-Simulates YouTube Data API v3 calls for influencer discovery and analysis
+Simulates YouTube Data API v3 calls for influencer discovery and analysis, or calls a
+Data API compatible server over HTTP when given a transport
 """
 
 import asyncio
+import base64
 import random
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 import json
 
-class YouTubeAPI:
+from core.adaptive_limiter import AdaptiveLimiter
+from core.cache import TieredCache
+from core.http_transport import HTTPTransport
+from core.rate_limiter import RateLimiter
+from core.resilience import Resilience
+from .platform_client import PlatformAPIError, PlatformClient, platform_call
+from .youtube_quota import QuotaBudget, SearchResultCache
+
+
+def offset_page_token(offset: int) -> str:
+    """Page token for a result offset, used when no token from a previous page is known"""
+    return base64.urlsafe_b64encode(f"offset:{offset}".encode()).decode()
+
+
+def page_token_offset(token: Optional[str]) -> int:
+    """Result offset encoded in a page token from offset_page_token"""
+    if not token:
+        return 0
+    return int(base64.urlsafe_b64decode(token.encode()).decode().split(":", 1)[1])
+
+class YouTubeAPI(PlatformClient):
     """Simulated YouTube API client"""
     
-    def __init__(self):
+    platform = "youtube"
+    
+    # Response cache lifetimes (seconds) per endpoint
+    cache_ttls = {
+        "get_channel_details": 3600,
+        "get_channel_videos": 900,
+        "get_recent_videos": 900,
+        "get_channel_analytics": 6 * 3600,
+        "get_video_comments": 600
+    }
+    # Channel data changes slowly, so a day-old copy beats waiting on the API
+    cache_stale_ttls = {
+        "get_channel_details": 24 * 3600,
+        "get_channel_videos": 6 * 3600,
+        "get_recent_videos": 6 * 3600,
+        "get_channel_analytics": 48 * 3600
+    }
+    
+    # channels.list accepts up to 50 ids per request
+    MAX_IDS_PER_LIST_CALL = 50
+    
+    def __init__(self, rate_limiter: Optional[RateLimiter] = None, quota: Optional[QuotaBudget] = None,
+                 transport: Optional[HTTPTransport] = None, base_url: Optional[str] = None,
+                 analytics_url: Optional[str] = None, resilience: Optional[Resilience] = None,
+                 concurrency: Optional[AdaptiveLimiter] = None,
+                 cache: Optional[TieredCache] = None):
         self.api_version = "v3"
-        self.base_url = "https://www.googleapis.com/youtube/v3"
+        self.base_url = base_url or "https://www.googleapis.com/youtube/v3"
+        self.analytics_url = analytics_url or "https://youtubeanalytics.googleapis.com/v2"
         self.api_key = "simulated_youtube_api_key"
+        super().__init__(
+            credential=self.api_key, rate_limiter=rate_limiter, transport=transport, resilience=resilience,
+            concurrency=concurrency, cache=cache
+        )
+        
+        # nextPageToken values seen in search responses, keyed by (query, offset)
+        self._page_tokens: Dict[Tuple[str, int], str] = {}
+        
+        # Daily quota-unit budget and reusable search results
+        self.quota = quota or QuotaBudget()
+        self.search_cache = SearchResultCache()
+        
+        # Per-id lookups are coalesced into multi-id requests
+        self.channel_loader = self._loader("get_channel_details", self.get_channels_details, self.MAX_IDS_PER_LIST_CALL)
+        self.analytics_loader = self._loader("get_channel_analytics", self.get_channels_analytics)
         
         # Mock YouTube influencer database
         self.mock_influencers = [
@@ -125,136 +188,166 @@ class YouTubeAPI:
     
     async def discover_influencers(self, brand_data: Dict, max_results: int = 25) -> List[Dict]:
         """Discover YouTube influencers based on brand criteria"""
+        return await self.discover_influencers_page(brand_data, 0, max_results)
+    
+    async def discover_influencers_page(self, brand_data: Dict, offset: int = 0, limit: int = 25) -> List[Dict]:
+        """Discover one page of YouTube influencers, reusing cached search pages"""
+        key = ("discover", self._search_query(brand_data), offset, limit)
+        cached = self.search_cache.get(key)
+        if cached is None:
+            cached = await self._search_influencers_page(brand_data, offset, limit)
+            self.search_cache.set(key, cached)
+        else:
+            self.quota.record_saving("discover_influencers_page")
+        
+        # Callers annotate results, so hand out copies of the cached page
+        return [dict(influencer) for influencer in cached]
+    
+    @platform_call("discover_influencers_page")
+    async def _search_influencers_page(self, brand_data: Dict, offset: int, limit: int) -> List[Dict]:
+        """Search one page of YouTube influencers based on brand criteria"""
+        if self.live:
+            query = self._search_query(brand_data)
+            page = await self._get("/search", {
+                "q": query,
+                "type": "channel",
+                "maxResults": limit,
+                "pageToken": self._page_tokens.get((query, offset)) or (offset_page_token(offset) if offset else None)
+            })
+            if page.get("nextPageToken"):
+                self._page_tokens[(query, offset + limit)] = page["nextPageToken"]
+            return [self._format_influencer_data(channel) for channel in page["items"]]
+        
         await asyncio.sleep(2.0)  # Simulate API delay
         
         discovered = []
-        
-        # Use existing mock data
-        for influencer in self.mock_influencers:
+        for index in range(offset, offset + limit):
+            if index < len(self.mock_influencers):
+                # Use existing mock data first
+                influencer = self.mock_influencers[index]
+            else:
+                # Generate additional random influencers
+                influencer = self._generate_mock_influencer(index - len(self.mock_influencers) + 200)
             discovered.append(self._format_influencer_data(influencer))
         
-        # Generate additional random influencers
-        additional_count = max_results - len(discovered)
-        for i in range(additional_count):
-            mock_influencer = self._generate_mock_influencer(i + 200)
-            discovered.append(self._format_influencer_data(mock_influencer))
-        
-        return discovered[:max_results]
+        return discovered
     
+    @platform_call()
     async def get_channel_details(self, channel_id: str) -> Dict[str, Any]:
         """Get YouTube channel details"""
+        if self.live:
+            page = await self._get("/channels", {"id": channel_id})
+            if not page["items"]:
+                raise PlatformAPIError(f"YouTube channel {channel_id} not found", status_code=404)
+            return page["items"][0]
+        
         await asyncio.sleep(0.6)
         
         # Find in mock data or generate
         for influencer in self.mock_influencers:
-            if influencer["channel_id"] == channel_id:
+            if channel_id in (influencer["channel_id"], influencer["id"]):
                 return influencer
         
         # Generate mock channel if not found
         return self._generate_mock_influencer(random.randint(2000, 9999))
     
+    async def get_channels_details(self, channel_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get details for many channels using one channels.list call per 50 ids"""
+        unique_ids = list(dict.fromkeys(channel_ids))
+        chunks = [
+            unique_ids[i:i + self.MAX_IDS_PER_LIST_CALL]
+            for i in range(0, len(unique_ids), self.MAX_IDS_PER_LIST_CALL)
+        ]
+        # Units avoided compared with one channels.list call per id
+        self.quota.record_saving("get_channel_details", len(unique_ids) - len(chunks))
+        
+        details: Dict[str, Dict[str, Any]] = {}
+        for chunk_details in await asyncio.gather(*(self._list_channels(chunk) for chunk in chunks)):
+            details.update(chunk_details)
+        return details
+    
+    @platform_call("get_channels_details")
+    async def _list_channels(self, channel_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch up to 50 channels in a single list call"""
+        if self.live:
+            page = await self._get("/channels", {"id": ",".join(channel_ids)})
+            return {channel["id"]: channel for channel in page["items"]}
+        
+        await asyncio.sleep(0.6)
+        
+        known = {}
+        for influencer in self.mock_influencers:
+            known[influencer["channel_id"]] = influencer
+            known[influencer["id"]] = influencer
+        
+        return {
+            channel_id: known.get(channel_id) or self._generate_mock_influencer(random.randint(2000, 9999))
+            for channel_id in channel_ids
+        }
+    
+    @platform_call()
     async def get_channel_videos(self, channel_id: str, max_results: int = 20) -> List[Dict]:
         """Get recent videos from a channel"""
-        await asyncio.sleep(1.0)
+        if self.live:
+            page = await self._get("/playlistItems", {"playlistId": channel_id, "maxResults": max_results})
+            return page["items"]
         
-        videos = []
-        for i in range(max_results):
-            video = {
-                "id": f"video_{channel_id}_{i}",
-                "title": self._generate_video_title(),
-                "description": self._generate_video_description(),
-                "published_at": (datetime.now() - timedelta(days=i*3)).isoformat(),
-                "duration": f"PT{random.randint(5, 45)}M{random.randint(10, 59)}S",
-                "view_count": random.randint(1000, 100000),
-                "like_count": random.randint(50, 5000),
-                "comment_count": random.randint(10, 800),
-                "thumbnail_url": f"https://img.youtube.com/vi/video_{channel_id}_{i}/maxresdefault.jpg",
-                "tags": self._generate_video_tags(),
-                "category_id": str(random.randint(1, 28))
-            }
-            videos.append(video)
+        await asyncio.sleep(1.0)
         
-        return videos
+        return self._generate_mock_videos(channel_id, max_results)
     
+    @platform_call()
     async def get_recent_videos(self, influencer_id: str, limit: int = 10) -> List[Dict]:
         """Get recent videos with engagement data"""
-        await asyncio.sleep(0.8)
+        if self.live:
+            page = await self._get("/activities", {"channelId": influencer_id, "maxResults": limit})
+            return page["items"]
         
-        videos = []
-        for i in range(limit):
-            video = {
-                "id": f"video_{influencer_id}_{i}",
-                "type": "youtube_video",
-                "title": self._generate_video_title(),
-                "description": self._generate_video_description(),
-                "engagement": {
-                    "views": random.randint(5000, 50000),
-                    "likes": random.randint(200, 3000),
-                    "comments": random.randint(20, 500),
-                    "shares": random.randint(10, 200),
-                    "subscribers_gained": random.randint(5, 100)
-                },
-                "published_at": (datetime.now() - timedelta(days=i*2)).isoformat(),
-                "duration_seconds": random.randint(300, 1800),
-                "tags": self._generate_video_tags(),
-                "category": random.choice(["Education", "Entertainment", "How-to", "Review"])
-            }
-            videos.append(video)
+        await asyncio.sleep(0.8)
         
-        return videos
+        return self._generate_mock_recent_videos(influencer_id, limit)
     
+    @platform_call()
     async def get_channel_analytics(self, channel_id: str) -> Dict[str, Any]:
         """Get channel analytics and audience insights"""
+        if self.live:
+            report = await self._get(f"{self.analytics_url}/reports", {"ids": f"channel=={channel_id}"})
+            return report["reports"][channel_id]
+        
         await asyncio.sleep(1.5)
         
-        return {
-            "subscriber_growth": {
-                "last_30_days": random.randint(500, 5000),
-                "last_90_days": random.randint(1500, 15000),
-                "growth_rate": round(random.uniform(2.0, 15.0), 2)
-            },
-            "view_analytics": {
-                "total_views_last_30_days": random.randint(50000, 500000),
-                "avg_view_duration": f"{random.randint(3, 12)}:{random.randint(10, 59)}",
-                "audience_retention": round(random.uniform(45.0, 75.0), 1)
-            },
-            "demographics": {
-                "age_groups": {
-                    "13-17": random.randint(8, 20),
-                    "18-24": random.randint(25, 40),
-                    "25-34": random.randint(20, 35),
-                    "35-44": random.randint(10, 20),
-                    "45-54": random.randint(5, 15),
-                    "55+": random.randint(2, 10)
-                },
-                "gender": {
-                    "male": random.randint(40, 70),
-                    "female": random.randint(30, 60),
-                    "other": random.randint(1, 3)
-                },
-                "top_countries": [
-                    {"country": "United States", "percentage": random.randint(35, 55)},
-                    {"country": "United Kingdom", "percentage": random.randint(8, 15)},
-                    {"country": "Canada", "percentage": random.randint(6, 12)},
-                    {"country": "Australia", "percentage": random.randint(4, 8)},
-                    {"country": "Germany", "percentage": random.randint(3, 7)}
-                ]
-            },
-            "engagement_metrics": {
-                "avg_likes_per_video": random.randint(500, 5000),
-                "avg_comments_per_video": random.randint(50, 800),
-                "subscriber_engagement_rate": round(random.uniform(3.0, 12.0), 2),
-                "click_through_rate": round(random.uniform(4.0, 15.0), 2)
-            },
-            "revenue_estimates": {
-                "estimated_monthly_earnings": f"${random.randint(500, 15000):,}",
-                "cpm_range": f"${random.uniform(1.0, 8.0):.2f} - ${random.uniform(8.0, 15.0):.2f}",
-                "brand_deal_rate": f"${random.randint(1000, 25000):,} per video"
-            }
-        }
+        return self._generate_mock_channel_analytics()
+    
+    @platform_call()
+    async def get_channels_analytics(self, channel_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get analytics for many channels in one report query"""
+        if self.live:
+            report = await self._get(f"{self.analytics_url}/reports", {"ids": f"channel=={','.join(channel_ids)}"})
+            return report["reports"]
+        
+        await asyncio.sleep(1.5)
+        
+        return {channel_id: self._generate_mock_channel_analytics() for channel_id in channel_ids}
     
     async def search_channels(self, query: str, max_results: int = 25) -> List[Dict]:
+        """Search for channels based on query, reusing cached results"""
+        key = ("search", query.strip().lower(), max_results)
+        cached = self.search_cache.get(key)
+        if cached is None:
+            cached = await self._search_channels(query, max_results)
+            self.search_cache.set(key, cached)
+        else:
+            self.quota.record_saving("search_channels")
+        
+        return [dict(channel) for channel in cached]
+    
+    @platform_call("search_channels")
+    async def _search_channels(self, query: str, max_results: int) -> List[Dict]:
         """Search for channels based on query"""
+        if self.live:
+            page = await self._get("/search", {"q": query, "type": "channel", "maxResults": max_results})
+            return [self._format_influencer_data(channel) for channel in page["items"]]
+        
         await asyncio.sleep(1.2)
         
         results = []
@@ -275,23 +368,62 @@ class YouTubeAPI:
         
         return results
     
+    @platform_call()
     async def get_video_comments(self, video_id: str, max_results: int = 50) -> List[Dict]:
         """Get comments from a video"""
-        await asyncio.sleep(0.7)
+        if self.live:
+            page = await self._get("/commentThreads", {"videoId": video_id, "maxResults": max_results})
+            return page["items"]
         
-        comments = []
-        for i in range(max_results):
-            comment = {
-                "id": f"comment_{video_id}_{i}",
-                "author": f"User{random.randint(1000, 9999)}",
-                "text": self._generate_comment_text(),
-                "like_count": random.randint(0, 100),
-                "published_at": (datetime.now() - timedelta(days=random.randint(0, 30))).isoformat(),
-                "reply_count": random.randint(0, 10)
-            }
-            comments.append(comment)
+        await asyncio.sleep(0.7)
         
-        return comments
+        return self._generate_mock_comments(video_id, max_results)
+    
+    def budget_mode(self) -> str:
+        """Quota mode used by discovery to degrade before the budget runs out"""
+        return self.quota.mode()
+    
+    def _should_hedge(self, endpoint: str) -> bool:
+        """Only hedge cheap calls, and only while the quota is healthy"""
+        return self.quota.cost_of(endpoint) <= 2 and self.quota.mode() == "normal"
+    
+    def _on_hedge(self, endpoint: str):
+        """A hedge is a real upstream call, so it is charged like one"""
+        self.quota.charge(endpoint)
+    
+    def _on_call(self, endpoint: str):
+        """Charge quota units once the breaker admits the call, so rejected calls cost nothing"""
+        self.quota.charge(endpoint)
+    
+    def enrichment_plan(self, influencer: Dict, content_limit: int) -> Dict[str, tuple]:
+        """Profile and audience lookups go through batch loaders and resolve as multi-id calls"""
+        return {
+            "profile": (self.channel_loader.load, influencer["id"]),
+            "content": (self.get_channel_videos, influencer["id"], content_limit),
+            "audience": (self.analytics_loader.load, influencer["id"])
+        }
+    
+    def detail_plan(self, influencer_id: str, content_limit: int) -> Dict[str, tuple]:
+        """Audience and analytics share one batched analytics lookup"""
+        return {
+            "profile": (self.channel_loader.load, influencer_id),
+            "content": (self.get_recent_videos, influencer_id, content_limit),
+            "audience": (self._channel_audience, influencer_id),
+            "analytics": (self.analytics_loader.load, influencer_id)
+        }
+    
+    async def _channel_audience(self, channel_id: str) -> Optional[Dict[str, Any]]:
+        analytics = await self.analytics_loader.load(channel_id)
+        return analytics.get("demographics") if analytics else None
+    
+    def _auth_params(self) -> Dict[str, str]:
+        """Data API requests carry the API key as a query parameter"""
+        return {"key": self.api_key}
+    
+    def _search_query(self, brand_data: Dict) -> str:
+        """Normalized search.list query derived from brand criteria"""
+        interests = brand_data.get("target_interests") or brand_data.get("targetInterests") or ""
+        return " ".join(interests.lower().split())
     
     def _format_influencer_data(self, influencer: Dict) -> Dict:
         """Format influencer data for API response"""
@@ -357,6 +489,116 @@ class YouTubeAPI:
             ]
         }
     
+    def _generate_mock_channel_analytics(self) -> Dict[str, Any]:
+        """Generate mock channel analytics"""
+        return {
+            "subscriber_growth": {
+                "last_30_days": random.randint(500, 5000),
+                "last_90_days": random.randint(1500, 15000),
+                "growth_rate": round(random.uniform(2.0, 15.0), 2)
+            },
+            "view_analytics": {
+                "total_views_last_30_days": random.randint(50000, 500000),
+                "avg_view_duration": f"{random.randint(3, 12)}:{random.randint(10, 59)}",
+                "audience_retention": round(random.uniform(45.0, 75.0), 1)
+            },
+            "demographics": {
+                "age_groups": {
+                    "13-17": random.randint(8, 20),
+                    "18-24": random.randint(25, 40),
+                    "25-34": random.randint(20, 35),
+                    "35-44": random.randint(10, 20),
+                    "45-54": random.randint(5, 15),
+                    "55+": random.randint(2, 10)
+                },
+                "gender": {
+                    "male": random.randint(40, 70),
+                    "female": random.randint(30, 60),
+                    "other": random.randint(1, 3)
+                },
+                "top_countries": [
+                    {"country": "United States", "percentage": random.randint(35, 55)},
+                    {"country": "United Kingdom", "percentage": random.randint(8, 15)},
+                    {"country": "Canada", "percentage": random.randint(6, 12)},
+                    {"country": "Australia", "percentage": random.randint(4, 8)},
+                    {"country": "Germany", "percentage": random.randint(3, 7)}
+                ]
+            },
+            "engagement_metrics": {
+                "avg_likes_per_video": random.randint(500, 5000),
+                "avg_comments_per_video": random.randint(50, 800),
+                "subscriber_engagement_rate": round(random.uniform(3.0, 12.0), 2),
+                "click_through_rate": round(random.uniform(4.0, 15.0), 2)
+            },
+            "revenue_estimates": {
+                "estimated_monthly_earnings": f"${random.randint(500, 15000):,}",
+                "cpm_range": f"${random.uniform(1.0, 8.0):.2f} - ${random.uniform(8.0, 15.0):.2f}",
+                "brand_deal_rate": f"${random.randint(1000, 25000):,} per video"
+            }
+        }
+    
+    def _generate_mock_videos(self, channel_id: str, max_results: int) -> List[Dict]:
+        """Generate mock channel videos"""
+        videos = []
+        for i in range(max_results):
+            video = {
+                "id": f"video_{channel_id}_{i}",
+                "title": self._generate_video_title(),
+                "description": self._generate_video_description(),
+                "published_at": (datetime.now() - timedelta(days=i*3)).isoformat(),
+                "duration": f"PT{random.randint(5, 45)}M{random.randint(10, 59)}S",
+                "view_count": random.randint(1000, 100000),
+                "like_count": random.randint(50, 5000),
+                "comment_count": random.randint(10, 800),
+                "thumbnail_url": f"https://img.youtube.com/vi/video_{channel_id}_{i}/maxresdefault.jpg",
+                "tags": self._generate_video_tags(),
+                "category_id": str(random.randint(1, 28))
+            }
+            videos.append(video)
+        
+        return videos
+    
+    def _generate_mock_recent_videos(self, influencer_id: str, limit: int) -> List[Dict]:
+        """Generate mock videos with engagement data"""
+        videos = []
+        for i in range(limit):
+            video = {
+                "id": f"video_{influencer_id}_{i}",
+                "type": "youtube_video",
+                "title": self._generate_video_title(),
+                "description": self._generate_video_description(),
+                "engagement": {
+                    "views": random.randint(5000, 50000),
+                    "likes": random.randint(200, 3000),
+                    "comments": random.randint(20, 500),
+                    "shares": random.randint(10, 200),
+                    "subscribers_gained": random.randint(5, 100)
+                },
+                "published_at": (datetime.now() - timedelta(days=i*2)).isoformat(),
+                "duration_seconds": random.randint(300, 1800),
+                "tags": self._generate_video_tags(),
+                "category": random.choice(["Education", "Entertainment", "How-to", "Review"])
+            }
+            videos.append(video)
+        
+        return videos
+    
+    def _generate_mock_comments(self, video_id: str, max_results: int) -> List[Dict]:
+        """Generate mock video comments"""
+        comments = []
+        for i in range(max_results):
+            comment = {
+                "id": f"comment_{video_id}_{i}",
+                "author": f"User{random.randint(1000, 9999)}",
+                "text": self._generate_comment_text(),
+                "like_count": random.randint(0, 100),
+                "published_at": (datetime.now() - timedelta(days=random.randint(0, 30))).isoformat(),
+                "reply_count": random.randint(0, 10)
+            }
+            comments.append(comment)
+        
+        return comments
+    
     def _generate_video_title(self) -> str:
         """Generate a mock video title"""
         titles = [
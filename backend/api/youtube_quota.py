@@ -0,0 +1,141 @@
+"""
+YouTube Quota Module
+Tracks YouTube Data API quota units per call type against the daily budget
+"""
+
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from .platform_client import PlatformAPIError
+
+# Quota units charged per client endpoint (YouTube Data API v3 cost table)
+QUOTA_COSTS = {
+    "discover_influencers_page": 100,   # search.list
+    "search_channels": 100,             # search.list
+    "get_channel_details": 1,           # channels.list
+    "get_channels_details": 1,          # channels.list, up to 50 ids per call
+    "get_channel_videos": 2,            # playlistItems.list on the uploads playlist + videos.list
+    "get_recent_videos": 2,             # playlistItems.list + videos.list
+    "get_video_comments": 1,            # commentThreads.list
+    "get_channel_analytics": 0,         # YouTube Analytics API has its own quota
+    "get_channels_analytics": 0         # one report query for many channels
+}
+
+# The Data API quota day rolls over at midnight Pacific time
+QUOTA_TIMEZONE = ZoneInfo("America/Los_Angeles")
+
+
+class QuotaExceededError(PlatformAPIError):
+    """Raised when a call would exceed the remaining daily quota"""
+
+
+class QuotaBudget:
+    """Daily quota-unit budget with per-endpoint accounting"""
+
+    def __init__(self, daily_limit: int = 10000, conserve_ratio: float = 0.2,
+                 costs: Optional[Dict[str, int]] = None):
+        self.daily_limit = daily_limit
+        self.conserve_ratio = conserve_ratio
+        self.costs = {**QUOTA_COSTS, **(costs or {})}
+        self._day = self._quota_day()
+        self.used = 0
+        self.units_by_endpoint: Dict[str, int] = {}
+        self.calls_by_endpoint: Dict[str, int] = {}
+        self.rejected = 0
+        self.units_saved = 0
+
+    @staticmethod
+    def _quota_day() -> str:
+        return datetime.now(QUOTA_TIMEZONE).date().isoformat()
+
+    def _roll_over(self):
+        day = self._quota_day()
+        if day != self._day:
+            self._day = day
+            self.used = 0
+            self.units_by_endpoint.clear()
+            self.calls_by_endpoint.clear()
+            self.rejected = 0
+            self.units_saved = 0
+
+    def cost_of(self, endpoint: str) -> int:
+        """Quota units charged for one call to an endpoint"""
+        return self.costs.get(endpoint, 1)
+
+    @property
+    def remaining(self) -> int:
+        """Units left in the current quota day"""
+        self._roll_over()
+        return max(0, self.daily_limit - self.used)
+
+    def can_afford(self, endpoint: str, calls: int = 1) -> bool:
+        """Whether the given number of calls fits in the remaining budget"""
+        return self.cost_of(endpoint) * calls <= self.remaining
+
+    def charge(self, endpoint: str):
+        """Reserve units for one call, raising QuotaExceededError if unaffordable"""
+        units = self.cost_of(endpoint)
+        if units > self.remaining:
+            self.rejected += 1
+            raise QuotaExceededError(
+                f"YouTube quota exhausted: {endpoint} needs {units} units, {self.remaining} remaining"
+            )
+        self.used += units
+        self.units_by_endpoint[endpoint] = self.units_by_endpoint.get(endpoint, 0) + units
+        self.calls_by_endpoint[endpoint] = self.calls_by_endpoint.get(endpoint, 0) + 1
+
+    def record_saving(self, endpoint: str, calls: int = 1):
+        """Record units avoided by a cheaper plan or a cache hit"""
+        self.units_saved += self.cost_of(endpoint) * calls
+
+    def mode(self) -> str:
+        """normal, conserve (low budget) or exhausted (no room for a search)"""
+        remaining = self.remaining
+        if remaining < self.cost_of("search_channels"):
+            return "exhausted"
+        if remaining < self.daily_limit * self.conserve_ratio:
+            return "conserve"
+        return "normal"
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Budget, usage per call type and current mode"""
+        return {
+            "quota_day": self._day,
+            "daily_limit": self.daily_limit,
+            "used": self.used,
+            "remaining": self.remaining,
+            "mode": self.mode(),
+            "units_by_endpoint": dict(self.units_by_endpoint),
+            "calls_by_endpoint": dict(self.calls_by_endpoint),
+            "units_saved": self.units_saved,
+            "rejected_calls": self.rejected
+        }
+
+
+class SearchResultCache:
+    """Small TTL cache so repeated searches do not spend 100 units each"""
+
+    def __init__(self, ttl: float = 6 * 3600, max_entries: int = 512):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: Dict[Tuple, Tuple[float, List[Dict]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple) -> Optional[List[Dict]]:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            self._entries.pop(key, None)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: Tuple, results: List[Dict]):
+        if len(self._entries) >= self.max_entries:
+            # Drop the entry closest to expiry
+            oldest = min(self._entries, key=lambda k: self._entries[k][0])
+            del self._entries[oldest]
+        self._entries[key] = (time.monotonic() + self.ttl, results)
@@ -0,0 +1,12 @@
+"""
+ICY AI Influencer Platform - Core Infrastructure
+"""
+
+from .serialization import dumps, loads
+from .loop_monitor import EventLoopLagMonitor
+
+__all__ = [
+    "dumps",
+    "loads",
+    "EventLoopLagMonitor"
+]
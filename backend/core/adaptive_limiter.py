@@ -0,0 +1,135 @@
+"""
+Adaptive Limiter Module
+AIMD concurrency limit on in-flight upstream calls, driven by observed latency and errors
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+
+class AdaptiveLimiter:
+    """Additive-increase / multiplicative-decrease limit on concurrent calls
+
+    The limit grows by about one slot per limit's worth of healthy completions while
+    the limiter is busy, and shrinks by the backoff factor when a call fails or takes
+    longer than latency_tolerance times the no-load latency.
+    """
+
+    def __init__(self, name: str, initial_limit: int = 20, min_limit: int = 1, max_limit: int = 200,
+                 latency_tolerance: float = 2.0, backoff: float = 0.9, baseline_window: float = 60.0):
+        self.name = name
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_tolerance = latency_tolerance
+        self.backoff = backoff
+        self.baseline_window = baseline_window
+        self.in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        # No-load latency: the minimum observed over the current baseline window
+        self._baseline: Optional[float] = None
+        self._baseline_started = time.monotonic()
+        self._next_baseline: Optional[float] = None
+        self._last_decrease = 0.0
+
+        # Stats
+        self.completed = 0
+        self.failed = 0
+        self.increases = 0
+        self.decreases = 0
+        self.peak_limit = self.limit
+        self.history: Deque[Tuple[float, int]] = deque(maxlen=120)
+
+    async def acquire(self):
+        """Wait for an in-flight slot"""
+        if self.in_flight < int(self.limit) and not self._waiters:
+            self.in_flight += 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Slot was handed over just as the waiter was cancelled
+                self.in_flight -= 1
+                self._wake()
+            raise
+
+    def release(self, latency: float, failed: bool = False):
+        """Return a slot and adjust the limit from the call's outcome"""
+        self.in_flight -= 1
+        self._adjust(latency, failed)
+        self._wake()
+
+    def _wake(self):
+        while self._waiters and self.in_flight < int(self.limit):
+            future = self._waiters.popleft()
+            if future.done():
+                continue
+            self.in_flight += 1
+            future.set_result(None)
+
+    def _update_baseline(self, latency: float):
+        now = time.monotonic()
+        # Re-learn the baseline each window so a permanent upstream change is picked up
+        if now - self._baseline_started > self.baseline_window and self._next_baseline is not None:
+            self._baseline = self._next_baseline
+            self._next_baseline = None
+            self._baseline_started = now
+        self._next_baseline = latency if self._next_baseline is None else min(self._next_baseline, latency)
+        if self._baseline is None or latency < self._baseline:
+            self._baseline = latency
+
+    def _adjust(self, latency: float, failed: bool):
+        now = time.monotonic()
+        if failed:
+            self.failed += 1
+        else:
+            self.completed += 1
+            self._update_baseline(latency)
+
+        congested = failed or latency > self._baseline * self.latency_tolerance
+        if congested:
+            # One decrease per round trip, so a burst of slow calls from the same
+            # window only backs off once
+            if now - self._last_decrease < max(latency, self._baseline or 0.0):
+                return
+            self._last_decrease = now
+            new_limit = max(self.min_limit, self.limit * self.backoff)
+            if int(new_limit) < int(self.limit):
+                self.decreases += 1
+            self.limit = new_limit
+        elif self.in_flight + len(self._waiters) + 1 >= int(self.limit) / 2:
+            # Only grow while the limit is actually being used
+            new_limit = min(self.max_limit, self.limit + 1 / self.limit)
+            if int(new_limit) > int(self.limit):
+                self.increases += 1
+            self.limit = new_limit
+        else:
+            return
+
+        self.peak_limit = max(self.peak_limit, self.limit)
+        if not self.history or self.history[-1][1] != int(self.limit):
+            self.history.append((round(now, 3), int(self.limit)))
+
+    def stats(self) -> Dict[str, Any]:
+        """Current limit, utilisation and recent limit changes"""
+        started = self.history[0][0] if self.history else 0.0
+        return {
+            "limit": int(self.limit),
+            "min_limit": self.min_limit,
+            "max_limit": self.max_limit,
+            "peak_limit": int(self.peak_limit),
+            "in_flight": self.in_flight,
+            "waiting": sum(1 for future in self._waiters if not future.done()),
+            "baseline_latency_ms": round(self._baseline * 1000, 2) if self._baseline is not None else None,
+            "completed": self.completed,
+            "failed": self.failed,
+            "increases": self.increases,
+            "decreases": self.decreases,
+            # (seconds since first change, limit) pairs to watch the limit converge
+            "history": [(round(t - started, 2), limit) for t, limit in self.history]
+        }
@@ -0,0 +1,107 @@
+"""
+Batch Loader Module
+DataLoader-style coalescing of per-key lookups into multi-key upstream calls
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Set
+
+
+class BatchLoader:
+    """Collects load(key) calls over a short window and resolves them with one batch call"""
+
+    def __init__(self, batch_fn: Callable[[List[Hashable]], Awaitable[Dict[Hashable, Any]]],
+                 max_batch_size: int = 50, batch_window: float = 0.01,
+                 cache=None, cache_ttl: float = 0.0, cache_key: Optional[Callable[[Hashable], str]] = None,
+                 cache_stale_ttl: float = 0.0):
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.batch_window = batch_window
+        # Optional TieredCache consulted per key before a key joins a batch
+        self.cache = cache
+        self.cache_ttl = cache_ttl
+        self.cache_key = cache_key or str
+        # Seconds past cache_ttl a value may still be served while it is refreshed
+        self.cache_stale_ttl = cache_stale_ttl
+        self._pending: Dict[Hashable, asyncio.Future] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._running: Set[asyncio.Task] = set()
+
+        # Stats
+        self.loads = 0
+        self.deduplicated = 0
+        self.batches = 0
+        self.keys_loaded = 0
+        self.errors = 0
+
+    async def load(self, key: Hashable) -> Any:
+        """Resolve a single key from the cache or through the next batch call"""
+        if self.cache is not None:
+            return await self.cache.get_or_load(
+                self.cache_key(key), self.cache_ttl, lambda: self._load(key), stale_ttl=self.cache_stale_ttl
+            )
+        return await self._load(key)
+
+    async def _load(self, key: Hashable) -> Any:
+        self.loads += 1
+        future = self._pending.get(key)
+        if future is not None:
+            self.deduplicated += 1
+        else:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[key] = future
+            if len(self._pending) >= self.max_batch_size:
+                self._dispatch()
+            elif self._timer is None:
+                self._timer = loop.call_later(self.batch_window, self._dispatch)
+
+        # Shielded so one cancelled caller does not cancel the shared result
+        return await asyncio.shield(future)
+
+    async def load_many(self, keys: List[Hashable]) -> List[Any]:
+        """Resolve several keys, preserving order"""
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def _dispatch(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, {}
+        task = asyncio.get_running_loop().create_task(self._run_batch(batch))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _run_batch(self, batch: Dict[Hashable, asyncio.Future]):
+        self.batches += 1
+        self.keys_loaded += len(batch)
+        try:
+            results = await self.batch_fn(list(batch))
+        except Exception as e:
+            self.errors += 1
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        # Scatter results back to the waiting callers
+        for key, future in batch.items():
+            if future.done():
+                continue
+            if key in results:
+                future.set_result(results[key])
+            else:
+                future.set_exception(KeyError(key))
+
+    def stats(self) -> Dict[str, Any]:
+        """Coalescing counters"""
+        return {
+            "loads": self.loads,
+            "deduplicated": self.deduplicated,
+            "batches": self.batches,
+            "avg_batch_size": round(self.keys_loaded / self.batches, 2) if self.batches else 0.0,
+            "errors": self.errors,
+            "pending": len(self._pending)
+        }
@@ -0,0 +1,360 @@
+"""
+Cache Module
+Two-tier response cache: an in-process LRU (L1) in front of a shared Redis tier (L2),
+with compact binary values, stampede protection and stale-while-revalidate
+"""
+
+import asyncio
+import struct
+import time
+import uuid
+import zlib
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+from .rate_limiter import Priority, request_priority
+from .serialization import dumps, loads
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # Redis tier is optional; L1 and the in-memory backend still work
+    aioredis = None
+
+# Values at least this large are zlib-compressed before storage
+COMPRESS_THRESHOLD = 512
+_RAW = b"\x00"
+_ZLIB = b"\x01"
+
+# Compare-and-delete so a worker only releases a lock it still holds
+_RELEASE_LOCK = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+def encode(value: Any) -> bytes:
+    """orjson bytes, zlib-compressed above the threshold, behind a one-byte format tag"""
+    raw = dumps(value)
+    if len(raw) >= COMPRESS_THRESHOLD:
+        return _ZLIB + zlib.compress(raw, 6)
+    return _RAW + raw
+
+
+def decode(blob: bytes) -> Any:
+    """Inverse of encode"""
+    tag, body = blob[:1], blob[1:]
+    return loads(zlib.decompress(body) if tag == _ZLIB else body)
+
+
+# Stored entries are prefixed with the wall-clock time they stay fresh until,
+# so every worker agrees on when an L2 entry turns stale
+_FRESH_UNTIL = struct.Struct("!d")
+
+
+def _wrap(blob: bytes, fresh_until: float) -> bytes:
+    return _FRESH_UNTIL.pack(fresh_until) + blob
+
+
+def _unwrap(entry: bytes) -> Tuple[float, bytes]:
+    return _FRESH_UNTIL.unpack_from(entry)[0], entry[_FRESH_UNTIL.size:]
+
+
+class InMemoryBackend:
+    """Process-local stand-in for the Redis tier (tests, single-process deployments)"""
+
+    def __init__(self):
+        self._data: Dict[str, Tuple[bytes, float]] = {}
+
+    def _live(self, key: str) -> Optional[bytes]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if entry[1] < time.monotonic():
+            del self._data[key]
+            return None
+        return entry[0]
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self._live(key)
+
+    async def set(self, key: str, value: bytes, ttl: float):
+        self._data[key] = (value, time.monotonic() + ttl)
+
+    async def acquire_lock(self, key: str, token: str, ttl: float) -> bool:
+        if self._live(key) is not None:
+            return False
+        self._data[key] = (token.encode(), time.monotonic() + ttl)
+        return True
+
+    async def release_lock(self, key: str, token: str):
+        if self._live(key) == token.encode():
+            del self._data[key]
+
+    async def close(self):
+        self._data.clear()
+
+
+class RedisBackend:
+    """Shared L2 tier on Redis, so every worker sees the same cached responses"""
+
+    def __init__(self, url: str):
+        if aioredis is None:
+            raise RuntimeError("RedisBackend requires the redis package (pip install redis)")
+        self._redis = aioredis.from_url(url)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self._redis.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: float):
+        await self._redis.set(key, value, px=int(ttl * 1000))
+
+    async def acquire_lock(self, key: str, token: str, ttl: float) -> bool:
+        return bool(await self._redis.set(key, token, nx=True, px=int(ttl * 1000)))
+
+    async def release_lock(self, key: str, token: str):
+        await self._redis.eval(_RELEASE_LOCK, 1, key, token)
+
+    async def close(self):
+        await self._redis.close()
+
+
+class TieredCache:
+    """L1 LRU + optional shared L2 with single-flight loads and a cross-worker load lock
+
+    Entries are fresh for ttl seconds and may then be served stale for up to stale_ttl
+    more while a background refresh replaces them.
+    """
+
+    def __init__(self, l2=None, l1_max_entries: int = 10000, l1_max_ttl: float = 300.0,
+                 namespace: str = "icy", lock_ttl: float = 10.0, lock_wait: float = 5.0,
+                 max_background_refreshes: int = 16):
+        self.l2 = l2
+        self.l1_max_entries = l1_max_entries
+        # L1 entries expire sooner than L2 so workers converge on the shared copy
+        self.l1_max_ttl = l1_max_ttl
+        self.namespace = namespace
+        self.lock_ttl = lock_ttl
+        self.lock_wait = lock_wait
+        self._l1: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._refreshing: Set[str] = set()
+        self._refresh_tasks: Set[asyncio.Task] = set()
+        self._refresh_slots = asyncio.Semaphore(max_background_refreshes)
+
+        # Stats
+        self.l1_hits = 0
+        self.l2_hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.loads = 0
+        self.coalesced = 0
+        self.lock_waits = 0
+        self.refreshes = 0
+        self.scheduled_refreshes = 0
+        self.refresh_errors = 0
+        self.l2_errors = 0
+        self.stored_bytes = 0
+
+    def _l1_get(self, key: str) -> Optional[bytes]:
+        entry = self._l1.get(key)
+        if entry is None:
+            return None
+        if entry[1] < time.time():
+            del self._l1[key]
+            return None
+        self._l1.move_to_end(key)
+        return entry[0]
+
+    def _l1_set(self, key: str, entry: bytes, expires_at: float):
+        self._l1[key] = (entry, min(expires_at, time.time() + self.l1_max_ttl))
+        self._l1.move_to_end(key)
+        while len(self._l1) > self.l1_max_entries:
+            self._l1.popitem(last=False)
+
+    async def _l2_call(self, method: str, *args) -> Any:
+        """Call the L2 tier; a Redis outage degrades to L1-only rather than failing requests"""
+        if self.l2 is None:
+            return None
+        try:
+            return await getattr(self.l2, method)(*args)
+        except Exception:
+            self.l2_errors += 1
+            return None
+
+    async def _acquire_lock(self, lock_key: str, token: str) -> Optional[bool]:
+        """Whether the L2 load lock was taken, or None when L2 is unreachable"""
+        try:
+            return bool(await self.l2.acquire_lock(lock_key, token, self.lock_ttl))
+        except Exception:
+            self.l2_errors += 1
+            return None
+
+    async def _store(self, key: str, value: Any, ttl: float, stale_ttl: float) -> bytes:
+        now = time.time()
+        blob = encode(value)
+        self.stored_bytes += len(blob)
+        entry = _wrap(blob, now + ttl)
+        self._l1_set(key, entry, now + ttl + stale_ttl)
+        await self._l2_call("set", key, entry, ttl + stale_ttl)
+        return entry
+
+    async def _peek(self, key: str) -> Optional[bytes]:
+        """Entry from L1 or L2 without touching hit counters"""
+        entry = self._l1_get(key)
+        if entry is None:
+            entry = await self._l2_call("get", key)
+        return entry
+
+    async def get_or_load(self, key: str, ttl: float, loader: Callable[[], Awaitable[Any]],
+                          stale_ttl: float = 0.0) -> Any:
+        """Return the cached value for key, loading and storing it once on a miss
+
+        A stale entry is returned immediately and refreshed in the background.
+        """
+        key = f"{self.namespace}:{key}"
+        entry = self._l1_get(key)
+        if entry is not None:
+            self.l1_hits += 1
+            return self._serve(key, entry, ttl, stale_ttl, loader)
+
+        # Concurrent misses in this process share one load
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.coalesced += 1
+            return self._serve(key, await asyncio.shield(inflight), ttl, stale_ttl, loader)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            entry = await self._fill(key, ttl, stale_ttl, loader)
+            future.set_result(entry)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception retrieved when nobody else was waiting on it
+            future.exception()
+            raise
+        finally:
+            del self._inflight[key]
+        return self._serve(key, entry, ttl, stale_ttl, loader)
+
+    def _serve(self, key: str, entry: bytes, ttl: float, stale_ttl: float,
+               loader: Callable[[], Awaitable[Any]]) -> Any:
+        fresh_until, blob = _unwrap(entry)
+        if fresh_until < time.time():
+            self.stale_hits += 1
+            self._revalidate(key, ttl, stale_ttl, loader)
+        return decode(blob)
+
+    async def _fill(self, key: str, ttl: float, stale_ttl: float, loader: Callable[[], Awaitable[Any]]) -> bytes:
+        entry = await self._l2_call("get", key)
+        if entry is not None:
+            self.l2_hits += 1
+            fresh_until, _ = _unwrap(entry)
+            self._l1_set(key, entry, fresh_until + stale_ttl)
+            return entry
+
+        self.misses += 1
+        lock_key = f"{key}:lock"
+        token = uuid.uuid4().hex
+        # None: L2 is down, so load right away with only in-process single-flight
+        locked = True if self.l2 is None else await self._acquire_lock(lock_key, token)
+        if locked is False:
+            # Another worker is loading this key; wait for its result instead of stampeding
+            self.lock_waits += 1
+            deadline = time.monotonic() + self.lock_wait
+            delay = 0.01
+            while time.monotonic() < deadline:
+                await asyncio.sleep(delay)
+                entry = await self._l2_call("get", key)
+                if entry is not None:
+                    fresh_until, _ = _unwrap(entry)
+                    self._l1_set(key, entry, fresh_until + stale_ttl)
+                    return entry
+                delay = min(delay * 2, 0.2)
+
+        try:
+            self.loads += 1
+            return await self._store(key, await loader(), ttl, stale_ttl)
+        finally:
+            if locked and self.l2 is not None:
+                await self._l2_call("release_lock", lock_key, token)
+
+    def _revalidate(self, key: str, ttl: float, stale_ttl: float, loader: Callable[[], Awaitable[Any]]):
+        """Start one background refresh for a stale key"""
+        if key in self._refreshing:
+            return
+        self._refreshing.add(key)
+        # Refreshes never compete with interactive requests for platform rate limits
+        with request_priority(Priority.BACKGROUND):
+            task = asyncio.get_running_loop().create_task(self._refresh(key, ttl, stale_ttl, loader))
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    async def _refresh(self, key: str, ttl: float, stale_ttl: float, loader: Callable[[], Awaitable[Any]]):
+        lock_key = f"{key}:lock"
+        token = uuid.uuid4().hex
+        try:
+            async with self._refresh_slots:
+                # Skip when another worker is already refreshing this key
+                locked = True if self.l2 is None else await self._acquire_lock(lock_key, token)
+                if locked is False:
+                    return
+                try:
+                    await self._store(key, await loader(), ttl, stale_ttl)
+                    self.refreshes += 1
+                finally:
+                    if locked and self.l2 is not None:
+                        await self._l2_call("release_lock", lock_key, token)
+        except Exception:
+            # The stale copy keeps being served until a refresh succeeds or it expires
+            self.refresh_errors += 1
+        finally:
+            self._refreshing.discard(key)
+
+    async def put(self, key: str, value: Any, ttl: float, stale_ttl: float = 0.0):
+        """Store a freshly fetched value, e.g. from a scheduled refresh"""
+        self.scheduled_refreshes += 1
+        await self._store(f"{self.namespace}:{key}", value, ttl, stale_ttl)
+
+    async def fresh_for(self, key: str) -> float:
+        """Seconds until the entry for key turns stale (negative if stale or missing)"""
+        entry = await self._peek(f"{self.namespace}:{key}")
+        if entry is None:
+            return float("-inf")
+        fresh_until, _ = _unwrap(entry)
+        return fresh_until - time.time()
+
+    async def close(self):
+        for task in list(self._refresh_tasks):
+            task.cancel()
+        if self.l2 is not None:
+            await self.l2.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit rates per tier, stale serves and stampede-protection counters"""
+        lookups = self.l1_hits + self.l2_hits + self.misses + self.coalesced
+        stores = self.loads + self.refreshes + self.scheduled_refreshes
+        return {
+            "l2": type(self.l2).__name__ if self.l2 is not None else None,
+            "l1_entries": len(self._l1),
+            "l1_hits": self.l1_hits,
+            "l2_hits": self.l2_hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "loads": self.loads,
+            "lock_waits": self.lock_waits,
+            "background_refreshes": self.refreshes,
+            "scheduled_refreshes": self.scheduled_refreshes,
+            "refresh_errors": self.refresh_errors,
+            "refreshing": len(self._refreshing),
+            "l2_errors": self.l2_errors,
+            # Share of lookups answered without waiting on an upstream load
+            "hit_rate": round((lookups - self.loads) / lookups, 3) if lookups else 0.0,
+            "avg_value_bytes": round(self.stored_bytes / stores, 1) if stores else 0.0
+        }
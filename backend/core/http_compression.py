@@ -0,0 +1,227 @@
+"""
+HTTP Compression Module
+Negotiated brotli/gzip response compression and strong-ETag helpers for conditional requests
+"""
+
+import zlib
+from hashlib import blake2b
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - Brotli is listed in requirements.txt
+    brotli = None
+
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "text/")
+ENCODING_SUFFIXES = ("-br", "-gzip")
+
+
+def strong_etag(*parts: Any) -> str:
+    """Quoted strong ETag for a version made of the given parts (bytes are hashed as-is)"""
+    digest = blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part if isinstance(part, bytes) else str(part).encode())
+        digest.update(b"\0")
+    return f'"{digest.hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches etag, whatever encoding the client's copy was sent with"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        # If-None-Match uses the weak comparison, so W/ prefixes are ignored
+        candidate = candidate[2:] if candidate.startswith("W/") else candidate
+        for suffix in ENCODING_SUFFIXES:
+            if candidate.endswith(f'{suffix}"'):
+                candidate = candidate[:-len(suffix) - 1] + '"'
+                break
+        if candidate == etag:
+            return True
+    return False
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """br or gzip from an Accept-Encoding header, preferring brotli at equal quality"""
+    offered: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        offered[name.strip().lower()] = quality
+    available = ["br", "gzip"] if brotli is not None else ["gzip"]
+    choices = [(offered.get(name, offered.get("*", 0.0)), -rank, name) for rank, name in enumerate(available)]
+    quality, _, name = max(choices)
+    return name if quality > 0 else None
+
+
+class _Compressor:
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        self.encoding = encoding
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=brotli_quality)
+        else:
+            self._zlib = zlib.compressobj(gzip_level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        """Compressed bytes for data, flushed so the client can decode everything sent so far"""
+        if self.encoding == "br":
+            out = self._brotli.process(data)
+            return out + (self._brotli.finish() if final else self._brotli.flush())
+        out = self._zlib.compress(data)
+        return out + self._zlib.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+
+class CompressionStats:
+    """Bytes before and after compression per encoding, shared with the metrics endpoint"""
+
+    def __init__(self):
+        self.counters: Dict[str, Dict[str, int]] = {}
+        self.responses = 0
+
+    def count(self, encoding: str, raw: int, compressed: int):
+        counters = self.counters.setdefault(encoding, {"raw_bytes": 0, "compressed_bytes": 0})
+        counters["raw_bytes"] += raw
+        counters["compressed_bytes"] += compressed
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "compressed_responses": self.responses,
+            "encodings": {
+                encoding: {
+                    **counters,
+                    "ratio": round(counters["compressed_bytes"] / counters["raw_bytes"], 3)
+                    if counters["raw_bytes"] else None
+                }
+                for encoding, counters in self.counters.items()
+            }
+        }
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing JSON, NDJSON and text responses for clients that accept it
+
+    Bodies below minimum_size are sent as-is. Streaming bodies are compressed chunk by
+    chunk with a flush after each, so progress events still reach the client immediately.
+    Every response whose form depends on Accept-Encoding (compressible types and 304s)
+    gets Vary: Accept-Encoding, compressed or not; only compressed ones get an encoding
+    suffix on their ETag.
+    """
+
+    def __init__(self, app, minimum_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 4,
+                 stats: Optional[CompressionStats] = None):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.stats = stats or CompressionStats()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        accept = next((value.decode("latin-1") for key, value in scope["headers"] if key == b"accept-encoding"), "")
+        encoding = negotiate_encoding(accept) if accept else None
+        if encoding is None:
+            async def send_identity(message):
+                if message["type"] == "http.response.start" and self._negotiated(message):
+                    message = {**message, "headers": self._vary(message["headers"])}
+                await send(message)
+
+            await self.app(scope, receive, send_identity)
+            return
+        if_none_match = next(
+            (value.decode("latin-1") for key, value in scope["headers"] if key == b"if-none-match"), ""
+        )
+
+        start: Optional[Dict[str, Any]] = None
+        compressor: Optional[_Compressor] = None
+        passthrough = False
+
+        async def send_compressed(message):
+            nonlocal start, compressor, passthrough
+            if message["type"] == "http.response.start":
+                start = message
+                if start["status"] == 304:
+                    # Only a client whose copy was compressed holds the suffixed ETag to confirm
+                    start["headers"] = self._vary(self._tag(start["headers"], encoding, if_none_match))
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if compressor is None:
+                if not self._compressible(start["headers"]) or (not more_body and len(body) < self.minimum_size):
+                    passthrough = True
+                    if self._negotiated(start):
+                        start = {**start, "headers": self._vary(start["headers"])}
+                    await send(start)
+                    await send(message)
+                    return
+                compressor = _Compressor(encoding, self.gzip_level, self.brotli_quality)
+                compressed = compressor.compress(body, final=not more_body)
+                headers = [(key, value) for key, value in self._vary(self._tag(start["headers"], encoding))
+                           if key != b"content-length"]
+                headers.append((b"content-encoding", encoding.encode()))
+                if not more_body:
+                    headers.append((b"content-length", str(len(compressed)).encode()))
+                self.stats.responses += 1
+                await send({**start, "headers": headers})
+            else:
+                compressed = compressor.compress(body, final=not more_body)
+            self.stats.count(encoding, len(body), len(compressed))
+            await send({"type": "http.response.body", "body": compressed, "more_body": more_body})
+
+        await self.app(scope, receive, send_compressed)
+        if start is not None and compressor is None and not passthrough:
+            # Bodiless responses such as 304 never produced a body message
+            await send(start)
+
+    @staticmethod
+    def _compressible(headers: List[Tuple[bytes, bytes]]) -> bool:
+        content_type = ""
+        for key, value in headers:
+            if key == b"content-encoding":
+                return False
+            if key == b"content-type":
+                content_type = value.decode("latin-1")
+        return content_type.startswith(COMPRESSIBLE_TYPES)
+
+    @classmethod
+    def _negotiated(cls, start: Dict[str, Any]) -> bool:
+        """Whether Accept-Encoding could change this response, so caches must key on it"""
+        return start["status"] == 304 or cls._compressible(start["headers"])
+
+    @staticmethod
+    def _vary(headers: List[Tuple[bytes, bytes]]) -> List[Tuple[bytes, bytes]]:
+        """Headers with Accept-Encoding added to Vary, unless it is already listed"""
+        for key, value in headers:
+            if key == b"vary" and (value == b"*" or b"accept-encoding" in value.lower()):
+                return list(headers)
+        return [*headers, (b"vary", b"Accept-Encoding")]
+
+    @staticmethod
+    def _tag(headers: List[Tuple[bytes, bytes]], encoding: str,
+             if_none_match: Optional[str] = None) -> List[Tuple[bytes, bytes]]:
+        """Headers with a strong ETag made specific to the encoding, as representations differ
+
+        With if_none_match (a 304), the suffix is added only if the client sent the suffixed
+        tag, i.e. the copy it validated was the compressed representation.
+        """
+        tagged = []
+        for key, value in headers:
+            if key == b"etag" and value.endswith(b'"') and not value.startswith(b"W/"):
+                suffixed = value[:-1] + f'-{encoding}"'.encode()
+                if if_none_match is None or suffixed.decode("latin-1") in if_none_match:
+                    value = suffixed
+            tagged.append((key, value))
+        return tagged
@@ -0,0 +1,121 @@
+"""
+HTTP Transport Module
+Shared pooled async HTTP client with keep-alive, optional HTTP/2 and per-host connection limits
+"""
+
+import asyncio
+import importlib.util
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+# httpx only negotiates HTTP/2 when the h2 package is installed
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class HTTPTransport:
+    """One pooled httpx client shared by every platform client"""
+
+    def __init__(self, max_connections: int = 100, max_keepalive_connections: int = 50,
+                 keepalive_expiry: float = 30.0, per_host_limit: int = 20,
+                 timeout: float = 10.0, http2: Optional[bool] = None):
+        self.http2 = HTTP2_AVAILABLE if http2 is None else (http2 and HTTP2_AVAILABLE)
+        self.per_host_limit = per_host_limit
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self.timeout = httpx.Timeout(timeout)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+        self._hosts: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Underlying httpx client, created on first use"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(http2=self.http2, limits=self.limits, timeout=self.timeout)
+        return self._client
+
+    def _host(self, host: str) -> Dict[str, Any]:
+        if host not in self._hosts:
+            self._hosts[host] = {
+                "requests": 0,
+                "errors": 0,
+                "in_flight": 0,
+                "new_connections": 0,
+                "reused_connections": 0,
+                "status_classes": {},
+                "http_versions": {},
+                "seconds": 0.0
+            }
+            self._host_slots[host] = asyncio.Semaphore(self.per_host_limit)
+        return self._hosts[host]
+
+    async def request(self, method: str, url: str, params: Optional[Dict[str, Any]] = None,
+                      json: Any = None, headers: Optional[Dict[str, str]] = None) -> httpx.Response:
+        """Send one request, waiting for a free slot on the target host"""
+        host = urlsplit(url).netloc
+        stats = self._host(host)
+        connected = False
+
+        async def trace(event: str, info: Dict[str, Any]):
+            # A TCP connect means the pool had no idle keep-alive connection for this host
+            nonlocal connected
+            if event == "connection.connect_tcp.complete":
+                connected = True
+
+        async with self._host_slots[host]:
+            stats["in_flight"] += 1
+            started = time.perf_counter()
+            try:
+                response = await self.client.request(
+                    method, url, params=params, json=json, headers=headers,
+                    extensions={"trace": trace}
+                )
+            except httpx.HTTPError:
+                stats["errors"] += 1
+                raise
+            finally:
+                stats["in_flight"] -= 1
+                stats["seconds"] += time.perf_counter() - started
+
+        stats["requests"] += 1
+        stats["new_connections" if connected else "reused_connections"] += 1
+        status_class = f"{response.status_code // 100}xx"
+        stats["status_classes"][status_class] = stats["status_classes"].get(status_class, 0) + 1
+        stats["http_versions"][response.http_version] = stats["http_versions"].get(response.http_version, 0) + 1
+        return response
+
+    async def aclose(self):
+        """Close pooled connections"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool configuration plus per-host request, latency and connection-reuse counters"""
+        hosts = {}
+        for host, stats in self._hosts.items():
+            completed = stats["requests"]
+            hosts[host] = {
+                "requests": completed,
+                "errors": stats["errors"],
+                "in_flight": stats["in_flight"],
+                "new_connections": stats["new_connections"],
+                "reused_connections": stats["reused_connections"],
+                "reuse_ratio": round(stats["reused_connections"] / completed, 3) if completed else 0.0,
+                "status_classes": dict(stats["status_classes"]),
+                "http_versions": dict(stats["http_versions"]),
+                "avg_ms": round(stats["seconds"] * 1000 / completed, 2) if completed else 0.0
+            }
+        return {
+            "http2": self.http2,
+            "max_connections": self.limits.max_connections,
+            "max_keepalive_connections": self.limits.max_keepalive_connections,
+            "per_host_limit": self.per_host_limit,
+            "hosts": hosts
+        }
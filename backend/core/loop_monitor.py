@@ -0,0 +1,54 @@
+"""
+Event Loop Monitor Module
+Measures asyncio scheduling lag so blocking work on the loop is visible
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Dict, Optional
+
+
+class EventLoopLagMonitor:
+    """Periodically measures how late the event loop wakes a sleeping task"""
+
+    def __init__(self, interval: float = 0.1, window: int = 600):
+        self.interval = interval
+        self.samples: deque = deque(maxlen=window)
+        self.max_lag_ms = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start sampling on the running loop"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        """Stop sampling"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            expected = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            lag_ms = max(0.0, (time.perf_counter() - expected) * 1000)
+            self.samples.append(lag_ms)
+            self.max_lag_ms = max(self.max_lag_ms, lag_ms)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current, p99 and max loop lag in milliseconds"""
+        ordered = sorted(self.samples)
+        p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] if ordered else 0.0
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "samples": len(ordered),
+            "current_ms": round(self.samples[-1], 2) if self.samples else 0.0,
+            "p99_ms": round(p99, 2),
+            "max_ms": round(self.max_lag_ms, 2)
+        }
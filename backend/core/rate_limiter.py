@@ -0,0 +1,167 @@
+"""
+Rate Limiter Module
+Token-bucket rate limiting per platform and credential, with priority-ordered waiters
+"""
+
+import asyncio
+import contextvars
+import heapq
+import itertools
+import time
+from contextlib import contextmanager
+from enum import IntEnum
+from typing import Any, Dict, Optional, Tuple
+
+
+class Priority(IntEnum):
+    """Scheduling priority for rate-limited calls (lower runs first)"""
+    INTERACTIVE = 0
+    DEFAULT = 5
+    BACKGROUND = 10
+
+
+# Calls made while serving an API request are interactive unless a caller
+# (such as the discovery pipeline) opts into background priority
+_current_priority: contextvars.ContextVar = contextvars.ContextVar(
+    "request_priority", default=Priority.INTERACTIVE
+)
+
+
+def current_priority() -> Priority:
+    """Priority of the calling context"""
+    return _current_priority.get()
+
+
+@contextmanager
+def request_priority(priority: Priority):
+    """Run the enclosed calls (and tasks spawned from them) at the given priority"""
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+class TokenBucket:
+    """Token bucket that wakes waiters in priority order as tokens refill"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._waiters: list = []  # heap of (priority, sequence, future)
+        self._sequence = itertools.count()
+        self._wakeup: Optional[asyncio.TimerHandle] = None
+
+        # Stats
+        self.acquired = 0
+        self.waited = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.wait_seconds_by_priority: Dict[str, float] = {}
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, priority: Priority = Priority.DEFAULT) -> float:
+        """Take one token, waiting behind higher-priority callers; returns seconds waited"""
+        self._refill()
+        if not self._waiters and self._tokens >= 1:
+            self._tokens -= 1
+            self.acquired += 1
+            return 0.0
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (int(priority), next(self._sequence), future))
+        self._schedule()
+
+        started = time.monotonic()
+        await future
+        waited = time.monotonic() - started
+
+        self.acquired += 1
+        self.waited += 1
+        self.wait_seconds += waited
+        self.max_wait_seconds = max(self.max_wait_seconds, waited)
+        name = Priority(priority).name.lower()
+        self.wait_seconds_by_priority[name] = self.wait_seconds_by_priority.get(name, 0.0) + waited
+        return waited
+
+    def _schedule(self):
+        if self._waiters and self._wakeup is None:
+            delay = max(0.0, (1 - self._tokens) / self.rate)
+            self._wakeup = asyncio.get_running_loop().call_later(delay, self._dispatch)
+
+    def _dispatch(self):
+        self._wakeup = None
+        self._refill()
+        while self._waiters and self._tokens >= 1:
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():  # waiter was cancelled
+                continue
+            self._tokens -= 1
+            future.set_result(None)
+        self._schedule()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Bucket configuration and wait metrics"""
+        self._refill()
+        return {
+            "rate_per_second": self.rate,
+            "burst": self.burst,
+            "tokens": round(self._tokens, 2),
+            "waiting": sum(1 for _, _, future in self._waiters if not future.done()),
+            "acquired": self.acquired,
+            "waited": self.waited,
+            "wait_seconds_total": round(self.wait_seconds, 3),
+            "max_wait_seconds": round(self.max_wait_seconds, 3),
+            "wait_seconds_by_priority": {
+                name: round(seconds, 3) for name, seconds in self.wait_seconds_by_priority.items()
+            }
+        }
+
+
+class RateLimiter:
+    """Registry of token buckets keyed by platform and credential"""
+
+    def __init__(self, default_rate: float = 10.0, default_burst: int = 20):
+        self.default_limit = (default_rate, default_burst)
+        self._limits: Dict[Tuple[str, Optional[str]], Tuple[float, int]] = {}
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+
+    def configure(self, platform: str, rate: float, burst: int, credential: Optional[str] = None):
+        """Set the limit for a platform, or for one credential on that platform"""
+        self._limits[(platform, credential)] = (rate, burst)
+        for (bucket_platform, bucket_credential), bucket in self._buckets.items():
+            if bucket_platform == platform and (credential is None or credential == bucket_credential):
+                bucket.rate, bucket.burst = self._limit_for(bucket_platform, bucket_credential)
+
+    def _limit_for(self, platform: str, credential: str) -> Tuple[float, int]:
+        return self._limits.get(
+            (platform, credential),
+            self._limits.get((platform, None), self.default_limit)
+        )
+
+    def bucket(self, platform: str, credential: str) -> TokenBucket:
+        """Bucket for a platform/credential pair, created on first use"""
+        key = (platform, credential)
+        if key not in self._buckets:
+            self._buckets[key] = TokenBucket(*self._limit_for(platform, credential))
+        return self._buckets[key]
+
+    async def acquire(self, platform: str, credential: str, priority: Optional[Priority] = None) -> float:
+        """Wait for a token; defaults to the priority of the calling context"""
+        if priority is None:
+            priority = current_priority()
+        return await self.bucket(platform, credential).acquire(priority)
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-bucket metrics, keyed by platform with credentials masked"""
+        result: Dict[str, Any] = {}
+        for (platform, credential), bucket in self._buckets.items():
+            masked = credential[-4:].rjust(len(credential), "*") if credential else "default"
+            result.setdefault(platform, {})[masked] = bucket.snapshot()
+        return result
@@ -0,0 +1,168 @@
+"""
+Resilience Module
+Per-endpoint latency tracking, request hedging policy and circuit breakers
+"""
+
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+
+class LatencyTracker:
+    """Rolling window of call latencies used to pick the hedge delay"""
+
+    def __init__(self, window: int = 200):
+        self._samples: Deque[float] = deque(maxlen=window)
+
+    def record(self, seconds: float):
+        self._samples.append(seconds)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Latency at quantile q (0-1) over the window, or None without samples"""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class HedgingPolicy:
+    """When to send a duplicate of a slow call"""
+
+    def __init__(self, enabled: bool = True, percentile: float = 0.95, min_samples: int = 20,
+                 min_delay: float = 0.05, max_hedge_ratio: float = 0.1):
+        self.enabled = enabled
+        self.percentile = percentile
+        # Too few samples give a meaningless percentile, so hedging waits for a baseline
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        # Hedges are capped as a share of calls so a slow upstream is not hit with double load
+        self.max_hedge_ratio = max_hedge_ratio
+
+    def delay(self, latency: LatencyTracker) -> Optional[float]:
+        """Seconds to wait before hedging, or None when hedging is off or uncalibrated"""
+        if not self.enabled or len(latency) < self.min_samples:
+            return None
+        return max(self.min_delay, latency.percentile(self.percentile))
+
+
+class CircuitBreaker:
+    """Closed -> open after consecutive failures -> half-open probe after a cool-down"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0, half_open_max_calls: int = 1):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+
+        # Stats
+        self.times_opened = 0
+        self.rejected = 0
+
+    def allow(self) -> bool:
+        """Whether a call may go upstream now"""
+        if self.state == self.OPEN:
+            if time.monotonic() - self._opened_at < self.reset_timeout:
+                self.rejected += 1
+                return False
+            self.state = self.HALF_OPEN
+            self._probes = 0
+        if self.state == self.HALF_OPEN:
+            if self._probes >= self.half_open_max_calls:
+                self.rejected += 1
+                return False
+            self._probes += 1
+        return True
+
+    def retry_after(self) -> float:
+        """Seconds until an open breaker lets a probe through"""
+        if self.state != self.OPEN:
+            return 0.0
+        return max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+
+    def record_success(self):
+        self._failures = 0
+        self.state = self.CLOSED
+
+    def record_cancelled(self):
+        """Give back a half-open probe slot when the probe call was cancelled"""
+        if self.state == self.HALF_OPEN and self._probes > 0:
+            self._probes -= 1
+
+    def record_failure(self):
+        self._failures += 1
+        if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                self.times_opened += 1
+            self.state = self.OPEN
+            self._opened_at = time.monotonic()
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "times_opened": self.times_opened,
+            "rejected_calls": self.rejected,
+            "retry_after_seconds": round(self.retry_after(), 2)
+        }
+
+
+class Resilience:
+    """Latency trackers, circuit breakers and hedge counters for each endpoint of one client"""
+
+    def __init__(self, hedging: Optional[HedgingPolicy] = None,
+                 failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.hedging = hedging or HedgingPolicy()
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._latency: Dict[str, LatencyTracker] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._counters: Dict[str, Dict[str, int]] = {}
+
+    def latency(self, endpoint: str) -> LatencyTracker:
+        if endpoint not in self._latency:
+            self._latency[endpoint] = LatencyTracker()
+        return self._latency[endpoint]
+
+    def breaker(self, endpoint: str) -> CircuitBreaker:
+        if endpoint not in self._breakers:
+            self._breakers[endpoint] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+        return self._breakers[endpoint]
+
+    def counters(self, endpoint: str) -> Dict[str, int]:
+        if endpoint not in self._counters:
+            self._counters[endpoint] = {"calls": 0, "failures": 0, "hedges_issued": 0, "hedges_won": 0}
+        return self._counters[endpoint]
+
+    def hedge_delay(self, endpoint: str) -> Optional[float]:
+        """Hedge delay for an endpoint, or None if no hedge should be sent"""
+        counters = self.counters(endpoint)
+        if counters["hedges_issued"] >= counters["calls"] * self.hedging.max_hedge_ratio:
+            return None
+        return self.hedging.delay(self.latency(endpoint))
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-endpoint hedging and breaker counters"""
+        result = {}
+        for endpoint, counters in self._counters.items():
+            latency = self.latency(endpoint)
+            p95 = latency.percentile(0.95)
+            result[endpoint] = {
+                **counters,
+                "p95_ms": round(p95 * 1000, 2) if p95 is not None else None,
+                "circuit": self.breaker(endpoint).snapshot()
+            }
+        return {
+            "hedging_enabled": self.hedging.enabled,
+            "hedge_percentile": self.hedging.percentile,
+            "endpoints": result
+        }
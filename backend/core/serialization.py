@@ -0,0 +1,44 @@
+"""
+Serialization Module
+Compact JSON encoding shared by worker payloads, caches and API responses
+"""
+
+import json
+from datetime import date, datetime
+from enum import Enum
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is listed in requirements.txt
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    """Fallback encoder for types the stdlib json module does not know"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if hasattr(value, "model_dump"):
+        return value.model_dump()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(value: Any, sort_keys: bool = False) -> bytes:
+    """Encode a value as compact UTF-8 JSON bytes"""
+    if orjson is not None:
+        option = orjson.OPT_SORT_KEYS if sort_keys else 0
+        return orjson.dumps(value, default=_default, option=option)
+    return json.dumps(
+        value, default=_default, sort_keys=sort_keys, separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+
+
+def loads(data: bytes) -> Any:
+    """Decode JSON bytes produced by dumps"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -3,13 +3,18 @@ ICY - AI Influencer Outreach Platform Backend
 FastAPI server with simulated Instagram and YouTube API integrations
 """
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Header, Query, Request
+from fastapi.responses import JSONResponse, ORJSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
 import uvicorn
 import asyncio
+import csv
+import io
+import os
 import random
+import tempfile
 from datetime import datetime, timedelta
 import json
 
@@ -17,10 +22,37 @@ import json
 from api.instagram_api import InstagramAPI
 from api.youtube_api import YouTubeAPI
 from api.ai_analyzer import AIAnalyzer
+from api.inference_gateway import InferenceGateway, LocalStandInModel
 from api.message_generator import MessageGenerator
-from models.influencer import Influencer, InfluencerProfile
-from models.campaign import Campaign, CampaignMetrics
+from api.message_templates import TemplateError
+from api.outreach_provider import PROVIDER_FOR_PLATFORM, SimulatedOutreachProvider
+from api.analysis_pool import AnalysisPool
+from api.youtube_quota import QuotaBudget, QuotaExceededError
+from api.platform_client import CircuitOpenError
+from models.influencer import Influencer
+from models.campaign import Campaign, CampaignMetrics, MessageTemplate, OutreachMessage
 from models.brand import BrandData
+from services.catalog import CreatorCatalog
+from services.catalog_import import FORMATS as IMPORT_FORMATS, CatalogImporter, detect_format
+from services.catalog_sync import CatalogSync, SyncConflictError
+from services.discovery_pipeline import DiscoveryPipeline
+from services.feature_store import FeatureStore
+from services.influencer_360 import Influencer360
+from services.influencer_batch import InfluencerBatchResolver, platform_of
+from services.outbound_queue import OutboundQueue
+from services.outbound_store import OutboundStore
+from services.refresh_scheduler import RefreshScheduler
+from services.result_export import EXPORT_FORMATS, ExportFormatError, export_results
+from services.result_index import InvalidQueryError, ResultIndex
+from services.task_registry import IdempotencyConflictError, TaskRegistry
+from core.adaptive_limiter import AdaptiveLimiter
+from core.cache import RedisBackend, TieredCache
+from core.http_transport import HTTPTransport
+from core.loop_monitor import EventLoopLagMonitor
+from core.rate_limiter import RateLimiter, Priority, request_priority
+from core.http_compression import CompressionMiddleware, CompressionStats, etag_matches, strong_etag
+from core.serialization import dumps
+from core.resilience import HedgingPolicy, Resilience
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -28,7 +60,16 @@ app = FastAPI(
     description="Backend API for AI-powered influencer discovery and outreach",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
+)
+
+# Negotiated brotli/gzip for JSON and NDJSON bodies above the size threshold
+compression_stats = CompressionStats()
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=int(os.getenv("COMPRESSION_MIN_BYTES", "1024")),
+    stats=compression_stats
 )
 
 # Configure CORS
@@ -40,15 +81,201 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Shared per-platform, per-credential token buckets (requests/sec and burst)
+rate_limiter = RateLimiter()
+rate_limiter.configure(
+    "instagram",
+    rate=float(os.getenv("INSTAGRAM_RATE_LIMIT", "20")),
+    burst=int(os.getenv("INSTAGRAM_RATE_BURST", "40"))
+)
+rate_limiter.configure(
+    "youtube",
+    rate=float(os.getenv("YOUTUBE_RATE_LIMIT", "20")),
+    burst=int(os.getenv("YOUTUBE_RATE_BURST", "40"))
+)
+
+# PLATFORM_API_BASE_URL points both clients at a Graph/Data API compatible server (such as
+# tools/platform_standin.py) over one pooled transport; unset, the clients serve simulated data
+_platform_base_url = os.getenv("PLATFORM_API_BASE_URL", "").rstrip("/")
+http_transport = None
+if _platform_base_url:
+    http_transport = HTTPTransport(
+        max_connections=int(os.getenv("HTTP_MAX_CONNECTIONS", "100")),
+        per_host_limit=int(os.getenv("HTTP_PER_HOST_LIMIT", "20"))
+    )
+
+# Hedge calls slower than the endpoint's latency percentile; open an endpoint's circuit
+# after consecutive upstream failures and probe it again after the reset timeout
+def _platform_resilience() -> Resilience:
+    return Resilience(
+        hedging=HedgingPolicy(
+            enabled=os.getenv("PLATFORM_HEDGING", "1") == "1",
+            percentile=float(os.getenv("PLATFORM_HEDGE_PERCENTILE", "0.95")),
+            max_hedge_ratio=float(os.getenv("PLATFORM_MAX_HEDGE_RATIO", "0.1"))
+        ),
+        failure_threshold=int(os.getenv("PLATFORM_BREAKER_THRESHOLD", "5")),
+        reset_timeout=float(os.getenv("PLATFORM_BREAKER_RESET_SECONDS", "30"))
+    )
+
+# Adaptive (AIMD) caps on in-flight calls per platform and to the analysis pool;
+# ADAPTIVE_CONCURRENCY=0 leaves concurrency bounded only by rate limits and stage sizes
+_adaptive_concurrency = os.getenv("ADAPTIVE_CONCURRENCY", "1") == "1"
+
+def _platform_concurrency(platform: str) -> Optional[AdaptiveLimiter]:
+    if not _adaptive_concurrency:
+        return None
+    return AdaptiveLimiter(
+        platform,
+        initial_limit=int(os.getenv("PLATFORM_INITIAL_CONCURRENCY", "20")),
+        max_limit=int(os.getenv("PLATFORM_MAX_CONCURRENCY", "200"))
+    )
+
+# Platform response cache: in-process LRU, backed by Redis when REDIS_URL is set so all
+# workers share cached responses; PLATFORM_CACHE=0 disables caching
+platform_cache = None
+if os.getenv("PLATFORM_CACHE", "1") == "1":
+    _redis_url = os.getenv("REDIS_URL")
+    platform_cache = TieredCache(
+        l2=RedisBackend(_redis_url) if _redis_url else None,
+        l1_max_entries=int(os.getenv("CACHE_L1_MAX_ENTRIES", "10000"))
+    )
+
 # Initialize API clients
-instagram_api = InstagramAPI()
-youtube_api = YouTubeAPI()
-ai_analyzer = AIAnalyzer()
-message_generator = MessageGenerator()
+instagram_api = InstagramAPI(
+    rate_limiter=rate_limiter,
+    transport=http_transport,
+    base_url=_platform_base_url or None,
+    resilience=_platform_resilience(),
+    concurrency=_platform_concurrency("instagram"),
+    cache=platform_cache
+)
+youtube_api = YouTubeAPI(
+    rate_limiter=rate_limiter,
+    resilience=_platform_resilience(),
+    concurrency=_platform_concurrency("youtube"),
+    cache=platform_cache,
+    quota=QuotaBudget(daily_limit=int(os.getenv("YOUTUBE_DAILY_QUOTA", "10000"))),
+    transport=http_transport,
+    base_url=f"{_platform_base_url}/youtube/v3" if _platform_base_url else None,
+    analytics_url=f"{_platform_base_url}/youtubeanalytics/v2" if _platform_base_url else None
+)
+# Model-backed analysis and messaging: INFERENCE_BACKEND=local routes them through the
+# micro-batching gateway onto the local stand-in model; "off" keeps the rule-based steps
+inference_gateway = None
+if os.getenv("INFERENCE_BACKEND", "off") == "local":
+    inference_gateway = InferenceGateway(
+        LocalStandInModel(),
+        max_batch_size=int(os.getenv("INFERENCE_MAX_BATCH_SIZE", "16")),
+        max_wait=float(os.getenv("INFERENCE_MAX_WAIT_MS", "10")) / 1000,
+        prefix_cache_size=int(os.getenv("INFERENCE_PREFIX_CACHE_SIZE", "256"))
+    )
+ai_analyzer = AIAnalyzer(inference=inference_gateway)
+message_generator = MessageGenerator(inference=inference_gateway)
+message_batch_concurrency = int(os.getenv("MESSAGE_BATCH_CONCURRENCY", "50"))
+
+# CPU-bound analysis offload: ANALYSIS_POOL_WORKERS=0 keeps analysis on the event loop,
+# "auto" uses one worker per core
+_pool_workers = os.getenv("ANALYSIS_POOL_WORKERS", "0")
+analysis_pool = None
+if _pool_workers != "0":
+    _pool_size = None if _pool_workers == "auto" else int(_pool_workers)
+    analysis_pool = AnalysisPool(
+        max_workers=_pool_size,
+        batch_size=int(os.getenv("ANALYSIS_POOL_BATCH_SIZE", "16"))
+    )
+    if _adaptive_concurrency:
+        analysis_pool.concurrency = AdaptiveLimiter(
+            "analysis_pool",
+            initial_limit=analysis_pool.max_workers * 2,
+            max_limit=analysis_pool.max_workers * 8
+        )
+loop_monitor = EventLoopLagMonitor()
+
+# Local creator catalog kept current by incremental syncs; discovery reads it for any
+# platform it holds records for. CATALOG_PATH="" disables the catalog. The database is
+# opened in the startup hook, so importing the app creates no files
+catalog: Optional[CreatorCatalog] = None
+catalog_sync: Optional[CatalogSync] = None
+catalog_importer: Optional[CatalogImporter] = None
+
+def _open_catalog():
+    global catalog, catalog_sync, catalog_importer
+    catalog_path = os.getenv("CATALOG_PATH", "catalog.db")
+    if not catalog_path:
+        return
+    catalog = CreatorCatalog(catalog_path)
+    catalog_importer = CatalogImporter(catalog, chunk_size=int(os.getenv("CATALOG_IMPORT_CHUNK_SIZE", "1000")))
+    catalog_sync = CatalogSync(
+        catalog,
+        {"instagram": instagram_api, "youtube": youtube_api},
+        max_records_per_run=int(os.getenv("CATALOG_SYNC_MAX_RECORDS", "1000")),
+        interval=float(os.getenv("CATALOG_SYNC_INTERVAL", "0"))
+    )
+
+# Materialized per-creator analysis features, refreshed incrementally; FEATURE_STORE=0 scores from scratch
+feature_store = None
+if os.getenv("FEATURE_STORE", "1") == "1":
+    feature_store = FeatureStore(
+        ai_analyzer,
+        {"instagram": instagram_api, "youtube": youtube_api},
+        refresh_interval=float(os.getenv("FEATURE_REFRESH_INTERVAL", "300")),
+        max_age=float(os.getenv("FEATURE_MAX_AGE_SECONDS", "3600"))
+    )
+
+# Scheduled refresh of cached profiles for frequently requested creators
+refresh_scheduler = None
+if platform_cache is not None:
+    refresh_scheduler = RefreshScheduler(
+        {"instagram": instagram_api, "youtube": youtube_api},
+        interval=float(os.getenv("PROFILE_REFRESH_INTERVAL", "60")),
+        max_creators=int(os.getenv("PROFILE_REFRESH_MAX_CREATORS", "500"))
+    )
+
+# Shortlist details: deduplicated ids, batched profile lookups, bounded and cached analyses
+influencer_batch = InfluencerBatchResolver(
+    {"instagram": instagram_api, "youtube": youtube_api},
+    ai_analyzer,
+    cache=platform_cache,
+    concurrency=int(os.getenv("INFLUENCER_BATCH_CONCURRENCY", "16"))
+)
+
+# Composite creator detail view; each part is dropped from the response after its own timeout
+influencer_360 = Influencer360({"instagram": instagram_api, "youtube": youtube_api}, ai_analyzer)
+
+# Durable outbound message queue; sends run on a worker pool in per-provider batches.
+# Its database is opened in the startup hook, like the catalog's
+outbound_queue: Optional[OutboundQueue] = None
+
+def _open_outbound_queue():
+    global outbound_queue
+    outbound_queue = OutboundQueue(
+        OutboundStore(os.getenv("OUTBOUND_QUEUE_PATH", "outbound.db") or ":memory:"),
+        {name: SimulatedOutreachProvider(name) for name in PROVIDER_FOR_PLATFORM.values()},
+        workers=int(os.getenv("OUTBOUND_WORKERS_PER_PROVIDER", "2")),
+        max_attempts=int(os.getenv("OUTBOUND_MAX_ATTEMPTS", "6")),
+        retry_base=float(os.getenv("OUTBOUND_RETRY_BASE_SECONDS", "1")),
+        retry_cap=float(os.getenv("OUTBOUND_RETRY_MAX_SECONDS", "300"))
+    )
 
 # In-memory storage (replace with database in production)
 campaigns_db: Dict[str, Campaign] = {}
-discovery_tasks: Dict[str, Dict] = {}
+# Discovery tasks, deduplicated by idempotency key and by identical in-flight requests
+task_registry = TaskRegistry(key_ttl=float(os.getenv("IDEMPOTENCY_KEY_TTL_SECONDS", "86400")))
+discovery_tasks: Dict[str, Dict] = task_registry.tasks
+
+def not_modified(request: Request, etag: str) -> Optional[Response]:
+    """304 response when the client's copy still matches etag"""
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+    return None
+
+def tagged_json(request: Request, content: Any, etag: Optional[str] = None) -> Response:
+    """JSON response with a strong ETag (a hash of the body unless a version tag is given), or 304"""
+    body = content if isinstance(content, bytes) else dumps(content)
+    etag = etag or strong_etag(body)
+    return not_modified(request, etag) or Response(
+        content=body, media_type="application/json", headers={"ETag": etag, "Cache-Control": "no-cache"}
+    )
 
 # Request/Response Models
 class DiscoveryRequest(BaseModel):
@@ -60,24 +287,96 @@ class DiscoveryResponse(BaseModel):
     task_id: str
     status: str
     message: str
+    deduplicated: bool = False
 
 class InfluencerListResponse(BaseModel):
-    influencers: List[InfluencerProfile]
-    total_count: int
+    influencers: List[Dict[str, Any]]
+    next_cursor: Optional[str] = None
+    total_count: Optional[int] = None
     high_matches: int
     medium_matches: int
     low_matches: int
 
+class InfluencerBatchRequest(BaseModel):
+    influencer_ids: List[str] = Field(..., min_length=1, max_length=200)
+
 class MessageRequest(BaseModel):
     influencer_id: str
     brand_data: BrandData
     message_type: str = "collaboration"
+    template_id: Optional[str] = None
+
+class BatchMessageRequest(BaseModel):
+    influencer_ids: List[str] = Field(..., min_length=1, max_length=500)
+    brand_data: BrandData
+    message_type: str = "collaboration"
+    template_id: Optional[str] = None
+
+class SendMessageRequest(BaseModel):
+    influencer_id: str
+    subject: str
+    message: str
+    template_id: Optional[str] = None
+    personalization_score: float = Field(0.0, ge=0, le=1)
+    idempotency_key: Optional[str] = None
+
+class SendBatchRequest(BaseModel):
+    messages: List[SendMessageRequest] = Field(..., min_length=1, max_length=1000)
 
 class MessageResponse(BaseModel):
     message: str
     subject: str
     personalization_score: float
 
+@app.on_event("startup")
+async def startup():
+    loop_monitor.start()
+    if analysis_pool is not None:
+        await analysis_pool.start()
+    if refresh_scheduler is not None:
+        refresh_scheduler.start()
+    if feature_store is not None:
+        feature_store.start()
+    _open_catalog()
+    if catalog_sync is not None:
+        catalog_sync.start()
+    _open_outbound_queue()
+    outbound_queue.start()
+
+@app.on_event("shutdown")
+async def shutdown():
+    await loop_monitor.stop()
+    await influencer_360.close()
+    if outbound_queue is not None:
+        await outbound_queue.stop()
+        outbound_queue.store.close()
+    if refresh_scheduler is not None:
+        await refresh_scheduler.stop()
+    if feature_store is not None:
+        await feature_store.stop()
+    if catalog_sync is not None:
+        await catalog_sync.stop()
+    if catalog is not None:
+        catalog.close()
+    if analysis_pool is not None:
+        analysis_pool.shutdown()
+    if http_transport is not None:
+        await http_transport.aclose()
+    if platform_cache is not None:
+        await platform_cache.close()
+
+@app.exception_handler(QuotaExceededError)
+async def quota_exceeded_handler(request: Request, exc: QuotaExceededError):
+    return JSONResponse(status_code=429, content={"detail": str(exc)})
+
+@app.exception_handler(CircuitOpenError)
+async def circuit_open_handler(request: Request, exc: CircuitOpenError):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(max(1, int(exc.retry_after)))}
+    )
+
 # Root endpoint
 @app.get("/")
 async def root():
@@ -108,22 +407,143 @@ async def health_check():
         }
     }
 
+# System metrics endpoint
+@app.get("/api/v1/system/metrics")
+async def get_system_metrics():
+    """Runtime metrics for the event loop and analysis backend"""
+    return {
+        "event_loop": loop_monitor.snapshot(),
+        "analysis_pool": analysis_pool.stats() if analysis_pool is not None else {"workers": 0},
+        "rate_limits": rate_limiter.stats(),
+        "youtube_quota": youtube_api.quota.snapshot(),
+        "batch_loaders": {
+            "instagram": instagram_api.loader_stats(),
+            "youtube": youtube_api.loader_stats()
+        },
+        "platform_cache": platform_cache.stats() if platform_cache is not None else {"enabled": False},
+        "refresh_scheduler": refresh_scheduler.stats() if refresh_scheduler is not None else {"enabled": False},
+        "feature_store": feature_store.stats() if feature_store is not None else {"enabled": False},
+        "adaptive_limits": {
+            name: limiter.stats()
+            for name, limiter in (
+                ("instagram", instagram_api.concurrency),
+                ("youtube", youtube_api.concurrency),
+                ("analysis_pool", analysis_pool.concurrency if analysis_pool is not None else None)
+            )
+            if limiter is not None
+        },
+        "resilience": {
+            "instagram": instagram_api.resilience.stats(),
+            "youtube": youtube_api.resilience.stats()
+        },
+        "http_transport": http_transport.stats() if http_transport is not None else {"mode": "simulated"},
+        "compression": compression_stats.stats(),
+        "influencer_360": influencer_360.stats(),
+        "influencer_batch": influencer_batch.stats(),
+        "discovery_tasks": task_registry.stats(),
+        "message_generation": message_generator.stats(),
+        "inference": inference_gateway.stats() if inference_gateway is not None else {"backend": "off"},
+        "outbound_queue": outbound_queue.stats()
+    }
+
+# Catalog endpoints
+@app.get("/api/v1/catalog")
+async def get_catalog():
+    """Creator counts per platform and saved sync cursors"""
+    if catalog is None:
+        raise HTTPException(status_code=404, detail="Creator catalog is disabled")
+    return await asyncio.to_thread(catalog.stats)
+
+@app.post("/api/v1/catalog/sync/{platform}")
+async def start_catalog_sync(platform: str, query: str = "", max_records: Optional[int] = None):
+    """Start an incremental sync of a platform's creators into the catalog"""
+    if catalog_sync is None:
+        raise HTTPException(status_code=404, detail="Creator catalog is disabled")
+    if platform not in catalog_sync.clients:
+        raise HTTPException(status_code=404, detail=f"Unknown platform: {platform}")
+    try:
+        return catalog_sync.start_run(platform, query, max_records)
+    except SyncConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+@app.get("/api/v1/catalog/sync/runs")
+async def get_catalog_sync_runs():
+    """Recent sync runs with scanned, changed and skipped counts and throughput"""
+    if catalog_sync is None:
+        raise HTTPException(status_code=404, detail="Creator catalog is disabled")
+    return catalog_sync.stats()
+
+@app.post("/api/v1/catalog/import")
+async def import_catalog(request: Request, format: Optional[str] = None):
+    """Bulk-import a CSV or NDJSON creator list, streaming per-row errors and progress as NDJSON"""
+    if catalog_importer is None:
+        raise HTTPException(status_code=404, detail="Creator catalog is disabled")
+    fmt = format or detect_format(request.headers.get("content-type"))
+    if fmt not in IMPORT_FORMATS:
+        raise HTTPException(status_code=415, detail="Send text/csv or application/x-ndjson, or pass ?format=")
+
+    # Spool the upload (to disk past 8 MB) so memory stays flat for any file size
+    upload = tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024)
+    async for chunk in request.stream():
+        # Once the spool has rolled over to disk, writes are file I/O, so they run off the event loop
+        await asyncio.to_thread(upload.write, chunk)
+    upload.seek(0)
+    text = io.TextIOWrapper(upload, encoding="utf-8-sig", newline="")
+    events = catalog_importer.run(text, fmt)
+
+    async def stream_events():
+        try:
+            while True:
+                # Parsing, validation and the bulk upserts run off the event loop, one chunk at a time
+                chunk_events = await asyncio.to_thread(next, events, None)
+                if chunk_events is None:
+                    break
+                yield b"".join(dumps(event) + b"\n" for event in chunk_events)
+        except (UnicodeDecodeError, csv.Error) as e:
+            yield dumps({"event": "failed", "error": str(e)}) + b"\n"
+        finally:
+            text.close()
+
+    return StreamingResponse(stream_events(), media_type="application/x-ndjson")
+
+@app.get("/api/v1/platforms/youtube/quota")
+async def get_youtube_quota():
+    """Remaining YouTube Data API quota and usage per call type"""
+    return youtube_api.quota.snapshot()
+
 # Discovery endpoints
 @app.post("/api/v1/discovery/start", response_model=DiscoveryResponse)
-async def start_discovery(request: DiscoveryRequest, background_tasks: BackgroundTasks):
-    """Start influencer discovery process"""
-    task_id = f"task_{random.randint(10000, 99999)}"
-    
-    # Initialize discovery task
-    discovery_tasks[task_id] = {
+async def start_discovery(request: DiscoveryRequest, background_tasks: BackgroundTasks,
+                          idempotency_key: Optional[str] = Header(None, max_length=255)):
+    """Start influencer discovery process, or return the task already handling this request"""
+    brand_data = request.brand_data.dict()
+    task = {
         "status": "started",
         "progress": 0,
-        "brand_data": request.brand_data.dict(),
+        "brand_data": brand_data,
         "platforms": request.platforms,
         "max_results": request.max_results,
         "created_at": datetime.now().isoformat(),
         "influencers": []
     }
+    # Timestamps differ on every request, so they are left out of the request fingerprint
+    payload = {
+        "brand_data": request.brand_data.dict(exclude={"created_at", "updated_at"}),
+        "platforms": sorted(set(request.platforms)),
+        "max_results": request.max_results
+    }
+    try:
+        task_id, created = task_registry.submit(payload, task, idempotency_key)
+    except IdempotencyConflictError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    
+    if not created:
+        return DiscoveryResponse(
+            task_id=task_id,
+            status=discovery_tasks[task_id]["status"],
+            message="An identical discovery request is already handled by this task.",
+            deduplicated=True
+        )
     
     # Start background discovery process
     background_tasks.add_task(run_discovery_process, task_id, request)
@@ -135,23 +555,77 @@ async def start_discovery(request: DiscoveryRequest, background_tasks: Backgroun
     )
 
 @app.get("/api/v1/discovery/{task_id}/status")
-async def get_discovery_status(task_id: str):
+async def get_discovery_status(task_id: str, request: Request):
     """Get discovery task status"""
     if task_id not in discovery_tasks:
         raise HTTPException(status_code=404, detail="Task not found")
     
     task = discovery_tasks[task_id]
-    return {
+    return tagged_json(request, {
         "task_id": task_id,
         "status": task["status"],
         "progress": task["progress"],
         "created_at": task["created_at"],
-        "influencers_found": len(task["influencers"])
-    }
+        "influencers_found": len(task["influencers"]),
+        "pipeline": task.get("pipeline", []),
+        "degraded": task.get("degraded", {})
+    })
 
 @app.get("/api/v1/discovery/{task_id}/results", response_model=InfluencerListResponse)
-async def get_discovery_results(task_id: str):
-    """Get discovery results"""
+async def get_discovery_results(
+    task_id: str,
+    request: Request,
+    limit: int = Query(20, ge=1, le=500),
+    cursor: Optional[str] = None,
+    sort: str = "match_score",
+    order: str = Query("desc", pattern="^(asc|desc)$"),
+    platform: Optional[str] = None,
+    risk_level: Optional[str] = None,
+    min_followers: Optional[int] = None,
+    max_followers: Optional[int] = None,
+    min_match_score: Optional[float] = None,
+    min_authenticity_score: Optional[float] = None,
+    fields: Optional[str] = None
+):
+    """Get one page of discovery results, filtered and sorted server-side"""
+    if task_id not in discovery_tasks:
+        raise HTTPException(status_code=404, detail="Task not found")
+    
+    task = discovery_tasks[task_id]
+    if task["status"] != "completed":
+        raise HTTPException(status_code=400, detail="Discovery not completed yet")
+    
+    # Completed results never change, so the task version and the query identify a page
+    etag = strong_etag(task_id, task["completed_at"], sorted(request.query_params.multi_items()))
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
+    
+    columns = [field.strip() for field in fields.split(",") if field.strip()] if fields else None
+    try:
+        # Returned as a Response so FastAPI skips response_model validation of our own rows
+        body = task["index"].page_json(
+            sort=sort,
+            descending=order == "desc",
+            limit=limit,
+            cursor=cursor,
+            platform=platform,
+            risk_level=risk_level,
+            ranges={
+                "followers": (min_followers, max_followers),
+                "match_score": (min_match_score, None),
+                "authenticity_score": (min_authenticity_score, None)
+            },
+            fields=columns
+        )
+    except InvalidQueryError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return tagged_json(request, body, etag)
+
+@app.get("/api/v1/discovery/{task_id}/export")
+async def export_discovery_results(task_id: str, request: Request, format: str = "ndjson",
+                                   fields: Optional[str] = None):
+    """Stream discovery results as NDJSON, CSV or Parquet, optionally limited to some columns"""
     if task_id not in discovery_tasks:
         raise HTTPException(status_code=404, detail="Task not found")
     
@@ -159,76 +633,246 @@ async def get_discovery_results(task_id: str):
     if task["status"] != "completed":
         raise HTTPException(status_code=400, detail="Discovery not completed yet")
     
-    influencers = task["influencers"]
+    etag = strong_etag("export", task_id, task["completed_at"], sorted(request.query_params.multi_items()))
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
     
-    # Calculate match distribution
-    high_matches = len([i for i in influencers if i["match_score"] >= 90])
-    medium_matches = len([i for i in influencers if 80 <= i["match_score"] < 90])
-    low_matches = len([i for i in influencers if i["match_score"] < 80])
+    columns = [field.strip() for field in fields.split(",") if field.strip()] if fields else None
+    try:
+        # A sync iterator, so Starlette encodes each chunk in its threadpool off the event loop
+        body = export_results(task["influencers"], format, columns)
+    except ExportFormatError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
-    return InfluencerListResponse(
-        influencers=[InfluencerProfile(**inf) for inf in influencers],
-        total_count=len(influencers),
-        high_matches=high_matches,
-        medium_matches=medium_matches,
-        low_matches=low_matches
+    media_type, extension = EXPORT_FORMATS[format]
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{task_id}.{extension}"', "ETag": etag}
     )
 
 # Influencer endpoints
 @app.get("/api/v1/influencers/{influencer_id}")
-async def get_influencer_details(influencer_id: str):
+async def get_influencer_details(influencer_id: str, request: Request):
     """Get detailed influencer information"""
     # Simulate fetching from database
     await asyncio.sleep(0.5)  # Simulate API delay
     
     # Generate mock detailed data
     influencer_data = await ai_analyzer.get_detailed_analysis(influencer_id)
-    return influencer_data
+    return tagged_json(request, influencer_data)
+
+@app.post("/api/v1/influencers/batch")
+async def get_influencers_batch(request: InfluencerBatchRequest):
+    """Stream profile and detailed analysis for many influencers as NDJSON, in request order"""
+    async def results():
+        async for result in influencer_batch.stream(request.influencer_ids):
+            yield dumps(result) + b"\n"
+    
+    return StreamingResponse(results(), media_type="application/x-ndjson")
+
+@app.get("/api/v1/influencers/{influencer_id}/360")
+async def get_influencer_360(influencer_id: str, request: Request, content_limit: int = Query(10, ge=1, le=50),
+                             max_wait: Optional[float] = Query(None, gt=0)):
+    """Get profile, content, audience, analytics and AI analysis in one call, returning whatever is ready in time"""
+    platform = "instagram" if "instagram" in influencer_id else "youtube"
+    view = await influencer_360.fetch(platform, influencer_id, content_limit, max_wait)
+    if refresh_scheduler is not None:
+        refresh_scheduler.record({"platform": platform, "id": influencer_id, "username": influencer_id})
+    return tagged_json(request, view)
+
+@app.get("/api/v1/influencers/{influencer_id}/profile")
+async def get_influencer_profile(influencer_id: str, request: Request):
+    """Get platform profile and audience data, served from cache when available"""
+    with request_priority(Priority.INTERACTIVE):
+        if "instagram" in influencer_id:
+            platform = "instagram"
+            profile, audience = await asyncio.gather(
+                instagram_api.profile_loader.load(influencer_id),
+                instagram_api.audience_loader.load(influencer_id)
+            )
+        else:
+            platform = "youtube"
+            profile, audience = await asyncio.gather(
+                youtube_api.channel_loader.load(influencer_id),
+                youtube_api.analytics_loader.load(influencer_id)
+            )
+    
+    if refresh_scheduler is not None:
+        refresh_scheduler.record({"platform": platform, "id": influencer_id, "username": influencer_id})
+    return tagged_json(request, {"platform": platform, "profile": profile, "audience": audience})
+
+@app.get("/api/v1/influencers/{influencer_id}/features")
+async def get_influencer_features(influencer_id: str, request: Request):
+    """Get the materialized analysis features for an influencer seen in discovery"""
+    platform = "instagram" if "instagram" in influencer_id else "youtube"
+    record = feature_store.get(platform, influencer_id) if feature_store is not None else None
+    if record is None:
+        raise HTTPException(status_code=404, detail="No features materialized for this influencer")
+    return tagged_json(request, {key: value for key, value in record.items() if key != "profile"})
 
 @app.get("/api/v1/influencers/{influencer_id}/content")
-async def get_influencer_content(influencer_id: str, limit: int = 10):
+async def get_influencer_content(influencer_id: str, request: Request, limit: int = 10):
     """Get recent content from influencer"""
-    # Determine platform and fetch content
-    if "instagram" in influencer_id:
-        content = await instagram_api.get_recent_posts(influencer_id, limit)
-    else:
-        content = await youtube_api.get_recent_videos(influencer_id, limit)
+    # Interactive calls are served ahead of queued background discovery calls
+    with request_priority(Priority.INTERACTIVE):
+        # Determine platform and fetch content
+        if "instagram" in influencer_id:
+            content = await instagram_api.get_recent_posts(influencer_id, limit)
+        else:
+            content = await youtube_api.get_recent_videos(influencer_id, limit)
     
-    return {"content": content, "total": len(content)}
+    return tagged_json(request, {"content": content, "total": len(content)})
 
 # Message generation endpoints
 @app.post("/api/v1/messages/generate", response_model=MessageResponse)
 async def generate_message(request: MessageRequest):
     """Generate personalized outreach message"""
+    require_message_template(request.template_id)
     message_data = await message_generator.generate_personalized_message(
         request.influencer_id,
-        request.brand_data,
-        request.message_type
+        request.brand_data.dict(),
+        request.message_type,
+        template_id=request.template_id
     )
     
     return MessageResponse(**message_data)
 
-@app.post("/api/v1/messages/send")
-async def send_message(influencer_id: str, message: str, subject: str):
-    """Send message to influencer (simulated)"""
-    # Simulate sending message
-    await asyncio.sleep(1)
+@app.post("/api/v1/messages/generate/batch")
+async def generate_messages_batch(request: BatchMessageRequest):
+    """Stream personalized messages for many influencers as NDJSON, each as soon as it is ready"""
+    require_message_template(request.template_id)
     
-    # Random success/failure for demo
-    success = random.choice([True, True, True, False])  # 75% success rate
+    async def messages():
+        async for message in message_generator.generate_batch(
+            request.influencer_ids,
+            request.brand_data.dict(),
+            request.message_type,
+            concurrency=message_batch_concurrency,
+            template_id=request.template_id
+        ):
+            yield dumps(message) + b"\n"
     
-    if success:
-        return {
-            "status": "sent",
-            "message": "Message sent successfully",
-            "sent_at": datetime.now().isoformat()
-        }
-    else:
-        return {
-            "status": "failed",
-            "message": "Failed to send message",
-            "error": "Influencer inbox full or unavailable"
-        }
+    return StreamingResponse(messages(), media_type="application/x-ndjson")
+
+@app.post("/api/v1/messages/generate/stream")
+async def generate_message_stream(request: MessageRequest):
+    """Stream a personalized message over SSE: a part event per section, then a summary event"""
+    if request.template_id is not None:
+        raise HTTPException(status_code=400, detail="template_id is not supported for streamed messages")
+    
+    async def events():
+        try:
+            async for event in message_generator.stream_personalized_message(
+                request.influencer_id,
+                request.brand_data.dict(),
+                request.message_type
+            ):
+                name = event.pop("event")
+                yield b"event: " + name.encode() + b"\ndata: " + dumps(event) + b"\n\n"
+        except Exception as e:
+            yield b"event: error\ndata: " + dumps({"error": str(e)}) + b"\n\n"
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+def require_message_template(template_id: Optional[str]):
+    """404 for a template id that is not registered, checked before any generation starts"""
+    if template_id is not None and message_generator.engine.get(template_id) is None:
+        raise HTTPException(status_code=404, detail=f"Message template not found: {template_id}")
+
+@app.post("/api/v1/messages/templates")
+async def register_message_template(template: MessageTemplate):
+    """Register (or replace) a custom message template; it is compiled once here"""
+    try:
+        compiled = message_generator.engine.register(template)
+    except TemplateError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return {"id": compiled["id"], "name": compiled["name"], "slots": compiled["slots"]}
+
+@app.get("/api/v1/messages/templates")
+async def list_message_templates():
+    """Registered custom message templates and the slots each one uses"""
+    return {"templates": message_generator.engine.templates()}
+
+@app.delete("/api/v1/messages/templates/{template_id}")
+async def delete_message_template(template_id: str):
+    """Remove a custom message template"""
+    if not message_generator.engine.unregister(template_id):
+        raise HTTPException(status_code=404, detail=f"Message template not found: {template_id}")
+    
+    return {"id": template_id, "deleted": True}
+
+def outreach_message(record: Dict[str, Any]) -> OutreachMessage:
+    """Delivery record from the outbound queue as an OutreachMessage"""
+    def timestamp(value: Optional[float]) -> Optional[datetime]:
+        return datetime.fromtimestamp(value) if value is not None else None
+    
+    return OutreachMessage(
+        id=record["id"],
+        influencer_id=record["influencer_id"],
+        template_id=record["template_id"],
+        subject_line=record["subject"],
+        message_body=record["message"],
+        personalization_score=record["personalization_score"],
+        status=record["status"],
+        provider=record["provider"],
+        idempotency_key=record["idempotency_key"],
+        attempts=record["attempts"],
+        next_attempt_at=timestamp(record["next_attempt_at"]),
+        last_error=record["last_error"],
+        provider_message_id=record["provider_message_id"],
+        sent_at=timestamp(record["sent_at"]),
+        opened_at=None,
+        replied_at=None,
+        response_positive=None,
+        response_text=None,
+        created_at=timestamp(record["created_at"])
+    )
+
+async def enqueue_message(request: SendMessageRequest, idempotency_key: Optional[str]) -> OutreachMessage:
+    message = request.dict(exclude={"idempotency_key"})
+    provider = PROVIDER_FOR_PLATFORM[platform_of(request.influencer_id)]
+    record, _ = await outbound_queue.enqueue(provider, message, idempotency_key or request.idempotency_key)
+    return outreach_message(record)
+
+@app.post("/api/v1/messages/send", response_model=OutreachMessage, status_code=202)
+async def send_message(influencer_id: str, message: str, subject: str, template_id: Optional[str] = None,
+                       idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key")):
+    """Queue a message for delivery and return its id and delivery status right away"""
+    try:
+        return await enqueue_message(
+            SendMessageRequest(influencer_id=influencer_id, subject=subject, message=message, template_id=template_id),
+            idempotency_key
+        )
+    except IdempotencyConflictError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+@app.post("/api/v1/messages/send/batch", status_code=202)
+async def send_messages_batch(request: SendBatchRequest):
+    """Queue many messages (e.g. a campaign's outreach) at once; each may carry its own idempotency key"""
+    queued = []
+    for item in request.messages:
+        try:
+            queued.append(await enqueue_message(item, None))
+        except IdempotencyConflictError as e:
+            queued.append({"influencer_id": item.influencer_id, "idempotency_key": item.idempotency_key,
+                           "status": "rejected", "error": str(e)})
+    return {"messages": queued, "total": len(queued)}
+
+@app.get("/api/v1/messages/{message_id}", response_model=OutreachMessage)
+async def get_message_delivery(message_id: str):
+    """Delivery status of a queued message"""
+    record = await asyncio.to_thread(outbound_queue.store.get, message_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail="Message not found")
+    
+    return outreach_message(record)
 
 # Campaign management endpoints
 @app.post("/api/v1/campaigns")
@@ -270,56 +914,45 @@ async def get_campaign_metrics(campaign_id: str):
 
 # Background task for discovery process
 async def run_discovery_process(task_id: str, request: DiscoveryRequest):
-    """Background task to simulate influencer discovery"""
+    """Background task running the streaming discovery pipeline"""
     task = discovery_tasks[task_id]
+    pipeline = DiscoveryPipeline(
+        instagram_api, youtube_api, ai_analyzer,
+        analysis_pool=analysis_pool,
+        refresh_scheduler=refresh_scheduler,
+        feature_store=feature_store,
+        catalog=catalog
+    )
+    
+    def report_progress(done: int, total: int):
+        task["progress"] = min(99, int(done * 100 / total)) if total else 99
+        task["pipeline"] = pipeline.stats()
     
     try:
-        # Simulate discovery steps
-        steps = [
-            ("Scanning Instagram...", 25),
-            ("Scanning YouTube...", 50),
-            ("Analyzing content...", 75),
-            ("Calculating matches...", 100)
-        ]
-        
-        for step_name, progress in steps:
-            task["status"] = f"processing: {step_name}"
-            task["progress"] = progress
-            await asyncio.sleep(2)  # Simulate processing time
-        
-        # Generate mock influencers based on brand data
-        influencers = []
-        
-        # Instagram influencers
-        if "instagram" in request.platforms:
-            instagram_influencers = await instagram_api.discover_influencers(
-                request.brand_data, request.max_results // 2
-            )
-            influencers.extend(instagram_influencers)
-        
-        # YouTube influencers
-        if "youtube" in request.platforms:
-            youtube_influencers = await youtube_api.discover_influencers(
-                request.brand_data, request.max_results // 2
-            )
-            influencers.extend(youtube_influencers)
-        
-        # Analyze and score influencers
-        analyzed_influencers = []
-        for influencer in influencers:
-            analysis = await ai_analyzer.analyze_influencer(influencer, request.brand_data)
-            analyzed_influencers.append(analysis)
+        task["status"] = "processing: Streaming discovery pipeline..."
         
-        # Sort by match score
-        analyzed_influencers.sort(key=lambda x: x["match_score"], reverse=True)
+        # Retrieval, enrichment, scoring and ranking overlap across bounded stages
+        analyzed_influencers = await pipeline.run(
+            request.brand_data.dict(),
+            request.platforms,
+            request.max_results,
+            on_progress=report_progress
+        )
         
         task["influencers"] = analyzed_influencers
+        # Built before the task reports completed, so every results page can rely on it
+        task["index"] = ResultIndex(analyzed_influencers)
+        task["pipeline"] = pipeline.stats()
+        task["degraded"] = pipeline.degraded
+        task["progress"] = 100
         task["status"] = "completed"
         task["completed_at"] = datetime.now().isoformat()
+        task_registry.finish(task_id)
         
     except Exception as e:
         task["status"] = "failed"
         task["error"] = str(e)
+        task_registry.finish(task_id, failed=True)
 
 if __name__ == "__main__":
     uvicorn.run(
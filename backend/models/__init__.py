@@ -42,7 +42,8 @@ from .campaign import (
     ContentDeliverable,
     CampaignStatus,
     CollaborationStatus,
-    ContentType
+    ContentType,
+    DeliveryStatus
 )
 
 __all__ = [
@@ -84,7 +85,8 @@ __all__ = [
     "ContentDeliverable",
     "CampaignStatus",
     "CollaborationStatus",
-    "ContentType"
+    "ContentType",
+    "DeliveryStatus"
 ]
 
 __version__ = "1.0.0"
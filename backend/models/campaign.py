@@ -33,6 +33,13 @@ class CollaborationStatus(str, Enum):
     DECLINED = "declined"
     CANCELLED = "cancelled"
 
+class DeliveryStatus(str, Enum):
+    """Outbound message delivery status"""
+    QUEUED = "queued"
+    SENDING = "sending"
+    SENT = "sent"
+    FAILED = "failed"
+
 class ContentType(str, Enum):
     """Types of content deliverables"""
     INSTAGRAM_POST = "instagram_post"
@@ -65,6 +72,15 @@ class OutreachMessage(BaseModel):
     message_body: str = Field(description="Message content")
     personalization_score: float = Field(ge=0, le=1, description="Personalization level")
     
+    # Delivery
+    status: DeliveryStatus = Field(default=DeliveryStatus.QUEUED, description="Delivery status")
+    provider: Optional[str] = Field(default=None, description="Delivery channel")
+    idempotency_key: Optional[str] = Field(default=None, description="Client key that deduplicates sends")
+    attempts: int = Field(default=0, description="Delivery attempts made")
+    next_attempt_at: Optional[datetime] = Field(default=None, description="When the next retry is due")
+    last_error: Optional[str] = Field(default=None, description="Error of the last failed attempt")
+    provider_message_id: Optional[str] = Field(default=None, description="Provider's id for the delivered message")
+    
     # Status Tracking
     sent_at: Optional[datetime] = Field(description="When message was sent")
     opened_at: Optional[datetime] = Field(description="When message was opened")
@@ -0,0 +1,33 @@
+"""
+ICY AI Influencer Platform - Application Services
+"""
+
+from .catalog import CreatorCatalog
+from .catalog_import import CatalogImporter
+from .catalog_sync import CatalogSync, SyncConflictError
+from .discovery_pipeline import DiscoveryPipeline, PipelineStage, StageStats
+from .feature_store import FeatureStore
+from .influencer_360 import Influencer360
+from .influencer_batch import InfluencerBatchResolver
+from .outbound_queue import OutboundQueue
+from .outbound_store import OutboundStore
+from .refresh_scheduler import RefreshScheduler
+from .task_registry import IdempotencyConflictError, TaskRegistry
+
+__all__ = [
+    "CatalogImporter",
+    "CatalogSync",
+    "CreatorCatalog",
+    "DiscoveryPipeline",
+    "FeatureStore",
+    "IdempotencyConflictError",
+    "Influencer360",
+    "InfluencerBatchResolver",
+    "OutboundQueue",
+    "OutboundStore",
+    "PipelineStage",
+    "RefreshScheduler",
+    "StageStats",
+    "SyncConflictError",
+    "TaskRegistry"
+]
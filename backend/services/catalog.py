@@ -0,0 +1,174 @@
+"""
+Creator Catalog Module
+Local SQLite store of normalized creator records, kept in step with the platforms by sync jobs
+"""
+
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from core.serialization import dumps, loads
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS creators (
+    platform TEXT NOT NULL,
+    id TEXT NOT NULL,
+    username TEXT,
+    category TEXT,
+    followers INTEGER,
+    record BLOB NOT NULL,
+    record_hash TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (platform, id)
+);
+CREATE INDEX IF NOT EXISTS idx_creators_followers ON creators (platform, followers DESC);
+CREATE TABLE IF NOT EXISTS sync_cursors (
+    platform TEXT NOT NULL,
+    query TEXT NOT NULL,
+    cursor INTEGER NOT NULL,
+    passes INTEGER NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (platform, query)
+);
+"""
+
+# SQLite caps bound parameters per statement; hash lookups are chunked below it
+_MAX_PARAMS = 500
+
+
+def record_hash(record: Dict[str, Any]) -> str:
+    """Content hash of a normalized creator record"""
+    return hashlib.blake2b(dumps(record, sort_keys=True), digest_size=16).hexdigest()
+
+
+class CreatorCatalog:
+    """Creator records keyed by (platform, id), with per-query sync cursors
+
+    Methods block on SQLite; async callers run them with asyncio.to_thread.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            if path != ":memory:":
+                # Readers (discovery) are not blocked by a sync job's write transactions
+                self._db.execute("PRAGMA journal_mode=WAL")
+                self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.executescript(_SCHEMA)
+
+    def _hashes(self, platform: str, ids: List[str]) -> Dict[str, str]:
+        hashes = {}
+        for start in range(0, len(ids), _MAX_PARAMS):
+            chunk = ids[start:start + _MAX_PARAMS]
+            rows = self._db.execute(
+                f"SELECT id, record_hash FROM creators WHERE platform = ? AND id IN ({','.join('?' * len(chunk))})",
+                [platform, *chunk]
+            )
+            hashes.update(rows)
+        return hashes
+
+    def upsert_changed(self, platform: str, records: List[Dict[str, Any]],
+                       cursor: Optional[Tuple[str, int, int]] = None) -> Dict[str, int]:
+        """Write records whose content hash changed, in one transaction
+
+        cursor is an optional (query, next_offset, passes) saved in the same transaction, so
+        a resumed sync never skips or re-counts a page. An id given more than once is written
+        once, from its last record; the extra records count as skipped and as duplicates.
+        Returns inserted/updated/skipped/duplicates counts.
+        """
+        now = time.time()
+        latest = {record["id"]: record for record in records}
+        with self._lock, self._db:
+            stored = self._hashes(platform, list(latest))
+            rows = []
+            inserted = 0
+            for record in latest.values():
+                digest = record_hash(record)
+                previous = stored.get(record["id"])
+                if previous == digest:
+                    continue
+                if previous is None:
+                    inserted += 1
+                rows.append((
+                    platform, record["id"], record.get("username"), record.get("category"),
+                    record.get("followers"), dumps(record), digest, now
+                ))
+            self._db.executemany(
+                "INSERT INTO creators (platform, id, username, category, followers, record, record_hash, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (platform, id) DO UPDATE SET username = excluded.username, "
+                "category = excluded.category, followers = excluded.followers, record = excluded.record, "
+                "record_hash = excluded.record_hash, updated_at = excluded.updated_at",
+                rows
+            )
+            if cursor is not None:
+                query, offset, passes = cursor
+                self._db.execute(
+                    "INSERT OR REPLACE INTO sync_cursors (platform, query, cursor, passes, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (platform, query, offset, passes, now)
+                )
+        return {"inserted": inserted, "updated": len(rows) - inserted, "skipped": len(records) - len(rows),
+                "duplicates": len(records) - len(latest)}
+
+    def cursor(self, platform: str, query: str = "") -> Tuple[int, int]:
+        """Saved (next_offset, completed_passes) for a platform query"""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT cursor, passes FROM sync_cursors WHERE platform = ? AND query = ?", (platform, query)
+            ).fetchone()
+        return row if row else (0, 0)
+
+    def get(self, platform: str, creator_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT record FROM creators WHERE platform = ? AND id = ?", (platform, creator_id)
+            ).fetchone()
+        return loads(row[0]) if row else None
+
+    def known_ids(self, platform: str, ids: List[str]) -> Set[str]:
+        """The given creator ids that are already in the catalog"""
+        with self._lock:
+            return set(self._hashes(platform, ids))
+
+    def page(self, platform: str, interests: str = "", offset: int = 0, limit: int = 25) -> List[Dict[str, Any]]:
+        """One page of creators, those in a matching category first, then by followers"""
+        terms = [term for term in re.split(r"[\s,;/&]+", interests.lower()) if len(term) > 2][:10]
+        order = "followers DESC"
+        params: List[Any] = [platform]
+        if terms:
+            order = f"CASE WHEN {' OR '.join('lower(category) LIKE ?' for _ in terms)} THEN 0 ELSE 1 END, {order}"
+            params.extend(f"%{term}%" for term in terms)
+        params.extend([limit, offset])
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT record FROM creators WHERE platform = ? ORDER BY {order}, id LIMIT ? OFFSET ?", params
+            ).fetchall()
+        return [loads(row[0]) for row in rows]
+
+    def count(self, platform: Optional[str] = None) -> int:
+        with self._lock:
+            if platform is None:
+                return self._db.execute("SELECT COUNT(*) FROM creators").fetchone()[0]
+            return self._db.execute("SELECT COUNT(*) FROM creators WHERE platform = ?", (platform,)).fetchone()[0]
+
+    def stats(self) -> Dict[str, Any]:
+        """Record counts per platform and saved sync cursors"""
+        with self._lock:
+            counts = dict(self._db.execute("SELECT platform, COUNT(*) FROM creators GROUP BY platform"))
+            cursors = [
+                {"platform": platform, "query": query, "cursor": cursor, "passes": passes}
+                for platform, query, cursor, passes in self._db.execute(
+                    "SELECT platform, query, cursor, passes FROM sync_cursors ORDER BY platform, query"
+                )
+            ]
+        return {"path": self.path, "creators": counts, "total": sum(counts.values()), "sync_cursors": cursors}
+
+    def close(self):
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,190 @@
+"""
+Catalog Import Module
+Streaming CSV/NDJSON import of creator lists into the catalog, validated against the models
+"""
+
+import csv
+import time
+from typing import Any, Dict, IO, Iterator, List, Optional, Tuple, get_args
+
+from pydantic import ValidationError
+
+from core.serialization import loads
+from models.influencer import Influencer, InfluencerCategory, InfluencerMetrics
+from .catalog import CreatorCatalog
+
+FORMATS = ("csv", "ndjson")
+
+_METRIC_FIELDS = tuple(InfluencerMetrics.model_fields)
+
+
+def _nullable_fields(model) -> Tuple[str, ...]:
+    """Optional[...] fields declared without a default, which import rows may omit"""
+    return tuple(
+        name for name, field in model.model_fields.items()
+        if field.is_required() and type(None) in get_args(field.annotation)
+    )
+
+
+_NULLABLE_FIELDS = _nullable_fields(Influencer)
+_NULLABLE_METRICS = _nullable_fields(InfluencerMetrics)
+
+# Category spellings seen in agency exports: enum values, enum names and their first word
+_CATEGORIES: Dict[str, str] = {}
+for _category in InfluencerCategory:
+    _CATEGORIES[_category.value.lower()] = _category.value
+    _CATEGORIES[_category.name.lower()] = _category.value
+    _CATEGORIES.setdefault(_category.value.split()[0].lower(), _category.value)
+
+
+def detect_format(content_type: Optional[str], filename: Optional[str] = None) -> Optional[str]:
+    """csv or ndjson from a content type or file extension"""
+    hint = f"{content_type or ''} {filename or ''}".lower()
+    if "csv" in hint:
+        return "csv"
+    if "ndjson" in hint or "jsonl" in hint or "x-ndjson" in hint:
+        return "ndjson"
+    return None
+
+
+def _rows(stream: IO[str], fmt: str) -> Iterator[Tuple[int, Any]]:
+    """(line number, row dict or parse error message) for each row of the stream"""
+    if fmt == "csv":
+        reader = csv.DictReader(stream)
+        for row in reader:
+            # Empty CSV cells mean "not provided" rather than an empty value
+            yield reader.line_num, {key: value for key, value in row.items() if key and value not in ("", None)}
+        return
+    for line_number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            row = loads(line.encode())
+        except ValueError as e:
+            yield line_number, f"invalid JSON: {e}"
+            continue
+        yield line_number, row if isinstance(row, dict) else "expected a JSON object"
+
+
+def model_input(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape a flat or nested import row into Influencer model input"""
+    data = dict(row)
+    metrics = dict(data.get("metrics") or {})
+    for name in _METRIC_FIELDS:
+        if name in data:
+            metrics.setdefault(name, data.pop(name))
+    # Aliases used by the discovery records the catalog already holds
+    if "followers" in data:
+        metrics.setdefault("followers_count", data.pop("followers"))
+    for name in _NULLABLE_FIELDS:
+        data.setdefault(name, None)
+    for name in _NULLABLE_METRICS:
+        metrics.setdefault(name, None)
+    data["metrics"] = metrics
+    category = data.get("category")
+    if isinstance(category, str):
+        data["category"] = _CATEGORIES.get(category.strip().lower(), category)
+    return data
+
+
+def catalog_record(influencer: Influencer) -> Dict[str, Any]:
+    """Catalog record, in the shape discovery produces, for a validated influencer"""
+    metrics = influencer.metrics
+    record = {
+        "id": influencer.id,
+        "platform": influencer.platform.value,
+        "username": influencer.username,
+        "display_name": influencer.display_name,
+        "followers": metrics.followers_count,
+        "engagement_rate": metrics.engagement_rate,
+        "category": influencer.category.value,
+        "location": influencer.location or "",
+        "profile_image": influencer.profile_image_url or "",
+        "bio": influencer.bio or "",
+        "verified": influencer.is_verified,
+        "business_account": influencer.is_business_account,
+        "avg_likes": metrics.avg_likes,
+        "avg_comments": metrics.avg_comments,
+        "recent_post": ""
+    }
+    if metrics.avg_views is not None:
+        record["avg_views"] = metrics.avg_views
+    return record
+
+
+class CatalogImporter:
+    """Validates rows chunk by chunk and upserts each chunk into the catalog in bulk
+
+    Memory use is bounded by chunk_size regardless of file size; invalid rows are
+    reported individually and never stop the import.
+    """
+
+    def __init__(self, catalog: CreatorCatalog, chunk_size: int = 1000, max_reported_errors: int = 1000):
+        self.catalog = catalog
+        self.chunk_size = chunk_size
+        # Errors past this many are counted but not reported row by row
+        self.max_reported_errors = max_reported_errors
+
+    def run(self, stream: IO[str], fmt: str) -> Iterator[List[Dict[str, Any]]]:
+        """Import a text stream, yielding the events (errors, progress, summary) of each chunk"""
+        if fmt not in FORMATS:
+            raise ValueError(f"Unsupported import format: {fmt}")
+        summary = {"event": "summary", "rows": 0, "valid": 0, "invalid": 0,
+                   "inserted": 0, "updated": 0, "skipped": 0, "duplicates": 0, "chunks": 0}
+        started = time.perf_counter()
+        chunk: List[Tuple[int, Any]] = []
+        for row in _rows(stream, fmt):
+            chunk.append(row)
+            if len(chunk) >= self.chunk_size:
+                yield self._import_chunk(chunk, summary, started)
+                chunk = []
+        events = self._import_chunk(chunk, summary, started) if chunk else []
+        summary["elapsed_seconds"] = round(time.perf_counter() - started, 3)
+        summary["rows_per_second"] = round(summary["rows"] / summary["elapsed_seconds"], 1) \
+            if summary["elapsed_seconds"] else 0.0
+        yield events + [summary]
+
+    def _import_chunk(self, chunk: List[Tuple[int, Any]], summary: Dict[str, Any],
+                      started: float) -> List[Dict[str, Any]]:
+        events: List[Dict[str, Any]] = []
+        by_platform: Dict[str, List[Dict[str, Any]]] = {}
+        for line, row in chunk:
+            try:
+                if isinstance(row, str):
+                    raise ValueError(row)
+                influencer = Influencer.model_validate(model_input(row))
+            except ValidationError as e:
+                errors = [f"{'.'.join(map(str, error['loc']))}: {error['msg']}" for error in e.errors()]
+                self._report(events, summary, line, row, errors)
+                continue
+            except ValueError as e:
+                self._report(events, summary, line, row, [str(e)])
+                continue
+            record = catalog_record(influencer)
+            by_platform.setdefault(record["platform"], []).append(record)
+
+        for platform, records in by_platform.items():
+            counts = self.catalog.upsert_changed(platform, records)
+            summary["valid"] += len(records)
+            # Repeated ids in a chunk are collapsed to their last row and counted as duplicates
+            for name in ("inserted", "updated", "skipped", "duplicates"):
+                summary[name] += counts[name]
+
+        summary["rows"] += len(chunk)
+        summary["chunks"] += 1
+        elapsed = time.perf_counter() - started
+        events.append({
+            "event": "progress",
+            "rows": summary["rows"],
+            "valid": summary["valid"],
+            "invalid": summary["invalid"],
+            "rows_per_second": round(summary["rows"] / elapsed, 1) if elapsed else 0.0
+        })
+        return events
+
+    def _report(self, events: List[Dict[str, Any]], summary: Dict[str, Any], line: int, row: Any,
+                errors: List[str]):
+        summary["invalid"] += 1
+        if summary["invalid"] <= self.max_reported_errors:
+            row_id = row.get("id") if isinstance(row, dict) else None
+            events.append({"event": "error", "line": line, "id": row_id, "errors": errors})
@@ -0,0 +1,162 @@
+"""
+Catalog Sync Module
+Resumable incremental crawl of platform creators into the local catalog
+"""
+
+import asyncio
+import itertools
+import logging
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional
+
+from core.rate_limiter import Priority, request_priority
+from .catalog import CreatorCatalog
+
+logger = logging.getLogger(__name__)
+
+
+class SyncConflictError(Exception):
+    """Raised when a sync for the same platform query is already running"""
+
+
+class CatalogSync:
+    """Pages through platform creators and writes only changed records to the catalog
+
+    Progress is saved as a cursor after every page, so an interrupted or budget-limited
+    run resumes where it stopped; a short page marks a completed pass and rewinds the cursor.
+    """
+
+    def __init__(self, catalog: CreatorCatalog, clients: Dict[str, Any], page_size: int = 50,
+                 max_records_per_run: int = 1000, interval: float = 0.0, history: int = 50):
+        self.catalog = catalog
+        self.clients = clients
+        self.page_size = page_size
+        self.max_records_per_run = max_records_per_run
+        # Seconds between scheduled runs over every platform (0 = on demand only)
+        self.interval = interval
+        self.runs: Deque[Dict[str, Any]] = deque(maxlen=history)
+        self._ids = itertools.count(1)
+        self._running: Dict[tuple, asyncio.Task] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def start_run(self, platform: str, query: str = "", max_records: Optional[int] = None) -> Dict[str, Any]:
+        """Start a sync run in the background and return its live stats"""
+        key = (platform, query)
+        if key in self._running:
+            raise SyncConflictError(f"A {platform} catalog sync for '{query}' is already running")
+        run = self._new_run(platform, query, max_records or self.max_records_per_run)
+        task = asyncio.get_running_loop().create_task(self._sync(run))
+        self._running[key] = task
+        task.add_done_callback(lambda _: self._running.pop(key, None))
+        return run
+
+    async def run(self, platform: str, query: str = "", max_records: Optional[int] = None) -> Dict[str, Any]:
+        """Run a sync to completion and return its stats"""
+        run = self.start_run(platform, query, max_records)
+        await self._running[(platform, query)]
+        return run
+
+    def _new_run(self, platform: str, query: str, max_records: int) -> Dict[str, Any]:
+        run = {
+            "run_id": next(self._ids),
+            "platform": platform,
+            "query": query,
+            "status": "running",
+            "started_at": datetime.now().isoformat(),
+            "finished_at": None,
+            "max_records": max_records,
+            "cursor_start": None,
+            "cursor_end": None,
+            "pages": 0,
+            "scanned": 0,
+            "changed": 0,
+            "inserted": 0,
+            "updated": 0,
+            "skipped": 0,
+            "elapsed_seconds": 0.0,
+            "records_per_second": 0.0,
+            "error": None
+        }
+        self.runs.appendleft(run)
+        return run
+
+    async def _sync(self, run: Dict[str, Any]):
+        platform, query = run["platform"], run["query"]
+        client = self.clients[platform]
+        started = time.perf_counter()
+        try:
+            offset, passes = await asyncio.to_thread(self.catalog.cursor, platform, query)
+            run["cursor_start"] = run["cursor_end"] = offset
+            # Sync traffic yields to interactive requests on the shared rate limits
+            with request_priority(Priority.BACKGROUND):
+                while run["scanned"] < run["max_records"]:
+                    if client.budget_mode() != "normal":
+                        run["status"] = f"paused: {client.budget_mode()} call budget"
+                        break
+                    page = await client.discover_influencers_page({"targetInterests": query}, offset, self.page_size)
+                    if len(page) < self.page_size:
+                        next_offset, passes = 0, passes + 1
+                    else:
+                        next_offset = offset + len(page)
+                    counts = await asyncio.to_thread(
+                        self.catalog.upsert_changed, platform, page, (query, next_offset, passes)
+                    )
+                    self._count_page(run, page, counts, time.perf_counter() - started)
+                    offset = run["cursor_end"] = next_offset
+                    if next_offset == 0:
+                        run["status"] = "completed pass"
+                        break
+            if run["status"] == "running":
+                run["status"] = "completed"
+        except asyncio.CancelledError:
+            run["status"] = "cancelled"
+            raise
+        except Exception as e:
+            run["status"] = "failed"
+            run["error"] = str(e)
+            logger.error(f"Catalog sync of {platform} failed: {e}")
+        finally:
+            run["finished_at"] = datetime.now().isoformat()
+            self._count_page(run, [], {}, time.perf_counter() - started)
+
+    def _count_page(self, run: Dict[str, Any], page: List[Dict], counts: Dict[str, int], elapsed: float):
+        run["pages"] += 1 if page else 0
+        run["scanned"] += len(page)
+        for name in ("inserted", "updated", "skipped"):
+            run[name] += counts.get(name, 0)
+        run["changed"] = run["inserted"] + run["updated"]
+        run["elapsed_seconds"] = round(elapsed, 3)
+        run["records_per_second"] = round(run["scanned"] / elapsed, 1) if elapsed > 0 else 0.0
+
+    async def _schedule(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            for platform in self.clients:
+                if (platform, "") not in self._running:
+                    await self.run(platform)
+
+    def start(self):
+        """Begin scheduled syncs when an interval is configured"""
+        if self.interval > 0 and self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._schedule())
+
+    async def stop(self):
+        tasks = [task for task in (self._task, *self._running.values()) if task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Totals across recent runs plus the runs themselves, newest first"""
+        return {
+            "interval_seconds": self.interval,
+            "running": [f"{platform}:{query}" for platform, query in self._running],
+            "recent_runs": len(self.runs),
+            "scanned": sum(run["scanned"] for run in self.runs),
+            "changed": sum(run["changed"] for run in self.runs),
+            "skipped": sum(run["skipped"] for run in self.runs),
+            "runs": list(self.runs)
+        }
@@ -0,0 +1,327 @@
+"""
+Discovery Pipeline Module
+Streams influencer discovery through bounded async stages: retrieve -> enrich -> score -> rank
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from core.rate_limiter import Priority, request_priority
+
+# End-of-stream marker passed down the stage queues
+_DONE = object()
+
+
+class StageStats:
+    """Throughput and queue-depth counters for a single pipeline stage"""
+
+    def __init__(self, name: str, concurrency: int, queue_size: int):
+        self.name = name
+        self.concurrency = concurrency
+        self.queue_size = queue_size
+        self.items_in = 0
+        self.items_out = 0
+        self.errors = 0
+        self.last_error: Optional[str] = None
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.busy_seconds = 0.0
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    def observe_depth(self, depth: int):
+        """Record the current depth of the stage input queue"""
+        self.queue_depth = depth
+        if depth > self.max_queue_depth:
+            self.max_queue_depth = depth
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a JSON-friendly view of the stage counters"""
+        end = self.finished_at or time.perf_counter()
+        elapsed = end - self.started_at if self.started_at else 0.0
+        return {
+            "stage": self.name,
+            "concurrency": self.concurrency,
+            "queue_size": self.queue_size,
+            "items_in": self.items_in,
+            "items_out": self.items_out,
+            "errors": self.errors,
+            "last_error": self.last_error,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "elapsed_seconds": round(elapsed, 3),
+            "busy_seconds": round(self.busy_seconds, 3),
+            "throughput_per_second": round(self.items_out / elapsed, 2) if elapsed > 0 else 0.0,
+            "running": self.started_at is not None and self.finished_at is None
+        }
+
+
+class PipelineStage:
+    """A pool of workers pulling items from a bounded input queue"""
+
+    def __init__(self, name: str, handler: Callable[[Any], Awaitable[Any]],
+                 concurrency: int = 1, queue_size: int = 64, fan_out: bool = False,
+                 batch_size: Optional[int] = None):
+        self.name = name
+        self.handler = handler
+        self.concurrency = max(1, concurrency)
+        # Batch stages hand the handler a list of queued items and fan out its list result
+        self.batch_size = batch_size
+        self.fan_out = fan_out or batch_size is not None
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.stats = StageStats(name, self.concurrency, queue_size)
+
+    async def put(self, item: Any):
+        """Enqueue an item, waiting while the stage is saturated (backpressure)"""
+        await self.queue.put(item)
+        self.stats.observe_depth(self.queue.qsize())
+
+    async def close(self):
+        """Signal that no more items will arrive"""
+        await self.queue.put(_DONE)
+
+    async def run(self, downstream: Optional["PipelineStage"] = None):
+        """Run the stage workers until the input is exhausted, then close downstream"""
+        self.stats.started_at = time.perf_counter()
+        try:
+            await asyncio.gather(*(self._worker(downstream) for _ in range(self.concurrency)))
+        finally:
+            self.stats.finished_at = time.perf_counter()
+        if downstream is not None:
+            await downstream.close()
+
+    def _take_batch(self, first: Any) -> List[Any]:
+        """Collect already-queued items behind the first one, up to batch_size"""
+        batch = [first]
+        while len(batch) < self.batch_size and not self.queue.empty():
+            item = self.queue.get_nowait()
+            if item is _DONE:
+                self.queue.put_nowait(_DONE)
+                break
+            batch.append(item)
+        return batch
+
+    async def _worker(self, downstream: Optional["PipelineStage"]):
+        while True:
+            item = await self.queue.get()
+            if item is _DONE:
+                # Leave the marker in place for sibling workers
+                self.queue.put_nowait(_DONE)
+                return
+            if self.batch_size is not None:
+                item = self._take_batch(item)
+            self.stats.observe_depth(self.queue.qsize())
+
+            self.stats.items_in += len(item) if self.batch_size is not None else 1
+            started = time.perf_counter()
+            try:
+                result = await self.handler(item)
+            except Exception as e:
+                self.stats.errors += 1
+                self.stats.last_error = str(e)
+                continue
+            finally:
+                self.stats.busy_seconds += time.perf_counter() - started
+
+            if result is None:
+                continue
+            for output in (result if self.fan_out else [result]):
+                if downstream is not None:
+                    await downstream.put(output)
+                self.stats.items_out += 1
+
+
+class DiscoveryPipeline:
+    """Streaming influencer discovery with per-stage concurrency and bounded queues"""
+
+    def __init__(self, instagram_api, youtube_api, ai_analyzer,
+                 analysis_pool=None,
+                 page_size: int = 25,
+                 queue_size: int = 64,
+                 retrieve_concurrency: int = 2,
+                 enrich_concurrency: int = 8,
+                 enrich_batch_size: int = 50,
+                 score_concurrency: int = 32,
+                 content_limit: int = 6,
+                 refresh_scheduler=None,
+                 feature_store=None,
+                 catalog=None):
+        self.clients = {
+            "instagram": instagram_api,
+            "youtube": youtube_api
+        }
+        self.ai_analyzer = ai_analyzer
+        self.analysis_pool = analysis_pool
+        self.page_size = page_size
+        self.content_limit = content_limit
+        # Optional RefreshScheduler told about every ranked creator
+        self.refresh_scheduler = refresh_scheduler
+        # Optional FeatureStore; scoring then joins against materialized features
+        self.feature_store = feature_store
+        # Optional CreatorCatalog; populated platforms are retrieved locally instead of live
+        self.catalog = catalog
+
+        # With a process pool, score in batches and keep roughly two batches per worker in flight
+        score_batch_size = 1
+        if analysis_pool is not None:
+            score_batch_size = analysis_pool.batch_size
+            score_concurrency = min(score_concurrency, analysis_pool.max_workers * 2)
+
+        self.stages = [
+            PipelineStage("retrieve", self._retrieve, retrieve_concurrency, queue_size, fan_out=True),
+            PipelineStage("enrich", self._enrich, enrich_concurrency, queue_size, batch_size=enrich_batch_size),
+            PipelineStage("score", self._score, score_concurrency, queue_size, batch_size=score_batch_size),
+            PipelineStage("rank", self._rank, 1, queue_size)
+        ]
+
+        self._brand_data: Dict = {}
+        self._max_results = 0
+        self._expected = 0
+        self._ranked: List = []
+        self._ranked_count = 0
+        self._sequence = itertools.count()
+        self._on_progress: Optional[Callable[[int, int], None]] = None
+        # Platforms that ran with reduced enrichment or retrieval, and why
+        self.degraded: Dict[str, str] = {}
+
+    async def run(self, brand_data: Dict, platforms: List[str], max_results: int,
+                  on_progress: Optional[Callable[[int, int], None]] = None) -> List[Dict]:
+        """Run discovery end to end and return influencers sorted by match score"""
+        # A platform listed twice is searched once, matching the request's deduplication fingerprint
+        sources = list(dict.fromkeys(platform for platform in platforms if platform in self.clients))
+        if not sources or max_results <= 0:
+            return []
+
+        self._brand_data = brand_data
+        self._max_results = max_results
+        self._on_progress = on_progress
+        per_platform = max_results // len(sources)
+        self._expected = per_platform * len(sources)
+
+        # Stage tasks inherit background priority, so interactive requests jump the rate-limit queues
+        with request_priority(Priority.BACKGROUND):
+            tasks = [asyncio.create_task(self._feed(sources, per_platform))]
+            for index, stage in enumerate(self.stages):
+                downstream = self.stages[index + 1] if index + 1 < len(self.stages) else None
+                tasks.append(asyncio.create_task(stage.run(downstream)))
+
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        ranked = sorted(self._ranked, reverse=True)
+        return [entry[2] for entry in ranked]
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Per-stage throughput and queue-depth statistics"""
+        return [stage.stats.snapshot() for stage in self.stages]
+
+    async def _feed(self, sources: List[str], per_platform: int):
+        """Seed the retrieve stage with one request per result page"""
+        retrieve = self.stages[0]
+        for offset in range(0, per_platform, self.page_size):
+            for platform in sources:
+                limit = min(self.page_size, per_platform - offset)
+                await retrieve.put((platform, offset, limit))
+        await retrieve.close()
+
+    async def _retrieve(self, page_request) -> List[Dict]:
+        """Fetch one page of candidate influencers from the local catalog, topped up from the platform
+
+        Pages run through the catalog first and continue into live search results once the
+        catalog has no more creators of the platform.
+        """
+        platform, offset, limit = page_request
+        if self.catalog is None:
+            return await self._search(platform, offset, limit)
+        catalog_size = await asyncio.to_thread(self.catalog.count, platform)
+        if not catalog_size:
+            return await self._search(platform, offset, limit)
+
+        interests = self._brand_data.get("target_interests") or self._brand_data.get("targetInterests") or ""
+        rows = await asyncio.to_thread(self.catalog.page, platform, interests, offset, limit)
+        if len(rows) >= limit:
+            return rows
+        live = await self._search(platform, max(0, offset - catalog_size), limit - len(rows))
+        # Creators the catalog already holds were, or will be, served from its pages
+        known = await asyncio.to_thread(
+            self.catalog.known_ids, platform, [influencer["id"] for influencer in live if "id" in influencer]
+        )
+        return rows + [influencer for influencer in live if influencer.get("id") not in known]
+
+    async def _search(self, platform: str, offset: int, limit: int) -> List[Dict]:
+        """Fetch one page of candidate influencers from the platform's live search"""
+        client = self.clients[platform]
+        if client.budget_mode() == "exhausted":
+            self.degraded[platform] = "exhausted budget: retrieval skipped"
+            return []
+        return await client.discover_influencers_page(self._brand_data, offset, limit)
+
+    async def _enrich(self, influencers: List[Dict]) -> List[Dict]:
+        """Enrich a batch of candidates together so loader lookups share upstream calls"""
+        return list(await asyncio.gather(*(self._enrich_one(influencer) for influencer in influencers)))
+
+    async def _enrich_one(self, influencer: Dict) -> Dict:
+        """Attach profile, recent content and audience data to a candidate"""
+        platform = influencer["platform"]
+        client = self.clients[platform]
+
+        # Under a tight call budget, drop the per-creator content fetch first
+        budget_mode = client.budget_mode()
+        if budget_mode != "normal":
+            self.degraded[platform] = f"{budget_mode} budget: content enrichment skipped"
+
+        # A failed enrichment call degrades the candidate rather than dropping it
+        influencer["enrichment"] = await client.enrich(
+            influencer, self.content_limit, include_content=budget_mode == "normal"
+        )
+        return influencer
+
+    async def _score(self, influencers: List[Dict]) -> List[Dict]:
+        """Run AI analysis on a batch and drop the bulky enrichment payload"""
+        features = None
+        if self.feature_store is not None:
+            # Only feature groups whose source data changed are recomputed, off the event loop
+            features = await asyncio.to_thread(self.feature_store.materialize_many, influencers)
+        for influencer in influencers:
+            influencer.pop("enrichment", None)
+
+        if self.analysis_pool is not None:
+            analyses = await self.analysis_pool.analyze_batch(influencers, self._brand_data, features)
+        elif features is not None:
+            analyses = [
+                self.ai_analyzer.analyze_with_features(influencer, influencer_features, self._brand_data)
+                for influencer, influencer_features in zip(influencers, features)
+            ]
+        else:
+            return list(await asyncio.gather(*(
+                self.ai_analyzer.analyze_influencer(influencer, self._brand_data)
+                for influencer in influencers
+            )))
+        # The synchronous paths still send their insights through the inference gateway, if any,
+        # as one concurrent burst the gateway can micro-batch
+        return list(await asyncio.gather(*(
+            self.ai_analyzer.refine_insights(analysis, self._brand_data) for analysis in analyses
+        )))
+
+    async def _rank(self, analysis: Dict) -> Dict:
+        """Keep only the top max_results influencers in a bounded heap"""
+        entry = (analysis.get("match_score", 0), -next(self._sequence), analysis)
+        if len(self._ranked) < self._max_results:
+            heapq.heappush(self._ranked, entry)
+        else:
+            heapq.heappushpop(self._ranked, entry)
+
+        self._ranked_count += 1
+        if self.refresh_scheduler is not None:
+            # Better matches are more likely to be looked at again
+            self.refresh_scheduler.record(analysis, weight=analysis.get("match_score", 0) / 100)
+        if self._on_progress:
+            self._on_progress(self._ranked_count, self._expected)
+        return analysis
@@ -0,0 +1,226 @@
+"""
+Feature Store Module
+Materialized per-creator analysis features, recomputed only when their source data changes
+"""
+
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from api.ai_analyzer import FEATURE_VERSION
+from core.rate_limiter import Priority, request_priority
+from core.serialization import dumps
+
+logger = logging.getLogger(__name__)
+
+# Feature groups and the source each one is derived from
+FEATURE_GROUPS = ("profile", "content", "audience")
+
+# Profile fields profile features are computed from; changes elsewhere do not trigger a recompute
+PROFILE_SOURCE_FIELDS = (
+    "platform", "followers", "engagement_rate", "avg_likes", "avg_comments", "avg_views",
+    "bio", "verified", "category"
+)
+
+
+def _digest(source: Any) -> str:
+    return hashlib.blake2b(dumps(source, sort_keys=True), digest_size=16).hexdigest()
+
+
+class FeatureStore:
+    """Per-creator features keyed by (platform, id)
+
+    Each feature group remembers a content hash of the source it was computed from;
+    materializing a creator again recomputes only the groups whose source changed.
+    Extraction is CPU-bound, so async callers run materialize_many with asyncio.to_thread.
+    """
+
+    def __init__(self, analyzer, clients: Dict[str, Any], max_creators: int = 50000,
+                 refresh_interval: float = 300.0, max_age: float = 3600.0,
+                 refresh_batch_size: int = 50, content_limit: int = 6):
+        self.analyzer = analyzer
+        self.clients = clients
+        self.max_creators = max_creators
+        self.refresh_interval = refresh_interval
+        # Features not checked against their source for this long are re-read on refresh
+        self.max_age = max_age
+        self.refresh_batch_size = refresh_batch_size
+        self.content_limit = content_limit
+        self._records: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+        # Guards the records against materialization running in a worker thread
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+        # Stats
+        self.materializations = 0
+        self.recomputed = {group: 0 for group in FEATURE_GROUPS}
+        self.unchanged = 0
+        self.extract_seconds = 0.0
+        self.refresh_cycles = 0
+        self.refreshed = 0
+        self.skipped_budget = 0
+        self.refresh_errors = 0
+        self.last_error: Optional[str] = None
+
+    def get(self, platform: str, creator_id: str) -> Optional[Dict[str, Any]]:
+        """Stored record for a creator: features, source hashes and timestamps"""
+        with self._lock:
+            record = self._records.get((platform, creator_id))
+            return None if record is None else {**record, "features": dict(record["features"])}
+
+    def materialize(self, influencer: Dict) -> Dict[str, Any]:
+        """Features for an (optionally enriched) influencer, reusing unchanged groups"""
+        with self._lock:
+            return self._materialize(influencer)
+
+    def _materialize(self, influencer: Dict) -> Dict[str, Any]:
+        self.materializations += 1
+        key = (influencer["platform"], influencer["id"])
+        record = self._records.get(key)
+        if record is None or record["version"] != FEATURE_VERSION:
+            record = {
+                "platform": key[0],
+                "id": key[1],
+                "version": FEATURE_VERSION,
+                "source_hashes": {group: None for group in FEATURE_GROUPS},
+                "computed_at": {group: None for group in FEATURE_GROUPS},
+                "features": {"cadence": None, "content_vector": {}, "audience_vector": {}}
+            }
+            self._records[key] = record
+        self._records.move_to_end(key)
+
+        enrichment = influencer.get("enrichment") or {}
+        profile = {name: value for name, value in influencer.items() if name != "enrichment"}
+        sources = {
+            "profile": {name: profile.get(name) for name in PROFILE_SOURCE_FIELDS},
+            "content": enrichment.get("content"),
+            "audience": enrichment.get("audience")
+        }
+        record["username"] = profile.get("username") or key[1]
+        record["profile"] = profile
+
+        now = datetime.now().isoformat()
+        started = time.perf_counter()
+        for group, source in sources.items():
+            # A part that failed to load keeps the features computed from its last good copy
+            if source is None:
+                continue
+            digest = _digest(source)
+            if digest == record["source_hashes"][group]:
+                self.unchanged += 1
+                continue
+            record["features"].update(self._extract(group, profile if group == "profile" else source))
+            record["source_hashes"][group] = digest
+            record["computed_at"][group] = now
+            self.recomputed[group] += 1
+        self.extract_seconds += time.perf_counter() - started
+        record["checked_at"] = time.time()
+
+        while len(self._records) > self.max_creators:
+            self._records.popitem(last=False)
+        return dict(record["features"])
+
+    def materialize_many(self, influencers: List[Dict]) -> List[Dict[str, Any]]:
+        return [self.materialize(influencer) for influencer in influencers]
+
+    def _extract(self, group: str, source: Any) -> Dict[str, Any]:
+        if group == "profile":
+            return self.analyzer.extract_profile_features(source)
+        if group == "content":
+            return self.analyzer.extract_content_features(source)
+        return self.analyzer.extract_audience_features(source)
+
+    async def refresh_stale(self) -> int:
+        """Re-read sources for creators not checked within max_age; returns creators checked"""
+        cutoff = time.time() - self.max_age
+        stale: Dict[str, List[Dict[str, Any]]] = {}
+        with self._lock:
+            records = list(self._records.values())
+        for record in records:
+            if record.get("checked_at", 0.0) < cutoff:
+                stale.setdefault(record["platform"], []).append(record)
+
+        checked = 0
+        with request_priority(Priority.BACKGROUND):
+            for platform, records in stale.items():
+                client = self.clients.get(platform)
+                if client is None:
+                    continue
+                # Refreshing is optional work; spend call budgets on it only when they are healthy
+                if client.budget_mode() != "normal":
+                    self.skipped_budget += 1
+                    continue
+                for start in range(0, len(records), self.refresh_batch_size):
+                    chunk = records[start:start + self.refresh_batch_size]
+                    # Enrichment lookups go through the batch loaders, so a chunk costs a few calls
+                    enrichments = await asyncio.gather(*(
+                        client.enrich(record["profile"], self.content_limit) for record in chunk
+                    ))
+                    await asyncio.to_thread(self.materialize_many, [
+                        {**self._refreshed_profile(client, record, enrichment), "enrichment": enrichment}
+                        for record, enrichment in zip(chunk, enrichments)
+                    ])
+                    checked += len(chunk)
+
+        self.refresh_cycles += 1
+        self.refreshed += checked
+        return checked
+
+    def _refreshed_profile(self, client, record: Dict[str, Any], enrichment: Dict[str, Any]) -> Dict[str, Any]:
+        """Stored profile updated from a freshly fetched platform profile, when one loaded"""
+        if enrichment["profile"] is None:
+            return record["profile"]
+        try:
+            profile = client.format_profile(enrichment["profile"])
+        except (KeyError, TypeError):
+            return record["profile"]
+        # Keep the identity the record is stored under
+        return {**profile, "platform": record["platform"], "id": record["id"],
+                "username": record["profile"].get("username", profile.get("username"))}
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await self.refresh_stale()
+            except Exception as e:
+                self.refresh_errors += 1
+                self.last_error = str(e)
+                logger.error(f"Feature refresh failed: {e}")
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Stored creators, recompute counts per feature group and refresh cycles"""
+        checks = self.unchanged + sum(self.recomputed.values())
+        return {
+            "feature_version": FEATURE_VERSION,
+            "creators": len(self._records),
+            "materializations": self.materializations,
+            "groups_recomputed": dict(self.recomputed),
+            "groups_unchanged": self.unchanged,
+            # Share of group checks answered from stored features
+            "reuse_rate": round(self.unchanged / checks, 3) if checks else 0.0,
+            "extract_ms": round(self.extract_seconds * 1000, 2),
+            "refresh_cycles": self.refresh_cycles,
+            "creators_refreshed": self.refreshed,
+            "skipped_for_budget": self.skipped_budget,
+            "refresh_errors": self.refresh_errors,
+            "last_error": self.last_error
+        }
@@ -0,0 +1,104 @@
+"""
+Influencer 360 Module
+Composite creator detail view fetched as concurrent, individually time-boxed parts
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional, Set
+
+from core.rate_limiter import Priority, request_priority
+
+logger = logging.getLogger(__name__)
+
+# Seconds each part may take before the view is returned without it
+DEFAULT_PART_TIMEOUTS = {
+    "profile": 1.0,
+    "content": 1.5,
+    "audience": 2.0,
+    "analytics": 2.0,
+    "ai_analysis": 1.5
+}
+
+
+class Influencer360:
+    """Fetches profile, recent content, audience, analytics and AI analysis for one creator at once
+
+    Every part runs concurrently under its own timeout, so the view takes as long as its
+    slowest part (at most the largest timeout) rather than the sum. A part that times out
+    or fails is returned as None with its status; a timed-out call is left to finish in
+    the background so cached parts are ready for the next view.
+    """
+
+    def __init__(self, clients: Dict[str, Any], analyzer, timeouts: Optional[Dict[str, float]] = None):
+        self.clients = clients
+        self.analyzer = analyzer
+        self.timeouts = {**DEFAULT_PART_TIMEOUTS, **(timeouts or {})}
+        self.outcomes: Dict[str, Dict[str, int]] = {
+            name: {"ok": 0, "timeout": 0, "error": 0} for name in self.timeouts
+        }
+        # Every part call until it finishes, including those whose request has moved on
+        self._calls: Set[asyncio.Task] = set()
+        self._late: Set[asyncio.Task] = set()
+
+    async def fetch(self, platform: str, influencer_id: str, content_limit: int = 10,
+                    max_wait: Optional[float] = None) -> Dict[str, Any]:
+        """The composite view; max_wait caps every part's timeout for this request"""
+        plan = self.clients[platform].detail_plan(influencer_id, content_limit)
+        plan["ai_analysis"] = (self.analyzer.get_detailed_analysis, influencer_id)
+        started = time.perf_counter()
+
+        with request_priority(Priority.INTERACTIVE):
+            results = await asyncio.gather(*(
+                self._part(name, call, args, max_wait) for name, (call, *args) in plan.items()
+            ))
+
+        view: Dict[str, Any] = {"influencer_id": influencer_id, "platform": platform}
+        parts: Dict[str, Dict[str, Any]] = {}
+        for name in self.timeouts:
+            parts[name] = {"status": "unsupported"}
+            view[name] = None
+        for name, (value, status) in zip(plan, results):
+            view[name] = value
+            parts[name] = status
+        view["parts"] = parts
+        view["complete"] = all(part["status"] in ("ok", "unsupported") for part in parts.values())
+        view["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        return view
+
+    async def _part(self, name: str, call, args: tuple, max_wait: Optional[float]):
+        timeout = self.timeouts.get(name, max(self.timeouts.values()))
+        if max_wait is not None:
+            timeout = min(timeout, max_wait)
+        started = time.perf_counter()
+        task = asyncio.ensure_future(call(*args))
+        self._calls.add(task)
+        task.add_done_callback(lambda done: self._finish(name, done))
+        try:
+            # Shielded so a timeout abandons the wait, not the call and its cache fill
+            value = await asyncio.wait_for(asyncio.shield(task), timeout)
+            outcome = "ok"
+        except asyncio.TimeoutError:
+            value, outcome = None, "timeout"
+            self._late.add(task)
+        except Exception:
+            value, outcome = None, "error"
+        self.outcomes.setdefault(name, {"ok": 0, "timeout": 0, "error": 0})[outcome] += 1
+        return value, {"status": outcome, "elapsed_ms": round((time.perf_counter() - started) * 1000, 1)}
+
+    def _finish(self, name: str, task: asyncio.Task):
+        """Drop a finished call and log its failure, even if its request was cancelled meanwhile"""
+        self._calls.discard(task)
+        self._late.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Influencer 360 {name} call failed: {task.exception()}")
+
+    async def close(self):
+        for task in list(self._calls):
+            task.cancel()
+        await asyncio.gather(*self._calls, return_exceptions=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """Configured timeouts, ok/timeout/error counts per part and timed-out calls still running"""
+        return {"timeouts": self.timeouts, "outcomes": self.outcomes, "late_calls_running": len(self._late)}
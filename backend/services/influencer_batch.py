@@ -0,0 +1,91 @@
+"""
+Influencer Batch Module
+Resolves details for many creators in one request, streamed back in request order
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, Dict, List
+
+from core.rate_limiter import Priority, request_priority
+
+
+def platform_of(influencer_id: str) -> str:
+    """Platform an influencer id belongs to"""
+    return "instagram" if "instagram" in influencer_id else "youtube"
+
+
+class InfluencerBatchResolver:
+    """Fetches profile and detailed analysis for a list of creators
+
+    Duplicate ids are resolved once. Profile lookups are issued together so the platform
+    batch loaders turn them into a few multi-id upstream calls; detailed analyses run at
+    most `concurrency` at a time and are cached for `detail_ttl` seconds when a cache is set.
+    """
+
+    def __init__(self, clients: Dict[str, Any], analyzer, cache=None, concurrency: int = 16,
+                 detail_ttl: float = 3600.0):
+        self.clients = clients
+        self.analyzer = analyzer
+        self.cache = cache
+        self.detail_ttl = detail_ttl
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self.concurrency = concurrency
+        self.requests = 0
+        self.ids_requested = 0
+        self.ids_resolved = 0
+        self.errors = 0
+
+    async def stream(self, influencer_ids: List[str]) -> AsyncIterator[Dict[str, Any]]:
+        """Yield one result per requested id, in request order, as soon as its predecessors are done"""
+        self.requests += 1
+        self.ids_requested += len(influencer_ids)
+        with request_priority(Priority.INTERACTIVE):
+            tasks = {
+                influencer_id: asyncio.ensure_future(self._resolve(influencer_id))
+                for influencer_id in dict.fromkeys(influencer_ids)
+            }
+        self.ids_resolved += len(tasks)
+        try:
+            for index, influencer_id in enumerate(influencer_ids):
+                yield {"index": index, **await tasks[influencer_id]}
+        finally:
+            # A client that disconnects mid-stream leaves no work running
+            for task in tasks.values():
+                task.cancel()
+
+    async def _resolve(self, influencer_id: str) -> Dict[str, Any]:
+        platform = platform_of(influencer_id)
+        call, *args = self.clients[platform].detail_plan(influencer_id, 0)["profile"]
+        profile, analysis = await asyncio.gather(
+            call(*args), self._detailed_analysis(influencer_id), return_exceptions=True
+        )
+        failed = [part for part in (profile, analysis) if isinstance(part, Exception)]
+        if failed:
+            self.errors += 1
+        return {
+            "influencer_id": influencer_id,
+            "platform": platform,
+            "status": "error" if failed else "ok",
+            "error": str(failed[0]) if failed else None,
+            "profile": None if isinstance(profile, Exception) else profile,
+            "analysis": None if isinstance(analysis, Exception) else analysis
+        }
+
+    async def _detailed_analysis(self, influencer_id: str) -> Dict[str, Any]:
+        async def load():
+            async with self._semaphore:
+                return await self.analyzer.get_detailed_analysis(influencer_id)
+
+        if self.cache is None:
+            return await load()
+        return await self.cache.get_or_load(f"influencer_detail:{influencer_id}", self.detail_ttl, load)
+
+    def stats(self) -> Dict[str, Any]:
+        """Requests served, ids requested vs. resolved after deduplication, and failed ids"""
+        return {
+            "concurrency": self.concurrency,
+            "requests": self.requests,
+            "ids_requested": self.ids_requested,
+            "ids_resolved": self.ids_resolved,
+            "errors": self.errors
+        }
@@ -0,0 +1,149 @@
+"""
+Outbound Queue Module
+Worker pool delivering queued outreach messages in per-provider batches with retries
+"""
+
+import asyncio
+import logging
+import random
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from .outbound_store import OutboundStore
+
+logger = logging.getLogger(__name__)
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """Full-jitter exponential backoff: uniform over [0, min(cap, base * 2^(attempt - 1))]"""
+    return random.uniform(0, min(cap, base * 2 ** (attempt - 1)))
+
+
+class OutboundQueue:
+    """Sends queued messages through their provider without blocking the request path
+
+    Each provider gets `workers` workers. A worker leases up to the provider's batch size
+    of due messages and sends them in one call. A retryable failure is requeued with
+    full-jitter exponential backoff until max_attempts; other failures are final. Every
+    send carries the message id as its idempotency key, so a batch retried after a lost
+    response or a crash is not delivered twice.
+    """
+
+    def __init__(self, store: OutboundStore, providers: Dict[str, Any], workers: int = 2,
+                 max_attempts: int = 6, retry_base: float = 1.0, retry_cap: float = 300.0,
+                 lease_seconds: float = 60.0, poll_interval: float = 5.0):
+        self.store = store
+        self.providers = providers
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.retry_base = retry_base
+        self.retry_cap = retry_cap
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self._wakeups: Dict[str, asyncio.Event] = {}
+        self._tasks: List[asyncio.Task] = []
+        self.counters: Dict[str, Dict[str, int]] = {
+            name: {"batches": 0, "messages": 0, "sent": 0, "retried": 0, "failed": 0, "batch_errors": 0}
+            for name in providers
+        }
+
+    async def enqueue(self, provider: str, message: Dict[str, Any],
+                      idempotency_key: Optional[str] = None) -> Tuple[Dict[str, Any], bool]:
+        """Queue a message for delivery and return (record, created) without waiting for the send"""
+        if provider not in self.providers:
+            raise KeyError(provider)
+        record, created = await asyncio.to_thread(self.store.enqueue, provider, message, idempotency_key)
+        if created and provider in self._wakeups:
+            self._wakeups[provider].set()
+        return record, created
+
+    def start(self):
+        """Start the worker pool; messages left queued or leased by a previous process are picked up"""
+        if self._tasks:
+            return
+        loop = asyncio.get_running_loop()
+        for name in self.providers:
+            self._wakeups[name] = asyncio.Event()
+            self._tasks.extend(loop.create_task(self._work(name)) for _ in range(self.workers))
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _work(self, name: str):
+        provider = self.providers[name]
+        while True:
+            try:
+                # Cleared before claiming, so a message enqueued after an empty claim still wakes the worker
+                self._wakeups[name].clear()
+                batch = await asyncio.to_thread(
+                    self.store.claim, name, provider.max_batch_size, self.lease_seconds, self.max_attempts
+                )
+                if batch:
+                    # Another worker may pick up the rest of the due messages meanwhile
+                    self._wakeups[name].set()
+                    await self._deliver(name, provider, batch)
+                    continue
+                await self._idle(name)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Outbound {name} worker error: {e}")
+                await asyncio.sleep(self.poll_interval)
+
+    async def _idle(self, name: str):
+        """Sleep until a message is enqueued, the next retry is due or the poll interval passes"""
+        wakeup = self._wakeups[name]
+        next_due = await asyncio.to_thread(self.store.next_due, name)
+        timeout = self.poll_interval
+        if next_due is not None:
+            timeout = min(timeout, max(0.0, next_due - time.time()))
+        try:
+            await asyncio.wait_for(wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _deliver(self, name: str, provider, batch: List[Dict[str, Any]]):
+        counters = self.counters[name]
+        counters["batches"] += 1
+        counters["messages"] += len(batch)
+        try:
+            results = await provider.send_batch([{**message, "idempotency_key": message["id"]} for message in batch])
+        except Exception as e:
+            counters["batch_errors"] += 1
+            results = {message["id"]: {"status": "error", "retryable": True, "error": str(e)} for message in batch}
+
+        sent, retries, failures = [], [], []
+        now = time.time()
+        for message in batch:
+            result = results.get(message["id"]) or {"status": "error", "retryable": True, "error": "No result"}
+            if result["status"] == "sent":
+                sent.append((message["id"], result["provider_message_id"]))
+            elif result.get("retryable") and message["attempts"] < self.max_attempts:
+                delay = backoff_delay(message["attempts"], self.retry_base, self.retry_cap)
+                retries.append((message["id"], result["error"], now + delay))
+            else:
+                failures.append((message["id"], result["error"]))
+        await asyncio.to_thread(self.store.complete, sent, retries, failures)
+        counters["sent"] += len(sent)
+        counters["retried"] += len(retries)
+        counters["failed"] += len(failures)
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-provider batch and delivery counters and messages per delivery status"""
+        providers = {}
+        for name, provider in self.providers.items():
+            counters = self.counters[name]
+            providers[name] = {
+                **counters,
+                "avg_batch_size": round(counters["messages"] / counters["batches"], 2) if counters["batches"] else 0.0,
+                "provider": provider.stats()
+            }
+        return {
+            "workers_per_provider": self.workers,
+            "max_attempts": self.max_attempts,
+            "providers": providers,
+            "messages": self.store.counts()
+        }
@@ -0,0 +1,196 @@
+"""
+Outbound Store Module
+Durable SQLite queue of outreach messages and their delivery state
+"""
+
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.serialization import dumps, loads
+from .task_registry import IdempotencyConflictError, request_fingerprint
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbound_messages (
+    id TEXT PRIMARY KEY,
+    idempotency_key TEXT UNIQUE,
+    fingerprint TEXT NOT NULL,
+    provider TEXT NOT NULL,
+    influencer_id TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    lease_until REAL,
+    last_error TEXT,
+    provider_message_id TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    sent_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_outbound_due ON outbound_messages (provider, status, next_attempt_at);
+"""
+
+_COLUMNS = (
+    "id, idempotency_key, provider, influencer_id, payload, status, attempts, next_attempt_at, "
+    "last_error, provider_message_id, created_at, sent_at"
+)
+
+QUEUED = "queued"
+SENDING = "sending"
+SENT = "sent"
+FAILED = "failed"
+
+
+def _record(row: tuple) -> Dict[str, Any]:
+    (message_id, idempotency_key, provider, influencer_id, payload, status, attempts, next_attempt_at,
+     last_error, provider_message_id, created_at, sent_at) = row
+    return {
+        "id": message_id,
+        "idempotency_key": idempotency_key,
+        "provider": provider,
+        "influencer_id": influencer_id,
+        **loads(payload),
+        "status": status,
+        "attempts": attempts,
+        "next_attempt_at": next_attempt_at if status == QUEUED else None,
+        "last_error": last_error,
+        "provider_message_id": provider_message_id,
+        "created_at": created_at,
+        "sent_at": sent_at
+    }
+
+
+class OutboundStore:
+    """Outreach messages with queued -> sending -> sent / failed delivery state
+
+    A claimed message is leased to a worker; a lease that runs out (the process died
+    mid-send) puts the message back up for delivery. Methods block on SQLite; async
+    callers run them with asyncio.to_thread.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            if path != ":memory:":
+                self._db.execute("PRAGMA journal_mode=WAL")
+                self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.executescript(_SCHEMA)
+
+    def enqueue(self, provider: str, message: Dict[str, Any],
+                idempotency_key: Optional[str] = None) -> Tuple[Dict[str, Any], bool]:
+        """(record, created); a known idempotency key returns its message instead of queueing another"""
+        fingerprint = request_fingerprint({"provider": provider, **message})
+        now = time.time()
+        with self._lock, self._db:
+            if idempotency_key is not None:
+                row = self._db.execute(
+                    "SELECT fingerprint FROM outbound_messages WHERE idempotency_key = ?", (idempotency_key,)
+                ).fetchone()
+                if row is not None:
+                    if row[0] != fingerprint:
+                        raise IdempotencyConflictError("Idempotency-Key was already used for a different message")
+                    return self._get(idempotency_key=idempotency_key), False
+            message_id = f"msg_{uuid.uuid4().hex}"
+            payload = {key: value for key, value in message.items() if key != "influencer_id"}
+            self._db.execute(
+                "INSERT INTO outbound_messages (id, idempotency_key, fingerprint, provider, influencer_id, payload, "
+                "status, next_attempt_at, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (message_id, idempotency_key, fingerprint, provider, message["influencer_id"], dumps(payload),
+                 QUEUED, now, now, now)
+            )
+            return self._get(message_id=message_id), True
+
+    def claim(self, provider: str, limit: int, lease_seconds: float,
+              max_attempts: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Lease up to limit due messages of a provider, oldest due first, counting the attempt
+
+        An expired lease that already used max_attempts attempts fails the message instead of
+        leasing it again, so a message that keeps crashing its worker is not retried forever.
+        """
+        now = time.time()
+        with self._lock, self._db:
+            if max_attempts is not None:
+                self._db.execute(
+                    "UPDATE outbound_messages SET status = ?, lease_until = NULL, last_error = ?, updated_at = ? "
+                    "WHERE provider = ? AND status = ? AND lease_until <= ? AND attempts >= ?",
+                    (FAILED, "Delivery lease expired after max attempts", now, provider, SENDING, now, max_attempts)
+                )
+            ids = [row[0] for row in self._db.execute(
+                "SELECT id FROM outbound_messages WHERE provider = ? AND "
+                "((status = ? AND next_attempt_at <= ?) OR (status = ? AND lease_until <= ?)) "
+                "ORDER BY next_attempt_at LIMIT ?",
+                (provider, QUEUED, now, SENDING, now, limit)
+            )]
+            if not ids:
+                return []
+            placeholders = ",".join("?" * len(ids))
+            self._db.execute(
+                f"UPDATE outbound_messages SET status = ?, attempts = attempts + 1, lease_until = ?, updated_at = ? "
+                f"WHERE id IN ({placeholders})",
+                (SENDING, now + lease_seconds, now, *ids)
+            )
+            rows = self._db.execute(f"SELECT {_COLUMNS} FROM outbound_messages WHERE id IN ({placeholders})", ids)
+            return [_record(row) for row in rows]
+
+    def complete(self, sent: List[Tuple[str, str]], retries: List[Tuple[str, str, float]],
+                 failures: List[Tuple[str, str]]):
+        """Record one batch's outcome in one transaction
+
+        sent is (id, provider_message_id), retries is (id, error, next_attempt_at) and
+        failures is (id, error).
+        """
+        now = time.time()
+        with self._lock, self._db:
+            self._db.executemany(
+                "UPDATE outbound_messages SET status = ?, provider_message_id = ?, sent_at = ?, lease_until = NULL, "
+                "last_error = NULL, updated_at = ? WHERE id = ?",
+                [(SENT, provider_message_id, now, now, message_id) for message_id, provider_message_id in sent]
+            )
+            self._db.executemany(
+                "UPDATE outbound_messages SET status = ?, next_attempt_at = ?, lease_until = NULL, last_error = ?, "
+                "updated_at = ? WHERE id = ?",
+                [(QUEUED, next_attempt_at, error, now, message_id) for message_id, error, next_attempt_at in retries]
+            )
+            self._db.executemany(
+                "UPDATE outbound_messages SET status = ?, lease_until = NULL, last_error = ?, updated_at = ? "
+                "WHERE id = ?",
+                [(FAILED, error, now, message_id) for message_id, error in failures]
+            )
+
+    def next_due(self, provider: str) -> Optional[float]:
+        """Time the next queued or leased message of a provider becomes due, if any"""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT MIN(CASE WHEN status = ? THEN next_attempt_at ELSE lease_until END) FROM outbound_messages "
+                "WHERE provider = ? AND status IN (?, ?)",
+                (QUEUED, provider, QUEUED, SENDING)
+            ).fetchone()
+        return row[0]
+
+    def get(self, message_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._get(message_id=message_id)
+
+    def _get(self, message_id: Optional[str] = None, idempotency_key: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        column, value = ("id", message_id) if message_id is not None else ("idempotency_key", idempotency_key)
+        row = self._db.execute(f"SELECT {_COLUMNS} FROM outbound_messages WHERE {column} = ?", (value,)).fetchone()
+        return _record(row) if row else None
+
+    def counts(self) -> Dict[str, Dict[str, int]]:
+        """Messages per provider and delivery status"""
+        counts: Dict[str, Dict[str, int]] = {}
+        with self._lock:
+            for provider, status, count in self._db.execute(
+                "SELECT provider, status, COUNT(*) FROM outbound_messages GROUP BY provider, status"
+            ):
+                counts.setdefault(provider, {})[status] = count
+        return counts
+
+    def close(self):
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,141 @@
+"""
+Refresh Scheduler Module
+Keeps cached profile data for frequently requested creators fresh ahead of expiry
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.rate_limiter import Priority, request_priority
+
+logger = logging.getLogger(__name__)
+
+# Cached loader endpoints to keep warm per platform, and which creator field keys them
+REFRESH_ENDPOINTS: Dict[str, List[Tuple[str, str]]] = {
+    "instagram": [("get_user_profile", "username"), ("get_audience_insights", "id")],
+    "youtube": [("get_channel_details", "id"), ("get_channel_analytics", "id")]
+}
+
+
+class RefreshScheduler:
+    """Tracks creator popularity and refreshes the hottest creators' cache entries in batches
+
+    Each request or discovery hit adds heat to a creator; heat decays every cycle so
+    creators nobody asks for drop out of the refresh set.
+    """
+
+    def __init__(self, clients: Dict[str, Any], interval: float = 60.0, max_creators: int = 500,
+                 decay: float = 0.8, refresh_ahead: float = 0.2, max_tracked: int = 20000):
+        self.clients = clients
+        self.interval = interval
+        # Creators refreshed per cycle, hottest first
+        self.max_creators = max_creators
+        self.decay = decay
+        # Entries within this share of their TTL of going stale are refreshed early
+        self.refresh_ahead = refresh_ahead
+        self.max_tracked = max_tracked
+        self._heat: Dict[Tuple[str, str], float] = {}
+        self._keys: Dict[Tuple[str, str], Dict[str, str]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+        # Stats
+        self.cycles = 0
+        self.refreshed = 0
+        self.skipped_budget = 0
+        self.errors = 0
+        self.last_error: Optional[str] = None
+        self.last_cycle_seconds = 0.0
+
+    def record(self, influencer: Dict[str, Any], weight: float = 1.0):
+        """Note a request for a creator; needs platform and id, plus username on Instagram"""
+        platform = influencer.get("platform")
+        creator_id = influencer.get("id")
+        if platform not in self.clients or not creator_id:
+            return
+        key = (platform, creator_id)
+        self._heat[key] = self._heat.get(key, 0.0) + weight
+        self._keys[key] = {"id": creator_id, "username": influencer.get("username") or creator_id}
+
+    def hottest(self) -> List[Tuple[str, str]]:
+        """Tracked creators ordered by heat"""
+        ranked = sorted(self._heat.items(), key=lambda item: item[1], reverse=True)
+        return [key for key, _ in ranked[:self.max_creators]]
+
+    def _decay(self):
+        for key in list(self._heat):
+            self._heat[key] *= self.decay
+            if self._heat[key] < 0.01:
+                del self._heat[key]
+                del self._keys[key]
+        if len(self._heat) > self.max_tracked:
+            for key in sorted(self._heat, key=self._heat.get)[:len(self._heat) - self.max_tracked]:
+                del self._heat[key]
+                del self._keys[key]
+
+    async def run_once(self) -> int:
+        """Refresh due cache entries for the hottest creators; returns entries refreshed"""
+        started = time.perf_counter()
+        by_platform: Dict[str, List[Dict[str, str]]] = {}
+        for platform, creator_id in self.hottest():
+            by_platform.setdefault(platform, []).append(self._keys[(platform, creator_id)])
+
+        refreshed = 0
+        with request_priority(Priority.BACKGROUND):
+            for platform, creators in by_platform.items():
+                client = self.clients[platform]
+                # Refreshing is optional work; spend call budgets on it only when they are healthy
+                if client.budget_mode() != "normal":
+                    self.skipped_budget += 1
+                    continue
+                for endpoint, field in REFRESH_ENDPOINTS.get(platform, []):
+                    keys = [creator[field] for creator in creators]
+                    try:
+                        refreshed += await client.refresh_loader_keys(endpoint, keys, self.refresh_ahead)
+                    except Exception as e:
+                        self.errors += 1
+                        self.last_error = f"{platform} {endpoint}: {e}"
+                        logger.warning(f"Scheduled refresh of {platform} {endpoint} failed: {e}")
+
+        self._decay()
+        self.cycles += 1
+        self.refreshed += refreshed
+        self.last_cycle_seconds = time.perf_counter() - started
+        return refreshed
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.run_once()
+            except Exception as e:
+                self.errors += 1
+                self.last_error = str(e)
+                logger.error(f"Refresh cycle failed: {e}")
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Tracked creators and refresh cycle counters"""
+        return {
+            "interval_seconds": self.interval,
+            "tracked_creators": len(self._heat),
+            "cycles": self.cycles,
+            "entries_refreshed": self.refreshed,
+            "skipped_for_budget": self.skipped_budget,
+            "errors": self.errors,
+            "last_error": self.last_error,
+            "last_cycle_seconds": round(self.last_cycle_seconds, 3)
+        }
@@ -0,0 +1,152 @@
+"""
+Result Export Module
+Chunked NDJSON, CSV and Parquet encoding of discovery results for streaming downloads
+"""
+
+import csv
+import io
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from core.serialization import dumps
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover - pyarrow is listed in requirements.txt
+    pyarrow = None
+
+EXPORT_FORMATS = {
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "csv": ("text/csv", "csv"),
+    "parquet": ("application/vnd.apache.parquet", "parquet")
+}
+
+
+class ExportFormatError(ValueError):
+    """Raised for an unknown format or one whose optional dependency is missing"""
+
+
+def _chunks(rows: Sequence[Dict[str, Any]], chunk_size: int) -> Iterator[Sequence[Dict[str, Any]]]:
+    for start in range(0, len(rows), chunk_size):
+        yield rows[start:start + chunk_size]
+
+
+def _project(row: Dict[str, Any], fields: Optional[List[str]]) -> Dict[str, Any]:
+    return row if fields is None else {field: row.get(field) for field in fields}
+
+
+def _columns(rows: Sequence[Dict[str, Any]], fields: Optional[List[str]]) -> List[str]:
+    """Requested fields, else every key any row has, in first-seen order"""
+    if fields is not None:
+        return list(fields)
+    columns: Dict[str, None] = {}
+    for row in rows:
+        columns.update(dict.fromkeys(row))
+    return list(columns)
+
+
+def _flat(value: Any) -> Any:
+    """Scalar cell value; lists and objects are embedded as JSON text"""
+    if isinstance(value, (dict, list, tuple)):
+        return dumps(value).decode()
+    return value
+
+
+def _ndjson(rows, fields, chunk_size) -> Iterator[bytes]:
+    for chunk in _chunks(rows, chunk_size):
+        yield b"".join(dumps(_project(row, fields)) + b"\n" for row in chunk)
+
+
+def _csv(rows, fields, chunk_size) -> Iterator[bytes]:
+    # Rows from different platforms carry different keys, so the header is their union
+    columns = _columns(rows, fields)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for chunk in _chunks(rows, chunk_size):
+        for row in chunk:
+            writer.writerow([_flat(row.get(column)) for column in columns])
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if not rows:
+        yield buffer.getvalue().encode()
+
+
+class _DrainableSink(io.RawIOBase):
+    """Write-only file object whose written bytes are collected and handed out per row group"""
+
+    def __init__(self):
+        self._parts: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._parts.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._parts)
+        self._parts.clear()
+        return data
+
+
+def _arrow_type(kinds: set):
+    """Narrowest Arrow type holding every non-null value of a column; mixed or empty columns are text"""
+    if kinds == {bool}:
+        return pyarrow.bool_()
+    if kinds and kinds <= {int}:
+        return pyarrow.int64()
+    if kinds and kinds <= {int, float}:
+        return pyarrow.float64()
+    return pyarrow.string()
+
+
+def _parquet_schema(rows, columns: List[str]):
+    """Schema declared from the whole result up front, so a column that is null in the first
+    chunk or changes type further down cannot break the stream after it has started"""
+    kinds: Dict[str, set] = {column: set() for column in columns}
+    for row in rows:
+        for column in columns:
+            value = row.get(column)
+            if value is not None:
+                kinds[column].add(str if isinstance(value, (dict, list, tuple)) else type(value))
+    return pyarrow.schema([(column, _arrow_type(kinds[column])) for column in columns])
+
+
+def _parquet(rows, fields, chunk_size) -> Iterator[bytes]:
+    columns = _columns(rows, fields)
+    schema = _parquet_schema(rows, columns)
+    text_columns = {field.name for field in schema if field.type == pyarrow.string()}
+    sink = _DrainableSink()
+    writer = pyarrow.parquet.ParquetWriter(sink, schema, compression="zstd")
+    for chunk in _chunks(rows, chunk_size):
+        table = {column: [] for column in columns}
+        for row in chunk:
+            for column in columns:
+                value = _flat(row.get(column))
+                if column in text_columns and value is not None and not isinstance(value, str):
+                    value = str(value)
+                table[column].append(value)
+        # Each chunk becomes one row group, flushed to the client as soon as it is written
+        writer.write_table(pyarrow.Table.from_pydict(table, schema=schema))
+        yield sink.drain()
+    writer.close()
+    yield sink.drain()
+
+
+def export_results(rows: Sequence[Dict[str, Any]], fmt: str, fields: Optional[List[str]] = None,
+                   chunk_size: int = 1000) -> Iterator[bytes]:
+    """Encode rows chunk by chunk; only one chunk's output is held in memory at a time"""
+    if fmt not in EXPORT_FORMATS:
+        raise ExportFormatError(f"Unsupported export format: {fmt}")
+    if fmt == "parquet" and pyarrow is None:
+        raise ExportFormatError("Parquet export requires pyarrow")
+    encoder = {"ndjson": _ndjson, "csv": _csv, "parquet": _parquet}[fmt]
+    return encoder(rows, fields, chunk_size)
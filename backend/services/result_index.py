@@ -0,0 +1,158 @@
+"""
+Result Index Module
+Sorted, partitioned indexes over a discovery task's results for keyset-paginated queries
+"""
+
+import base64
+import binascii
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.serialization import dumps, loads
+
+SORT_FIELDS = (
+    "match_score", "authenticity_score", "audience_alignment", "content_quality_score",
+    "engagement_quality_score", "followers", "engagement_rate"
+)
+
+
+class InvalidQueryError(ValueError):
+    """Raised for an unknown sort field or a cursor that does not fit the query"""
+
+
+def _risk(row: Dict[str, Any]) -> Optional[str]:
+    risk = row.get("risk_assessment")
+    return risk.get("overall_risk", "").lower() if isinstance(risk, dict) else None
+
+
+class ResultIndex:
+    """Read-only query structure built once when a discovery task completes
+
+    Rows are kept in per-(sort, order, platform, risk level) orderings built on first use,
+    so a page is a bisect to the cursor plus a walk over about one page of rows. Range
+    filters on the sort field are bisected too; other numeric filters skip rows while walking.
+    """
+
+    def __init__(self, rows: List[Dict[str, Any]]):
+        self.rows = rows
+        self.distribution = {
+            "high_matches": sum(1 for row in rows if row.get("match_score", 0) >= 90),
+            "medium_matches": sum(1 for row in rows if 80 <= row.get("match_score", 0) < 90),
+            "low_matches": sum(1 for row in rows if row.get("match_score", 0) < 80)
+        }
+        # Rows are our own analysis output, so they are encoded once here and never re-validated
+        self._encoded = [dumps(row) for row in rows]
+        self._orders: Dict[tuple, List[Tuple[float, int]]] = {}
+        # The default ordering is what the results page opens with
+        self._order("match_score", True, None, None)
+
+    def _order(self, sort: str, descending: bool, platform: Optional[str],
+               risk_level: Optional[str]) -> List[Tuple[float, int]]:
+        """(sort key, row position) pairs for one partition, ascending by key"""
+        cache_key = (sort, descending, platform, risk_level)
+        keys = self._orders.get(cache_key)
+        if keys is None:
+            sign = -1 if descending else 1
+            keys = sorted(
+                (sign * (row.get(sort) or 0), position)
+                for position, row in enumerate(self.rows)
+                if (platform is None or row.get("platform") == platform)
+                and (risk_level is None or _risk(row) == risk_level)
+            )
+            self._orders[cache_key] = keys
+        return keys
+
+    def select(self, sort: str = "match_score", descending: bool = True, limit: int = 20,
+               cursor: Optional[str] = None, platform: Optional[str] = None, risk_level: Optional[str] = None,
+               ranges: Optional[Dict[str, Tuple[Optional[float], Optional[float]]]] = None
+               ) -> Tuple[List[int], Optional[str], Optional[int]]:
+        """Row positions of one page, the next page's cursor and the total match count
+
+        ranges maps a numeric field to an inclusive (min, max) pair; either end may be None.
+        """
+        if sort not in SORT_FIELDS:
+            raise InvalidQueryError(f"Cannot sort by {sort}; choose one of {', '.join(SORT_FIELDS)}")
+        risk_level = risk_level.lower() if risk_level else None
+        keys = self._order(sort, descending, platform, risk_level)
+        sign = -1 if descending else 1
+
+        start, stop = 0, len(keys)
+        scan_ranges = []
+        for field, (low, high) in (ranges or {}).items():
+            if low is None and high is None:
+                continue
+            if field != sort:
+                scan_ranges.append((field, low, high))
+                continue
+            # A range on the sort field is a contiguous slice of the ordering
+            first, last = (high, low) if descending else (low, high)
+            if first is not None:
+                start = max(start, bisect_left(keys, (sign * first, -1)))
+            if last is not None:
+                stop = min(stop, bisect_right(keys, (sign * last, len(self.rows))))
+
+        # Exact without walk-time filters; otherwise unknown without scanning every row
+        total_count = max(0, stop - start) if not scan_ranges else None
+        if cursor is not None:
+            start = max(start, bisect_right(keys, self._decode_cursor(cursor, sort, descending)))
+
+        positions: List[int] = []
+        last_key = None
+        has_more = False
+        for position in range(start, stop):
+            key = keys[position]
+            row = self.rows[key[1]]
+            if any(not self._within(row.get(field) or 0, low, high) for field, low, high in scan_ranges):
+                continue
+            if len(positions) == limit:
+                has_more = True
+                break
+            positions.append(key[1])
+            last_key = key
+
+        next_cursor = self._encode_cursor(sort, descending, last_key) if has_more else None
+        return positions, next_cursor, total_count
+
+    def page(self, fields: Optional[List[str]] = None, **query) -> Dict[str, Any]:
+        """One page of matching rows and the cursor for the next page, for the query arguments of select"""
+        positions, next_cursor, total_count = self.select(**query)
+        return {
+            "influencers": [self._project(self.rows[position], fields) for position in positions],
+            "next_cursor": next_cursor,
+            "total_count": total_count,
+            **self.distribution
+        }
+
+    def page_json(self, fields: Optional[List[str]] = None, **query) -> bytes:
+        """The same page as page(), encoded as JSON from the rows serialized at build time"""
+        positions, next_cursor, total_count = self.select(**query)
+        if fields is None:
+            rows = b",".join(self._encoded[position] for position in positions)
+        else:
+            rows = b",".join(dumps(self._project(self.rows[position], fields)) for position in positions)
+        meta = dumps({"next_cursor": next_cursor, "total_count": total_count, **self.distribution})
+        return b'{"influencers":[' + rows + b"]," + meta[1:]
+
+    @staticmethod
+    def _project(row: Dict[str, Any], fields: Optional[List[str]]) -> Dict[str, Any]:
+        return row if fields is None else {field: row.get(field) for field in fields}
+
+    @staticmethod
+    def _within(value: float, low: Optional[float], high: Optional[float]) -> bool:
+        return (low is None or value >= low) and (high is None or value <= high)
+
+    @staticmethod
+    def _encode_cursor(sort: str, descending: bool, key: Tuple[float, int]) -> str:
+        return base64.urlsafe_b64encode(dumps([sort, descending, key[0], key[1]])).decode().rstrip("=")
+
+    @staticmethod
+    def _decode_cursor(cursor: str, sort: str, descending: bool) -> Tuple[float, int]:
+        try:
+            cursor_sort, cursor_descending, value, position = loads(
+                base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            )
+        except (ValueError, TypeError, binascii.Error):
+            raise InvalidQueryError("Malformed cursor")
+        if cursor_sort != sort or cursor_descending != descending:
+            raise InvalidQueryError("Cursor was issued for a different sort order")
+        return (value, position)
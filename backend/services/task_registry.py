@@ -0,0 +1,96 @@
+"""
+Task Registry Module
+Discovery task bookkeeping with collision-free ids, idempotency keys and in-flight deduplication
+"""
+
+import time
+import uuid
+from hashlib import blake2b
+from typing import Any, Dict, Optional, Tuple
+
+from core.serialization import dumps
+
+
+class IdempotencyConflictError(Exception):
+    """Raised when an idempotency key is reused for a different request"""
+
+
+def request_fingerprint(payload: Dict[str, Any]) -> str:
+    """Content address of a request: equal for requests that would produce the same results"""
+    return blake2b(dumps(payload, sort_keys=True), digest_size=16).hexdigest()
+
+
+class TaskRegistry:
+    """Holds discovery tasks and maps submissions onto them
+
+    A submission with a known idempotency key returns that key's task. A submission
+    identical to a task still running attaches to it instead of starting another
+    pipeline. Keys are remembered for key_ttl seconds and released when their task
+    fails, so a retry after a failure runs again.
+    """
+
+    def __init__(self, key_ttl: float = 86400.0):
+        self.tasks: Dict[str, Dict[str, Any]] = {}
+        self.key_ttl = key_ttl
+        self._keys: Dict[str, Tuple[str, str, float]] = {}
+        self._inflight: Dict[str, str] = {}
+        self.created = 0
+        self.attached = 0
+        self.replayed = 0
+        self.conflicts = 0
+
+    def submit(self, payload: Dict[str, Any], task: Dict[str, Any],
+               idempotency_key: Optional[str] = None) -> Tuple[str, bool]:
+        """(task id, created) for a submission; task is stored only when a new task is created"""
+        self._expire_keys()
+        fingerprint = request_fingerprint(payload)
+        if idempotency_key is not None and idempotency_key in self._keys:
+            task_id, key_fingerprint, _ = self._keys[idempotency_key]
+            if key_fingerprint != fingerprint:
+                self.conflicts += 1
+                raise IdempotencyConflictError("Idempotency-Key was already used for a different request")
+            self.replayed += 1
+            return task_id, False
+
+        task_id = self._inflight.get(fingerprint)
+        if task_id is not None:
+            self.attached += 1
+            created = False
+        else:
+            task_id = f"task_{uuid.uuid4().hex}"
+            task["fingerprint"] = fingerprint
+            self.tasks[task_id] = task
+            self._inflight[fingerprint] = task_id
+            self.created += 1
+            created = True
+        if idempotency_key is not None:
+            self._keys[idempotency_key] = (task_id, fingerprint, time.monotonic() + self.key_ttl)
+        return task_id, created
+
+    def finish(self, task_id: str, failed: bool = False):
+        """Stop deduplicating onto a task once it completes or fails"""
+        task = self.tasks.get(task_id)
+        if task is None:
+            return
+        if self._inflight.get(task["fingerprint"]) == task_id:
+            del self._inflight[task["fingerprint"]]
+        if failed:
+            for key in [key for key, (key_task, _, _) in self._keys.items() if key_task == task_id]:
+                del self._keys[key]
+
+    def _expire_keys(self):
+        now = time.monotonic()
+        for key in [key for key, (_, _, expires) in self._keys.items() if expires <= now]:
+            del self._keys[key]
+
+    def stats(self) -> Dict[str, Any]:
+        """Tasks created vs. submissions served by an existing task"""
+        return {
+            "tasks": len(self.tasks),
+            "running": len(self._inflight),
+            "created": self.created,
+            "attached_in_flight": self.attached,
+            "idempotent_replays": self.replayed,
+            "key_conflicts": self.conflicts,
+            "idempotency_keys": len(self._keys)
+        }
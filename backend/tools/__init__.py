@@ -0,0 +1,4 @@
+"""
+Development Tools
+Local stand-ins and benchmarks for offline performance work
+"""
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Inference Benchmark
+Load-tests model-backed message generation through the inference gateway on the local
+stand-in model, comparing one model call per prompt with micro-batching and prefix caching
+
+Run from the backend directory:
+    python -m tools.bench_inference --messages 200 --concurrency 50 --brands 4
+"""
+
+import argparse
+import asyncio
+from typing import Any, Dict
+
+from api.inference_gateway import InferenceGateway, LocalStandInModel
+from api.message_generator import MessageGenerator
+from tools.bench_transport import _drive, _summary
+
+INFLUENCER_IDS = ("instagram_001", "youtube_001", "instagram_002", "instagram_003")
+
+
+def _brand(index: int) -> Dict[str, Any]:
+    return {
+        "product_name": f"Brand {index}",
+        "product_description": "Everyday skincare made from clean, sustainably sourced ingredients " * 3,
+        "campaign_goal": ("awareness", "sales", "ugc", "engagement")[index % 4],
+        "brand_tone": ("friendly", "professional", "luxury", "playful")[index % 4]
+    }
+
+
+async def bench(label: str, total: int, concurrency: int, brands: int, max_batch_size: int,
+                max_wait: float, prefix_cache_size: int) -> Dict[str, Any]:
+    gateway = InferenceGateway(LocalStandInModel(), max_batch_size=max_batch_size, max_wait=max_wait,
+                               prefix_cache_size=prefix_cache_size)
+    generator = MessageGenerator(inference=gateway)
+
+    async def call(index: int):
+        await generator.generate_personalized_message(
+            f"{INFLUENCER_IDS[index % len(INFLUENCER_IDS)]}_{index}", _brand(index % brands)
+        )
+
+    latencies, errors, elapsed = await _drive(call, total, concurrency)
+    result = _summary(label, latencies, errors, elapsed)
+    result["gateway"] = gateway.stats()
+    return result
+
+
+async def run(total: int, concurrency: int, brands: int, max_batch_size: int, max_wait: float):
+    for result in (
+        await bench("one model call per prompt", total, concurrency, brands, 1, 0.0, 0),
+        await bench("micro-batched", total, concurrency, brands, max_batch_size, max_wait, 256)
+    ):
+        gateway = result.pop("gateway")
+        model = gateway["model"]
+        print(f"{result['mode']}: {result['throughput_rps']} msg/s, p50 {result['p50_ms']} ms, "
+              f"p95 {result['p95_ms']} ms, {result['errors']} errors of {result['requests']}")
+        print(f"  {model['calls']} model calls (avg batch {gateway['batching']['avg_batch_size']}), "
+              f"{model['prefix_encodes']} prefix encodes, prefix hit rate {gateway['prefix_cache']['hit_rate']:.1%}, "
+              f"{model['prefill_tokens']} prefill tokens, model busy {model['busy_seconds']} s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the micro-batching inference gateway")
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--brands", type=int, default=4)
+    parser.add_argument("--max-batch-size", type=int, default=16)
+    parser.add_argument("--max-wait-ms", type=float, default=10.0)
+    args = parser.parse_args()
+    asyncio.run(run(args.messages, args.concurrency, args.brands, args.max_batch_size, args.max_wait_ms / 1000))
+
+
+if __name__ == "__main__":
+    main()
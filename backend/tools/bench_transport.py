@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Transport Benchmark
+Measures throughput, latency and connection reuse of the pooled HTTP transport against the
+platform stand-in server, compared with opening a new connection per request
+
+Run from the backend directory with the stand-in running:
+    python -m tools.bench_transport --base-url http://127.0.0.1:8900 --requests 2000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Any, Dict, List
+
+import httpx
+
+from api.instagram_api import InstagramAPI
+from api.youtube_api import YouTubeAPI
+from core.http_transport import HTTPTransport
+from core.rate_limiter import RateLimiter
+
+
+def _summary(label: str, latencies: List[float], errors: int, elapsed: float) -> Dict[str, Any]:
+    ordered = sorted(latencies)
+    return {
+        "mode": label,
+        "requests": len(latencies) + errors,
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(statistics.median(ordered) * 1000, 2) if ordered else 0.0,
+        "p95_ms": round(ordered[int(len(ordered) * 0.95) - 1] * 1000, 2) if ordered else 0.0
+    }
+
+
+async def _drive(call, total: int, concurrency: int):
+    """Issue total calls with at most concurrency in flight; returns latencies, errors and elapsed"""
+    latencies: List[float] = []
+    errors = 0
+    queue: asyncio.Queue = asyncio.Queue()
+    for index in range(total):
+        queue.put_nowait(index)
+
+    async def worker():
+        nonlocal errors
+        while not queue.empty():
+            index = queue.get_nowait()
+            started = time.perf_counter()
+            try:
+                await call(index)
+                latencies.append(time.perf_counter() - started)
+            except Exception:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, errors, time.perf_counter() - started
+
+
+async def bench_pooled(base_url: str, total: int, concurrency: int) -> Dict[str, Any]:
+    """Platform clients sharing one pooled transport"""
+    transport = HTTPTransport(per_host_limit=concurrency)
+    # Lift client-side rate limits so the transport is the bottleneck
+    limiter = RateLimiter(default_rate=1e6, default_burst=1_000_000)
+    instagram = InstagramAPI(rate_limiter=limiter, transport=transport, base_url=base_url)
+    youtube = YouTubeAPI(rate_limiter=limiter, transport=transport,
+                         base_url=f"{base_url}/youtube/v3", analytics_url=f"{base_url}/youtubeanalytics/v2")
+
+    async def call(index: int):
+        if index % 2:
+            await instagram.get_user_profile(f"influencer_{index}")
+        else:
+            await youtube.get_channel_details(f"UC_channel_{index}")
+
+    try:
+        latencies, errors, elapsed = await _drive(call, total, concurrency)
+        result = _summary("pooled", latencies, errors, elapsed)
+        result["transport"] = transport.stats()
+        return result
+    finally:
+        await transport.aclose()
+
+
+async def bench_unpooled(base_url: str, total: int, concurrency: int) -> Dict[str, Any]:
+    """One short-lived client, and so one new connection, per request"""
+    async def call(index: int):
+        async with httpx.AsyncClient() as client:
+            response = await client.get(f"{base_url}/v18.0/influencer_{index}")
+            response.raise_for_status()
+
+    latencies, errors, elapsed = await _drive(call, total, concurrency)
+    return _summary("new connection per request", latencies, errors, elapsed)
+
+
+async def run(base_url: str, total: int, concurrency: int):
+    for result in (await bench_unpooled(base_url, total, concurrency),
+                   await bench_pooled(base_url, total, concurrency)):
+        transport = result.pop("transport", None)
+        print(f"{result['mode']}: {result['throughput_rps']} req/s, p50 {result['p50_ms']} ms, "
+              f"p95 {result['p95_ms']} ms, {result['errors']} errors of {result['requests']}")
+        if transport:
+            for host, stats in transport["hosts"].items():
+                print(f"  {host}: {stats['new_connections']} new / {stats['reused_connections']} reused "
+                      f"connections (reuse {stats['reuse_ratio']:.1%}), http {stats['http_versions']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the pooled platform HTTP transport")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8900")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(run(args.base_url.rstrip("/"), args.requests, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Catalog Import
+Bulk-loads a CSV or NDJSON creator list into the local creator catalog, streaming the file in
+chunks and reporting invalid rows as it goes
+
+Run from the backend directory:
+    python -m tools.import_catalog agency_creators.csv --catalog catalog.db
+"""
+
+import argparse
+import os
+import sys
+
+from core.serialization import dumps
+from services.catalog import CreatorCatalog
+from services.catalog_import import FORMATS, CatalogImporter, detect_format
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import a CSV/NDJSON creator list into the catalog")
+    parser.add_argument("path", help="CSV or NDJSON file ('-' reads stdin)")
+    parser.add_argument("--format", choices=FORMATS, help="defaults to the file extension")
+    parser.add_argument("--catalog", default=os.getenv("CATALOG_PATH", "catalog.db"), help="catalog database path")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="rows validated and upserted per transaction")
+    parser.add_argument("--max-errors", type=int, default=1000, help="invalid rows reported individually")
+    args = parser.parse_args()
+
+    fmt = args.format or detect_format(None, args.path)
+    if fmt is None:
+        parser.error("cannot tell the format from the file name; pass --format")
+
+    catalog = CreatorCatalog(args.catalog)
+    importer = CatalogImporter(catalog, chunk_size=args.chunk_size, max_reported_errors=args.max_errors)
+    stream = sys.stdin if args.path == "-" else open(args.path, encoding="utf-8-sig", newline="")
+    try:
+        for events in importer.run(stream, fmt):
+            for event in events:
+                if event["event"] == "error":
+                    sys.stdout.buffer.write(dumps(event) + b"\n")
+                elif event["event"] == "progress":
+                    print(f"\r{event['rows']} rows, {event['invalid']} invalid, "
+                          f"{event['rows_per_second']} rows/s", end="", file=sys.stderr)
+                else:
+                    print(file=sys.stderr)
+                    print(f"imported {event['valid']} of {event['rows']} rows: {event['inserted']} new, "
+                          f"{event['updated']} updated, {event['skipped']} unchanged, {event['invalid']} invalid "
+                          f"in {event['elapsed_seconds']}s", file=sys.stderr)
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+        catalog.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Platform Stand-in Server
+Local emulation of the Instagram Graph API and YouTube Data/Analytics API endpoints used by
+the platform clients, with configurable latency, error injection and pagination
+
+Run from the backend directory:
+    python -m tools.platform_standin --port 8900 --latency-ms 80 --error-rate 0.01
+
+Then point the app at it with PLATFORM_API_BASE_URL=http://127.0.0.1:8900
+"""
+
+import argparse
+import asyncio
+import random
+import zlib
+from typing import Any, Dict, List, Optional
+
+import uvicorn
+from fastapi import FastAPI, Query, Request
+from fastapi.responses import JSONResponse
+
+from api.instagram_api import InstagramAPI
+from api.youtube_api import YouTubeAPI, offset_page_token, page_token_offset
+
+
+class StandinConfig:
+    """Behaviour knobs for the stand-in, adjustable at runtime via /_standin/config"""
+
+    def __init__(self, latency_ms: float = 50.0, jitter_ms: float = 20.0, error_rate: float = 0.0,
+                 throttle_rate: float = 0.0, total_results: int = 1000, max_page_size: int = 50,
+                 tail_rate: float = 0.0, tail_ms: float = 1000.0, capacity: int = 0):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        # A tail_rate share of requests takes an extra tail_ms, to exercise hedging
+        self.tail_rate = tail_rate
+        self.tail_ms = tail_ms
+        # Requests served at once; beyond it requests queue, and a queue longer than
+        # capacity is shed with 429 (0 = unlimited)
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.total_results = total_results
+        self.max_page_size = max_page_size
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(vars(self))
+
+
+def _index(key: str) -> int:
+    """Stable generator index for an id or username"""
+    digits = "".join(ch for ch in key if ch.isdigit())
+    return int(digits[-6:]) if digits else zlib.crc32(key.encode()) % 100000
+
+
+def _ids(value: str) -> List[str]:
+    return [item for item in value.split(",") if item]
+
+
+def create_app(config: Optional[StandinConfig] = None) -> FastAPI:
+    """Build the stand-in app; payloads come from the clients' own mock generators"""
+    config = config or StandinConfig()
+    instagram = InstagramAPI()
+    youtube = YouTubeAPI()
+    requests_by_route: Dict[str, int] = {}
+    load = {"active": 0, "queued": 0, "shed": 0}
+    capacity_freed = asyncio.Event()
+
+    app = FastAPI(title="Platform API Stand-in")
+
+    @app.middleware("http")
+    async def emulate_network(request: Request, call_next):
+        route = request.url.path
+        if route.startswith("/_standin"):
+            return await call_next(request)
+        requests_by_route[route] = requests_by_route.get(route, 0) + 1
+
+        if config.capacity:
+            if load["queued"] >= config.capacity:
+                load["shed"] += 1
+                return JSONResponse(
+                    status_code=429,
+                    content={"error": {"message": "Too many concurrent requests", "code": 17}},
+                    headers={"Retry-After": "1"}
+                )
+            load["queued"] += 1
+            try:
+                while load["active"] >= config.capacity:
+                    capacity_freed.clear()
+                    await capacity_freed.wait()
+            finally:
+                load["queued"] -= 1
+        load["active"] += 1
+        try:
+            return await _serve(request, call_next)
+        finally:
+            load["active"] -= 1
+            capacity_freed.set()
+
+    async def _serve(request: Request, call_next):
+        delay = max(0.0, random.gauss(config.latency_ms, config.jitter_ms)) / 1000
+        if random.random() < config.tail_rate:
+            delay += config.tail_ms / 1000
+        await asyncio.sleep(delay)
+
+        roll = random.random()
+        if roll < config.throttle_rate:
+            return JSONResponse(
+                status_code=429,
+                content={"error": {"message": "Application request limit reached", "code": 4}},
+                headers={"Retry-After": "1"}
+            )
+        if roll < config.throttle_rate + config.error_rate:
+            return JSONResponse(
+                status_code=503,
+                content={"error": {"message": "Service temporarily unavailable", "code": 2}}
+            )
+        return await call_next(request)
+
+    # Stand-in control
+
+    @app.get("/_standin/config")
+    async def get_config():
+        return config.to_dict()
+
+    @app.post("/_standin/config")
+    async def update_config(changes: Dict[str, float]):
+        for name, value in changes.items():
+            if hasattr(config, name):
+                setattr(config, name, type(getattr(config, name))(value))
+        return config.to_dict()
+
+    @app.get("/_standin/stats")
+    async def get_stats():
+        return {
+            "requests_by_route": dict(requests_by_route),
+            "total": sum(requests_by_route.values()),
+            "load": dict(load)
+        }
+
+    # Instagram Graph API
+
+    def instagram_profile(key: str) -> Dict[str, Any]:
+        profile = instagram._generate_mock_influencer(_index(key))
+        if key.startswith("instagram_"):
+            profile["id"] = key
+        else:
+            profile["username"] = key
+        return profile
+
+    @app.get("/{version}/discovery")
+    async def instagram_discovery(request: Request, version: str, q: Optional[str] = None,
+                                  offset: int = 0, limit: int = 25):
+        limit = min(limit, config.max_page_size)
+        end = min(offset + limit, config.total_results)
+        data = [instagram._generate_mock_influencer(100 + index) for index in range(offset, end)]
+        paging: Dict[str, Any] = {}
+        if end < config.total_results:
+            paging["next"] = str(request.url.include_query_params(offset=end, limit=limit))
+        return {"data": data, "paging": paging}
+
+    @app.get("/{version}/insights")
+    async def instagram_insights_batch(version: str, ids: str):
+        return {user_id: instagram._generate_mock_audience_insights() for user_id in _ids(ids)}
+
+    @app.get("/{version}/hashtags")
+    async def instagram_hashtags(version: str, names: str):
+        return instagram._generate_mock_hashtag_stats(_ids(names))
+
+    @app.get("/{version}/")
+    async def instagram_profiles(version: str, ids: str):
+        return {key: instagram_profile(key) for key in _ids(ids)}
+
+    @app.get("/{version}/{node_id}")
+    async def instagram_node(version: str, node_id: str):
+        return instagram_profile(node_id)
+
+    @app.get("/{version}/{node_id}/media")
+    async def instagram_media(version: str, node_id: str, limit: int = 12):
+        return {"data": instagram._generate_mock_media(node_id, min(limit, config.max_page_size)), "paging": {}}
+
+    @app.get("/{version}/{node_id}/posts")
+    async def instagram_posts(version: str, node_id: str, limit: int = 10):
+        return {"data": instagram._generate_mock_posts(node_id, min(limit, config.max_page_size)), "paging": {}}
+
+    @app.get("/{version}/{node_id}/insights")
+    async def instagram_insights(version: str, node_id: str):
+        return {"data": instagram._generate_mock_audience_insights()}
+
+    # YouTube Data API v3
+
+    def youtube_channel(key: str) -> Dict[str, Any]:
+        channel = youtube._generate_mock_influencer(_index(key))
+        channel["id"] = key
+        return channel
+
+    @app.get("/youtube/v3/search")
+    async def youtube_search(q: str = "", maxResults: int = 5, pageToken: Optional[str] = None):
+        limit = min(maxResults, config.max_page_size)
+        offset = page_token_offset(pageToken)
+        end = min(offset + limit, config.total_results)
+        page = {
+            "kind": "youtube#searchListResponse",
+            "items": [youtube._generate_mock_influencer(200 + index) for index in range(offset, end)],
+            "pageInfo": {"totalResults": config.total_results, "resultsPerPage": limit}
+        }
+        if end < config.total_results:
+            page["nextPageToken"] = offset_page_token(end)
+        return page
+
+    @app.get("/youtube/v3/channels")
+    async def youtube_channels(id: str = Query(...)):
+        channel_ids = _ids(id)[:50]
+        return {"kind": "youtube#channelListResponse", "items": [youtube_channel(key) for key in channel_ids]}
+
+    @app.get("/youtube/v3/playlistItems")
+    async def youtube_playlist_items(playlistId: str, maxResults: int = 5):
+        return {"items": youtube._generate_mock_videos(playlistId, min(maxResults, config.max_page_size))}
+
+    @app.get("/youtube/v3/activities")
+    async def youtube_activities(channelId: str, maxResults: int = 5):
+        return {"items": youtube._generate_mock_recent_videos(channelId, min(maxResults, config.max_page_size))}
+
+    @app.get("/youtube/v3/commentThreads")
+    async def youtube_comments(videoId: str, maxResults: int = 20):
+        return {"items": youtube._generate_mock_comments(videoId, min(maxResults, 100))}
+
+    # YouTube Analytics API v2
+
+    @app.get("/youtubeanalytics/v2/reports")
+    async def youtube_reports(ids: str):
+        channel_ids = _ids(ids.split("==", 1)[-1])
+        return {"reports": {channel_id: youtube._generate_mock_channel_analytics() for channel_id in channel_ids}}
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Graph API / YouTube Data API stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="mean response latency")
+    parser.add_argument("--jitter-ms", type=float, default=20.0, help="latency standard deviation")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests failing with 503")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="fraction of requests failing with 429")
+    parser.add_argument("--tail-rate", type=float, default=0.0, help="fraction of requests with extra tail latency")
+    parser.add_argument("--tail-ms", type=float, default=1000.0, help="extra latency for tail requests")
+    parser.add_argument("--capacity", type=int, default=0, help="concurrent requests served before queueing")
+    parser.add_argument("--total-results", type=int, default=1000, help="results available to paginate through")
+    args = parser.parse_args()
+
+    config = StandinConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        total_results=args.total_results,
+        tail_rate=args.tail_rate,
+        tail_ms=args.tail_ms,
+        capacity=args.capacity
+    )
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()